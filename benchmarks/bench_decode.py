@@ -0,0 +1,52 @@
+"""Benchmark JSON decoding of FMP payloads with each available backend.
+
+Decodes every fixture in ``benchmarks/fixtures`` (or ``--fixtures DIR``) with
+each installed backend and reports the best time per payload and the speedup
+over the standard library.
+
+Usage:
+    python benchmarks/bench_decode.py [--fixtures DIR] [--repeat N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from fmp_mcp_server.decoding import BACKENDS, get_decoder
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    decoders = {}
+    for name in BACKENDS:
+        try:
+            decoders[name] = get_decoder(name)[1]
+        except ImportError:
+            print(f"{name}: not installed, skipped")  # noqa: T201
+
+    columns = " ".join(f"{name:>16}" for name in decoders)
+    print(f"{'payload':<30} {'size':>9} {columns}")  # noqa: T201
+    for path in sorted(args.fixtures.glob("*.json")):
+        payload = path.read_bytes()
+        timings = {
+            name: min(
+                timeit.repeat(lambda d=decode: d(payload), number=1, repeat=args.repeat)
+            )
+            for name, decode in decoders.items()
+        }
+        baseline = timings["json"]
+        cells = " ".join(
+            f"{t * 1e6:8.1f}us {baseline / t:5.1f}x" for t in timings.values()
+        )
+        print(f"{path.stem:<30} {len(payload):>8}B {cells}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
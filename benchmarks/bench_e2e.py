@@ -0,0 +1,314 @@
+"""End-to-end throughput benchmark of the MCP tools against a mock FMP API.
+
+Starts ``mock_fmp.py`` and, in ``http`` mode, the server with
+``--transport http``, both as subprocesses. It then opens ``--sessions``
+concurrent MCP sessions, each making ``--calls`` tool calls from a fixed mix
+over a universe of ``--symbols`` tickers. ``inprocess`` mode calls the tools
+in this process instead, without MCP framing. Reports latency percentiles,
+tool calls per second, errors, the upstream requests the mock served, and the
+server's peak RSS.
+
+Usage:
+    python benchmarks/bench_e2e.py [--mode http|inprocess] [--sessions 20]
+        [--calls 50] [--symbols 25] [--workers 1] [--latency-ms 50] ...
+
+Mock options (latency, error and throttle rates, quota) are those of
+``mock_fmp.py``.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from mock_fmp import add_arguments
+
+BENCHMARKS_DIR = Path(__file__).parent
+ToolCall = tuple[str, dict[str, Any]]
+CallTool = Callable[[str, dict[str, Any]], Awaitable[bool]]
+
+# Relative weights of the tool calls each session makes
+WORKLOAD: list[tuple[int, Callable[[random.Random, list[str]], ToolCall]]] = [
+    (30, lambda rng, universe: ("get_stock_quote", {"symbol": rng.choice(universe)})),
+    (
+        10,
+        lambda rng, universe: (
+            "get_stock_quotes",
+            {"symbols": rng.sample(universe, min(10, len(universe)))},
+        ),
+    ),
+    (
+        15,
+        lambda rng, universe: ("get_company_profile", {"symbol": rng.choice(universe)}),
+    ),
+    (
+        20,
+        lambda rng, universe: (
+            "get_financial_statements",
+            {
+                "symbol": rng.choice(universe),
+                "statement_type": rng.choice(["income", "balance", "cashflow"]),
+                "period": "quarter",
+                "limit": 8,
+            },
+        ),
+    ),
+    (15, lambda rng, universe: ("get_key_metrics", {"symbol": rng.choice(universe)})),
+    (
+        10,
+        lambda rng, universe: (
+            "get_financial_ratios",
+            {"symbol": rng.choice(universe), "format": "columnar"},
+        ),
+    ),
+]
+
+
+def free_port() -> int:
+    """An unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def wait_for(url: str, timeout: float = 30.0) -> None:
+    """Poll ``url`` until it answers."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def peak_rss_mb(pid: int | None = None) -> float | None:
+    """Peak resident set size in MiB of this process, or of ``pid`` and its
+    child processes (uvicorn workers)."""
+    if pid is None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+        children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    except OSError:
+        return None
+    total = 0.0
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            total += int(line.split()[1]) / 1024
+    for child in children:
+        total += peak_rss_mb(int(child)) or 0.0
+    return total
+
+
+async def run_session(
+    call_tool: CallTool,
+    calls: int,
+    universe: list[str],
+    seed: int,
+    latencies: list[float],
+) -> int:
+    """Make ``calls`` tool calls from the workload; return the error count."""
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in WORKLOAD]
+    errors = 0
+    for _ in range(calls):
+        (_, make_call), *_ = rng.choices(WORKLOAD, weights)
+        name, arguments = make_call(rng, universe)
+        start = time.perf_counter()
+        ok = await call_tool(name, arguments)
+        latencies.append(time.perf_counter() - start)
+        errors += not ok
+    return errors
+
+
+async def run_http(args: argparse.Namespace, universe: list[str], env: dict) -> dict:
+    """Drive a server subprocess over streamable HTTP."""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "fmp_mcp_server",
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "WARNING",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/mcp/"
+    try:
+        wait_for(f"http://127.0.0.1:{port}/")
+        latencies: list[float] = []
+
+        async def session(index: int) -> int:
+            async with streamablehttp_client(url) as (read, write, _):
+                async with ClientSession(read, write) as client:
+                    await client.initialize()
+
+                    async def call_tool(name: str, arguments: dict) -> bool:
+                        result = await client.call_tool(name, arguments)
+                        return not result.isError
+
+                    return await run_session(
+                        call_tool, args.calls, universe, args.seed + index, latencies
+                    )
+
+        start = time.perf_counter()
+        errors = await asyncio.gather(*(session(i) for i in range(args.sessions)))
+        elapsed = time.perf_counter() - start
+        return {
+            "latencies": latencies,
+            "elapsed": elapsed,
+            "errors": sum(errors),
+            "rss": peak_rss_mb(server.pid),
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def run_inprocess(
+    args: argparse.Namespace, universe: list[str], env: dict
+) -> dict:
+    """Call the tools of the server module in this process."""
+    os.environ.update(env)
+    from fmp_mcp_server import server
+
+    logging.disable(logging.INFO)
+
+    async def call_tool(name: str, arguments: dict) -> bool:
+        try:
+            await server.mcp.call_tool(name, arguments)
+        except Exception:  # noqa: BLE001
+            return False
+        return True
+
+    latencies: list[float] = []
+    async with server.client_lifespan(server.mcp):
+        start = time.perf_counter()
+        errors = await asyncio.gather(
+            *(
+                run_session(call_tool, args.calls, universe, args.seed + i, latencies)
+                for i in range(args.sessions)
+            )
+        )
+        elapsed = time.perf_counter() - start
+    return {
+        "latencies": latencies,
+        "elapsed": elapsed,
+        "errors": sum(errors),
+        "rss": peak_rss_mb(),
+    }
+
+
+def report(result: dict, stats: dict) -> None:
+    """Print the benchmark results."""
+    latencies = sorted(result["latencies"])
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    calls = len(latencies)
+    rss = f"{result['rss']:.1f} MiB" if result["rss"] else "n/a"
+    print(  # noqa: T201
+        f"tool calls       {calls} in {result['elapsed']:.2f}s "
+        f"({calls / result['elapsed']:.1f}/s), {result['errors']} errors\n"
+        f"latency ms       p50 {cuts[49] * 1e3:.1f}  p95 {cuts[94] * 1e3:.1f}  "
+        f"p99 {cuts[98] * 1e3:.1f}  max {latencies[-1] * 1e3:.1f}\n"
+        f"upstream calls   {stats['requests']} "
+        f"({stats['requests'] / calls:.2f} per tool call), "
+        f"statuses {stats['statuses']}\n"
+        f"server peak RSS  {rss}"
+    )
+    for endpoint, count in sorted(stats["endpoints"].items()):
+        print(f"  {endpoint:<28} {count:>6}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["http", "inprocess"], default="http")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--symbols", type=int, default=25)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--persistent-cache",
+        action="store_true",
+        help="use a fresh SQLite statement cache",
+    )
+    add_arguments(parser)
+    args = parser.parse_args()
+    if args.seed is None:
+        args.seed = 0
+
+    mock_port = free_port()
+    mock_args = [
+        "--port",
+        str(mock_port),
+        "--fixtures",
+        str(args.fixtures),
+        "--latency-ms",
+        str(args.latency_ms),
+        "--jitter-ms",
+        str(args.jitter_ms),
+        "--error-rate",
+        str(args.error_rate),
+        "--throttle-rate",
+        str(args.throttle_rate),
+        "--seed",
+        str(args.seed),
+    ]
+    if args.requests_per_minute:
+        mock_args += ["--requests-per-minute", str(args.requests_per_minute)]
+    mock = subprocess.Popen(
+        [sys.executable, str(BENCHMARKS_DIR / "mock_fmp.py"), *mock_args]
+    )
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    universe = [f"SYM{i:03d}" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "FMP_API_KEY": "benchmark",
+            "FMP_BASE_URL": f"{mock_url}/stable",
+        }
+        env.pop("FMP_CACHE_PATH", None)
+        if args.persistent_cache:
+            env["FMP_CACHE_PATH"] = str(Path(tmp) / "cache.db")
+        try:
+            wait_for(f"{mock_url}/__stats")
+            run = run_http if args.mode == "http" else run_inprocess
+            result = asyncio.run(run(args, universe, env))
+            stats = httpx.get(f"{mock_url}/__stats").json()
+        finally:
+            mock.terminate()
+            mock.wait()
+    report(result, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare memory held by decoded dict rows and typed records.
+
+Decodes each statement fixture into plain dicts and into slotted records and
+reports the memory retained per row, and the peak while decoding records,
+measured with tracemalloc on a payload of ``--copies`` copies of the rows.
+
+Usage:
+    python benchmarks/bench_models.py [--fixtures DIR] [--copies N]
+"""
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from fmp_mcp_server.decoding import loads
+from fmp_mcp_server.models import (
+    BalanceSheet,
+    CashFlowStatement,
+    FinancialRatios,
+    IncomeStatement,
+    KeyMetrics,
+    Record,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+MODELS: list[type[Record]] = [
+    IncomeStatement,
+    BalanceSheet,
+    CashFlowStatement,
+    KeyMetrics,
+    FinancialRatios,
+]
+
+
+def retained(build: Callable[[], list[Any]]) -> tuple[int, int, int]:
+    """Memory retained by the result of ``build``, its peak and the row count."""
+    tracemalloc.start()
+    rows = build()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak, len(rows)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--copies", type=int, default=25)
+    args = parser.parse_args()
+
+    print(  # noqa: T201
+        f"{'payload':<26} {'dict B/row':>11} {'record B/row':>13} {'ratio':>6} "
+        f"{'peak B/row':>11}"
+    )
+    for model in MODELS:
+        rows = loads((args.fixtures / f"{model.ENDPOINT}.json").read_bytes())
+        payload = json.dumps(rows * args.copies).encode()
+        model.decode(b"[]")  # Build the record decoder outside the measurement
+        dict_size, _, count = retained(lambda p=payload: loads(p))
+        record_size, record_peak, _ = retained(lambda p=payload, m=model: m.decode(p))
+        print(  # noqa: T201
+            f"{model.ENDPOINT:<26} {dict_size / count:>11.0f} "
+            f"{record_size / count:>13.0f} {dict_size / record_size:>5.1f}x "
+            f"{record_peak / count:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare serialized size and time of row and columnar tool output.
+
+Serializes each time-series fixture the way FastMCP does for tool results
+(``pydantic_core.to_json`` with an indent of 2) as a list of rows and in the
+columnar layout, and reports the bytes and best time of each.
+
+Usage:
+    python benchmarks/bench_output.py [--fixtures DIR] [--repeat N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from pydantic_core import to_json
+
+from fmp_mcp_server.decoding import loads
+from fmp_mcp_server.output import to_columnar
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+TIME_SERIES = (
+    "income-statement",
+    "balance-sheet-statement",
+    "cash-flow-statement",
+    "key-metrics",
+    "ratios",
+)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(  # noqa: T201
+        f"{'payload':<26} {'rows':>9} {'columnar':>9} {'ratio':>6} "
+        f"{'rows us':>9} {'columnar us':>12}"
+    )
+    for name in TIME_SERIES:
+        rows = loads((args.fixtures / f"{name}.json").read_bytes())
+        outputs = {"rows": rows, "columnar": to_columnar(rows)}
+        sizes = {k: len(to_json(v, indent=2)) for k, v in outputs.items()}
+        times = {
+            k: min(
+                timeit.repeat(
+                    lambda v=v: to_json(v, indent=2), number=1, repeat=args.repeat
+                )
+            )
+            for k, v in outputs.items()
+        }
+        print(  # noqa: T201
+            f"{name:<26} {sizes['rows']:>8}B {sizes['columnar']:>8}B "
+            f"{sizes['rows'] / sizes['columnar']:>5.1f}x "
+            f"{times['rows'] * 1e6:>9.1f} {times['columnar'] * 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
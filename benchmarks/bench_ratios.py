@@ -0,0 +1,90 @@
+"""Benchmark local ratio computation over a universe of symbols.
+
+Builds ``--symbols`` statement frames from the quarterly statement fixtures
+(each symbol's figures scaled by a different factor) and times computing
+ratios and key metrics for all of them with the vectorized engine, against a
+row-by-row pure Python loop over the same formulas.
+
+Requires the ``analytics`` extra (NumPy).
+
+Usage:
+    python benchmarks/bench_ratios.py [--fixtures DIR] [--symbols N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+from fmp_mcp_server.decoding import loads
+from fmp_mcp_server.frame import StatementFrame
+from fmp_mcp_server.ratio_engine import (
+    INPUT_FIELDS,
+    KEY_METRIC_FORMULAS,
+    RATIO_FORMULAS,
+    local_ratios,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+STATEMENTS = ("income-statement", "balance-sheet-statement", "cash-flow-statement")
+
+
+def build_universe(fixtures: Path, symbols: int) -> list[StatementFrame]:
+    """Joined statement frames for ``symbols`` synthetic tickers."""
+    base = None
+    for endpoint in STATEMENTS:
+        frame = StatementFrame.from_rows(
+            loads((fixtures / f"{endpoint}.json").read_bytes()), period="quarter"
+        )
+        base = frame if base is None else base.join(frame)
+    assert base is not None
+    frames = []
+    for i in range(symbols):
+        frame = StatementFrame(
+            base.dates, base.values * (1 + i / symbols), base.fields, f"SYM{i}"
+        )
+        frames.append(frame)
+    return frames
+
+
+def python_ratios(frames: list[StatementFrame], kind: str) -> dict[str, list[Any]]:
+    """Reference implementation evaluating formulas one period at a time."""
+    formulas = RATIO_FORMULAS if kind == "ratios" else KEY_METRIC_FORMULAS
+    results = {}
+    for frame in frames:
+        rows = []
+        for j in range(len(frame) - 1, -1, -1):
+            items = {name: frame.get(name)[j : j + 1] for name in INPUT_FIELDS}
+            rows.append({name: f(items)[0] for name, f in formulas.items()})
+        results[str(frame.symbol)] = rows
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--symbols", type=int, default=500)
+    args = parser.parse_args()
+
+    frames = build_universe(args.fixtures, args.symbols)
+    print(  # noqa: T201
+        f"{len(frames)} symbols x {len(frames[0])} periods\n"
+        f"{'kind':<12} {'vectorized':>11} {'per-period':>11} {'speedup':>8}"
+    )
+    for kind in ("ratios", "key-metrics"):
+        start = time.perf_counter()
+        local_ratios(frames, kind)  # type: ignore[arg-type]
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        python_ratios(frames, kind)
+        looped = time.perf_counter() - start
+        print(  # noqa: T201
+            f"{kind:<12} {vectorized * 1e3:>9.1f}ms {looped * 1e3:>9.1f}ms "
+            f"{looped / vectorized:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measure cold-start time of the server process.
+
+Stdio clients spawn a new server process per session, so import time is paid
+on every session start. This runs fresh interpreters and reports the median of:
+
+* ``--help``: parsing arguments, which imports only the CLI module
+* ``import``: importing the server module with every tool registered, and
+  the modules that contribute most to it according to ``python -X importtime``
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+SERVER_MODULE = "fmp_mcp_server.server"
+
+
+def wall_time(args: list[str]) -> float:
+    """Seconds for a fresh interpreter to run ``args``."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Self and cumulative import time in microseconds per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    # Populate bytecode caches so compilation is not measured
+    wall_time(["-c", f"import {SERVER_MODULE}"])
+
+    help_times = [
+        wall_time(["-m", "fmp_mcp_server", "--help"]) for _ in range(args.runs)
+    ]
+    import_walls = [
+        wall_time(["-c", f"import {SERVER_MODULE}"]) for _ in range(args.runs)
+    ]
+    samples: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for _ in range(args.runs):
+        for name, times in import_times(SERVER_MODULE).items():
+            samples[name].append(times)
+
+    def median(name: str, index: int) -> float:
+        return statistics.median(t[index] for t in samples[name]) / 1000
+
+    print(  # noqa: T201
+        f"fmp-mcp-server --help    {statistics.median(help_times) * 1000:8.1f} ms\n"
+        f"import {SERVER_MODULE:<18}{statistics.median(import_walls) * 1000:8.1f} ms"
+        f" (importtime: {median(SERVER_MODULE, 1):.1f} ms)\n"
+    )
+    print(f"{'module':<40} {'self ms':>8} {'cumulative ms':>14}")  # noqa: T201
+    ranked = sorted(samples, key=lambda name: median(name, 1), reverse=True)
+    shown = [name for name in ranked if name.count(".") <= 1][: args.top]
+    for name in shown:
+        print(  # noqa: T201
+            f"{name:<40} {median(name, 0):>8.1f} {median(name, 1):>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""Generate sample FMP payloads for the benchmarks.
+
+The files written to ``benchmarks/fixtures`` follow the field names and value
+types of FMP's stable API responses, with deterministic synthetic figures. Real
+responses saved from the API (one JSON file per endpoint, named after it) can
+be dropped in their place.
+
+Usage:
+    python benchmarks/make_fixtures.py
+"""
+
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SYMBOL = "AAPL"
+QUARTERS = 40
+
+RATIO_FIELDS = [
+    "grossProfitMargin", "ebitMargin", "ebitdaMargin", "operatingProfitMargin",
+    "pretaxProfitMargin", "continuousOperationsProfitMargin", "netProfitMargin",
+    "bottomLineProfitMargin", "receivablesTurnover", "payablesTurnover",
+    "inventoryTurnover", "fixedAssetTurnover", "assetTurnover", "currentRatio",
+    "quickRatio", "solvencyRatio", "cashRatio", "priceToEarningsRatio",
+    "priceToEarningsGrowthRatio", "forwardPriceToEarningsGrowthRatio",
+    "priceToBookRatio", "priceToSalesRatio", "priceToFreeCashFlowRatio",
+    "priceToOperatingCashFlowRatio", "debtToAssetsRatio", "debtToEquityRatio",
+    "debtToCapitalRatio", "longTermDebtToCapitalRatio", "financialLeverageRatio",
+    "workingCapitalTurnoverRatio", "operatingCashFlowRatio",
+    "operatingCashFlowSalesRatio", "freeCashFlowOperatingCashFlowRatio",
+    "debtServiceCoverageRatio", "interestCoverageRatio",
+    "shortTermOperatingCashFlowCoverageRatio", "operatingCashFlowCoverageRatio",
+    "capitalExpenditureCoverageRatio", "dividendPaidAndCapexCoverageRatio",
+    "dividendPayoutRatio", "dividendYield", "dividendYieldPercentage",
+    "revenuePerShare", "netIncomePerShare", "interestDebtPerShare", "cashPerShare",
+    "bookValuePerShare", "tangibleBookValuePerShare", "shareholdersEquityPerShare",
+    "operatingCashFlowPerShare", "capexPerShare", "freeCashFlowPerShare",
+    "netIncomePerEBT", "ebtPerEbit", "priceToFairValue", "debtToMarketCap",
+    "effectiveTaxRate", "enterpriseValueMultiple", "dividendPerShare",
+]  # fmt: skip
+
+KEY_METRIC_FIELDS = [
+    "marketCap", "enterpriseValue", "evToSales", "evToOperatingCashFlow",
+    "evToFreeCashFlow", "evToEBITDA", "netDebtToEBITDA", "currentRatio",
+    "incomeQuality", "grahamNumber", "grahamNetNet", "taxBurden", "interestBurden",
+    "workingCapital", "investedCapital", "returnOnAssets", "operatingReturnOnAssets",
+    "returnOnTangibleAssets", "returnOnEquity", "returnOnInvestedCapital",
+    "returnOnCapitalEmployed", "earningsYield", "freeCashFlowYield",
+    "capexToOperatingCashFlow", "capexToDepreciation", "capexToRevenue",
+    "salesGeneralAndAdministrativeToRevenue", "researchAndDevelopementToRevenue",
+    "stockBasedCompensationToRevenue", "intangiblesToTotalAssets",
+    "averageReceivables", "averagePayables", "averageInventory",
+    "daysOfSalesOutstanding", "daysOfPayablesOutstanding",
+    "daysOfInventoryOutstanding", "operatingCycle", "cashConversionCycle",
+    "freeCashFlowToEquity", "freeCashFlowToFirm", "tangibleAssetValue",
+    "netCurrentAssetValue",
+]  # fmt: skip
+
+
+def quarter_ends(count: int) -> list[date]:
+    """Fiscal quarter end dates, newest first."""
+    ends = []
+    year, quarter = 2025, 2
+    for _ in range(count):
+        month = quarter * 3
+        first_of_next = date(year + month // 12, month % 12 + 1, 1)
+        ends.append(first_of_next - timedelta(days=1))
+        quarter -= 1
+        if quarter == 0:
+            year, quarter = year - 1, 4
+    return ends
+
+
+def header(end: date, fiscal_quarter: int) -> dict[str, Any]:
+    """Fields shared by every statement row."""
+    return {
+        "date": end.isoformat(),
+        "symbol": SYMBOL,
+        "reportedCurrency": "USD",
+        "cik": "0000320193",
+        "filingDate": (end + timedelta(days=35)).isoformat(),
+        "acceptedDate": f"{(end + timedelta(days=34)).isoformat()} 18:04:43",
+        "fiscalYear": str(end.year),
+        "period": f"Q{fiscal_quarter}",
+    }
+
+
+def statements(rng: random.Random) -> dict[str, list[dict[str, Any]]]:
+    """Internally consistent income, balance sheet and cash flow rows."""
+    income, balance, cash_flow = [], [], []
+    ends = quarter_ends(QUARTERS)
+    for i, end in enumerate(ends):
+        fiscal_quarter = end.month // 3
+        scale = 0.985**i
+        revenue = round(95e9 * scale * rng.uniform(0.9, 1.15))
+        cost = round(revenue * rng.uniform(0.53, 0.6))
+        gross = revenue - cost
+        rnd = round(revenue * 0.08)
+        sga = round(revenue * 0.065)
+        opex = rnd + sga
+        operating = gross - opex
+        interest_income = round(rng.uniform(0.5e9, 1e9))
+        interest_expense = round(rng.uniform(0.2e9, 1e9))
+        other = round(rng.uniform(-3e8, 3e8))
+        pretax = operating + interest_income - interest_expense + other
+        tax = round(pretax * rng.uniform(0.14, 0.18))
+        net = pretax - tax
+        dna = round(revenue * 0.03)
+        shares = round(15.2e9 * (1.006**i))
+        income.append(
+            header(end, fiscal_quarter)
+            | {
+                "revenue": revenue,
+                "costOfRevenue": cost,
+                "grossProfit": gross,
+                "researchAndDevelopmentExpenses": rnd,
+                "generalAndAdministrativeExpenses": 0,
+                "sellingAndMarketingExpenses": 0,
+                "sellingGeneralAndAdministrativeExpenses": sga,
+                "otherExpenses": 0,
+                "operatingExpenses": opex,
+                "costAndExpenses": cost + opex,
+                "netInterestIncome": interest_income - interest_expense,
+                "interestIncome": interest_income,
+                "interestExpense": interest_expense,
+                "depreciationAndAmortization": dna,
+                "ebitda": operating + dna,
+                "ebit": operating,
+                "nonOperatingIncomeExcludingInterest": other,
+                "operatingIncome": operating,
+                "totalOtherIncomeExpensesNet": pretax - operating,
+                "incomeBeforeTax": pretax,
+                "incomeTaxExpense": tax,
+                "netIncomeFromContinuingOperations": net,
+                "netIncomeFromDiscontinuedOperations": 0,
+                "otherAdjustmentsToNetIncome": 0,
+                "netIncome": net,
+                "netIncomeDeductions": 0,
+                "bottomLineNetIncome": net,
+                "eps": round(net / shares, 2),
+                "epsDiluted": round(net / (shares * 1.004), 2),
+                "weightedAverageShsOut": shares,
+                "weightedAverageShsOutDil": round(shares * 1.004),
+            }
+        )
+
+        cash = round(rng.uniform(25e9, 40e9))
+        short_inv = round(rng.uniform(20e9, 35e9))
+        receivables = round(revenue * rng.uniform(0.25, 0.35))
+        inventory = round(rng.uniform(5e9, 7.5e9))
+        other_current = round(rng.uniform(10e9, 15e9))
+        current_assets = cash + short_inv + receivables + inventory + other_current
+        ppe = round(rng.uniform(40e9, 46e9))
+        long_inv = round(rng.uniform(90e9, 110e9))
+        other_non_current = round(rng.uniform(60e9, 75e9))
+        non_current = ppe + long_inv + other_non_current
+        total_assets = current_assets + non_current
+        payables = round(cost * rng.uniform(1.0, 1.3))
+        short_debt = round(rng.uniform(10e9, 20e9))
+        deferred = round(rng.uniform(7e9, 9e9))
+        other_cl = round(rng.uniform(50e9, 65e9))
+        current_liabilities = payables + short_debt + deferred + other_cl
+        long_debt = round(rng.uniform(85e9, 100e9))
+        other_ncl = round(rng.uniform(40e9, 50e9))
+        total_liabilities = current_liabilities + long_debt + other_ncl
+        equity = total_assets - total_liabilities
+        balance.append(
+            header(end, fiscal_quarter)
+            | {
+                "cashAndCashEquivalents": cash,
+                "shortTermInvestments": short_inv,
+                "cashAndShortTermInvestments": cash + short_inv,
+                "netReceivables": receivables,
+                "accountsReceivables": round(receivables * 0.45),
+                "otherReceivables": receivables - round(receivables * 0.45),
+                "inventory": inventory,
+                "prepaids": 0,
+                "otherCurrentAssets": other_current,
+                "totalCurrentAssets": current_assets,
+                "propertyPlantEquipmentNet": ppe,
+                "goodwill": 0,
+                "intangibleAssets": 0,
+                "goodwillAndIntangibleAssets": 0,
+                "longTermInvestments": long_inv,
+                "taxAssets": 0,
+                "otherNonCurrentAssets": other_non_current,
+                "totalNonCurrentAssets": non_current,
+                "otherAssets": 0,
+                "totalAssets": total_assets,
+                "totalPayables": payables,
+                "accountPayables": payables,
+                "otherPayables": 0,
+                "accruedExpenses": 0,
+                "shortTermDebt": short_debt,
+                "capitalLeaseObligationsCurrent": 0,
+                "taxPayables": 0,
+                "deferredRevenue": deferred,
+                "otherCurrentLiabilities": other_cl,
+                "totalCurrentLiabilities": current_liabilities,
+                "longTermDebt": long_debt,
+                "deferredRevenueNonCurrent": 0,
+                "deferredTaxLiabilitiesNonCurrent": 0,
+                "otherNonCurrentLiabilities": other_ncl,
+                "totalNonCurrentLiabilities": long_debt + other_ncl,
+                "otherLiabilities": 0,
+                "capitalLeaseObligations": 0,
+                "totalLiabilities": total_liabilities,
+                "treasuryStock": 0,
+                "preferredStock": 0,
+                "commonStock": round(rng.uniform(70e9, 85e9)),
+                "retainedEarnings": round(equity * rng.uniform(-0.3, 0.3)),
+                "additionalPaidInCapital": 0,
+                "accumulatedOtherComprehensiveIncomeLoss": round(
+                    rng.uniform(-12e9, -5e9)
+                ),
+                "otherTotalStockholdersEquity": 0,
+                "totalStockholdersEquity": equity,
+                "totalEquity": equity,
+                "minorityInterest": 0,
+                "totalLiabilitiesAndTotalEquity": total_assets,
+                "totalInvestments": short_inv + long_inv,
+                "totalDebt": short_debt + long_debt,
+                "netDebt": short_debt + long_debt - cash,
+            }
+        )
+
+        sbc = round(revenue * 0.03)
+        working_capital = round(rng.uniform(-6e9, 6e9))
+        operating_cf = net + dna + sbc + working_capital
+        capex = -round(revenue * rng.uniform(0.025, 0.035))
+        investing = capex + round(rng.uniform(-5e9, 8e9))
+        buybacks = -round(rng.uniform(18e9, 26e9))
+        dividends = -round(rng.uniform(3.5e9, 4e9))
+        debt_issuance = round(rng.uniform(-4e9, 3e9))
+        financing = buybacks + dividends + debt_issuance
+        change = operating_cf + investing + financing
+        cash_flow.append(
+            header(end, fiscal_quarter)
+            | {
+                "netIncome": net,
+                "depreciationAndAmortization": dna,
+                "deferredIncomeTax": 0,
+                "stockBasedCompensation": sbc,
+                "changeInWorkingCapital": working_capital,
+                "accountsReceivables": round(working_capital * 0.4),
+                "inventory": round(working_capital * 0.1),
+                "accountsPayables": round(working_capital * 0.3),
+                "otherWorkingCapital": working_capital - round(working_capital * 0.8),
+                "otherNonCashItems": 0,
+                "netCashProvidedByOperatingActivities": operating_cf,
+                "investmentsInPropertyPlantAndEquipment": capex,
+                "acquisitionsNet": 0,
+                "purchasesOfInvestments": -round(rng.uniform(5e9, 15e9)),
+                "salesMaturitiesOfInvestments": round(rng.uniform(5e9, 15e9)),
+                "otherInvestingActivities": 0,
+                "netCashProvidedByInvestingActivities": investing,
+                "netDebtIssuance": debt_issuance,
+                "longTermNetDebtIssuance": debt_issuance,
+                "shortTermNetDebtIssuance": 0,
+                "netStockIssuance": buybacks,
+                "netCommonStockIssuance": buybacks,
+                "commonStockIssuance": 0,
+                "commonStockRepurchased": buybacks,
+                "netPreferredStockIssuance": 0,
+                "netDividendsPaid": dividends,
+                "commonDividendsPaid": dividends,
+                "preferredDividendsPaid": 0,
+                "otherFinancingActivities": 0,
+                "netCashProvidedByFinancingActivities": financing,
+                "effectOfForexChangesOnCash": 0,
+                "netChangeInCash": change,
+                "cashAtEndOfPeriod": cash,
+                "cashAtBeginningOfPeriod": cash - change,
+                "operatingCashFlow": operating_cf,
+                "capitalExpenditure": capex,
+                "freeCashFlow": operating_cf + capex,
+                "incomeTaxesPaid": round(tax * 0.9),
+                "interestPaid": 0,
+            }
+        )
+    return {
+        "income-statement": income,
+        "balance-sheet-statement": balance,
+        "cash-flow-statement": cash_flow,
+    }
+
+
+def metric_rows(rng: random.Random, fields: list[str]) -> list[dict[str, Any]]:
+    """Rows of floating point metrics for each quarter."""
+    rows = []
+    for end in quarter_ends(QUARTERS):
+        row: dict[str, Any] = {
+            "symbol": SYMBOL,
+            "date": end.isoformat(),
+            "fiscalYear": str(end.year),
+            "period": f"Q{end.month // 3}",
+            "reportedCurrency": "USD",
+        }
+        row.update((field, rng.uniform(-2, 50)) for field in fields)
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    """Write all fixture files."""
+    rng = random.Random(20240601)
+    payloads: dict[str, Any] = statements(rng)
+    payloads["ratios"] = metric_rows(rng, RATIO_FIELDS)
+    payloads["key-metrics"] = metric_rows(rng, KEY_METRIC_FIELDS)
+    payloads["quote"] = [
+        {
+            "symbol": SYMBOL,
+            "name": "Apple Inc.",
+            "price": 227.52,
+            "changePercentage": 0.81,
+            "change": 1.83,
+            "volume": 45112013,
+            "dayLow": 225.71,
+            "dayHigh": 228.12,
+            "yearHigh": 260.1,
+            "yearLow": 164.08,
+            "marketCap": 3379183064000,
+            "priceAvg50": 218.4,
+            "priceAvg200": 221.6,
+            "exchange": "NASDAQ",
+            "open": 226.2,
+            "previousClose": 225.69,
+            "timestamp": 1748980800,
+        }
+    ]
+    payloads["profile"] = [
+        {
+            "symbol": SYMBOL,
+            "price": 227.52,
+            "marketCap": 3379183064000,
+            "beta": 1.2,
+            "lastDividend": 1.02,
+            "range": "164.08-260.1",
+            "change": 1.83,
+            "changePercentage": 0.81,
+            "volume": 45112013,
+            "averageVolume": 61236750,
+            "companyName": "Apple Inc.",
+            "currency": "USD",
+            "cik": "0000320193",
+            "isin": "US0378331005",
+            "cusip": "037833100",
+            "exchangeFullName": "NASDAQ Global Select",
+            "exchange": "NASDAQ",
+            "industry": "Consumer Electronics",
+            "website": "https://www.apple.com",
+            "description": (
+                "Apple Inc. designs, manufactures, and markets smartphones, personal "
+                "computers, tablets, wearables, and accessories worldwide."
+            ),
+            "ceo": "Timothy D. Cook",
+            "sector": "Technology",
+            "country": "US",
+            "fullTimeEmployees": "164000",
+            "phone": "(408) 996-1010",
+            "address": "One Apple Park Way",
+            "city": "Cupertino",
+            "state": "CA",
+            "zip": "95014",
+            "image": "https://images.financialmodelingprep.com/symbol/AAPL.png",
+            "ipoDate": "1980-12-12",
+            "defaultImage": False,
+            "isEtf": False,
+            "isActivelyTrading": True,
+            "isAdr": False,
+            "isFund": False,
+        }
+    ]
+
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for endpoint, payload in payloads.items():
+        path = FIXTURES_DIR / f"{endpoint}.json"
+        path.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"wrote {path}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
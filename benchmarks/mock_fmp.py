@@ -0,0 +1,193 @@
+"""Local stand-in for the FMP API serving the benchmark fixtures.
+
+Every ``GET /stable/<endpoint>`` answers with ``fixtures/<endpoint>.json``
+(an empty list when there is no such fixture), with the ``symbol`` of each row
+set to the requested one and rows cut to ``limit``. ``batch-quote`` returns one
+quote per requested symbol. Latency, server errors and throttling are
+configurable, and ``GET /__stats`` reports the requests served per endpoint
+(``POST /__reset`` clears them).
+
+Usage:
+    python benchmarks/mock_fmp.py [--port 8900] [--latency-ms 50] [--jitter-ms 20]
+        [--error-rate 0.01] [--throttle-rate 0.01] [--requests-per-minute 300]
+
+Then point the server at it with ``FMP_BASE_URL=http://127.0.0.1:8900/stable``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@dataclass
+class MockSettings:
+    """Behavior of the mock FMP server."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    requests_per_minute: float | None = None
+    retry_after: int = 1
+    seed: int | None = None
+
+
+@dataclass
+class MockState:
+    """Fixtures and counters of a running mock server."""
+
+    fixtures: dict[str, list[dict[str, Any]]]
+    settings: MockSettings
+    rng: random.Random
+    served: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+    window: list[float] = field(default_factory=list)
+
+    def throttled(self) -> bool:
+        """Whether the next request goes over the quota or is throttled at random."""
+        if self.rng.random() < self.settings.throttle_rate:
+            return True
+        limit = self.settings.requests_per_minute
+        if limit is None:
+            return False
+        now = time.monotonic()
+        self.window = [t for t in self.window if now - t < 60.0]
+        if len(self.window) >= limit:
+            return True
+        self.window.append(now)
+        return False
+
+
+def load_fixtures(directory: Path) -> dict[str, list[dict[str, Any]]]:
+    """Load each ``<endpoint>.json`` fixture as a list of rows."""
+    fixtures = {}
+    for path in directory.glob("*.json"):
+        data = json.loads(path.read_bytes())
+        fixtures[path.stem] = data if isinstance(data, list) else [data]
+    return fixtures
+
+
+def render(state: MockState, endpoint: str, params: dict[str, str]) -> list[dict]:
+    """Build the response rows of an endpoint for the request parameters."""
+    rows = state.fixtures.get(endpoint, [])
+    if endpoint == "batch-quote":
+        template = state.fixtures.get("quote", [{}])[0]
+        symbols = [s for s in params.get("symbols", "").split(",") if s]
+        return [{**template, "symbol": symbol.upper()} for symbol in symbols]
+    if "limit" in params:
+        rows = rows[: int(params["limit"])]
+    if "symbol" in params:
+        symbol = params["symbol"].upper()
+        rows = [{**row, "symbol": symbol} for row in rows]
+    return rows
+
+
+def create_app(
+    fixtures_dir: Path = FIXTURES_DIR,
+    settings: MockSettings | None = None,
+) -> Starlette:
+    """Build the mock FMP ASGI app."""
+    settings = settings or MockSettings()
+    state = MockState(
+        load_fixtures(fixtures_dir), settings, random.Random(settings.seed)
+    )
+
+    async def api(request: Request) -> Response:
+        if request.method == "HEAD":
+            return Response()
+        endpoint = request.path_params["endpoint"]
+        state.served[endpoint] += 1
+        delay = settings.latency + state.rng.uniform(0, settings.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if state.throttled():
+            status, headers = 429, {"Retry-After": str(settings.retry_after)}
+            body: Any = {"Error Message": "Limit Reach"}
+        elif state.rng.random() < settings.error_rate:
+            status, headers, body = 500, {}, {"Error Message": "Internal error"}
+        else:
+            status, headers = 200, {}
+            body = render(state, endpoint, dict(request.query_params))
+        state.statuses[status] += 1
+        return JSONResponse(body, status, headers)
+
+    async def stats(request: Request) -> Response:
+        return JSONResponse(
+            {
+                "requests": sum(state.served.values()),
+                "endpoints": dict(state.served),
+                "statuses": {str(k): v for k, v in state.statuses.items()},
+            }
+        )
+
+    async def reset(request: Request) -> Response:
+        state.served.clear()
+        state.statuses.clear()
+        state.window.clear()
+        return Response(status_code=204)
+
+    async def root(request: Request) -> Response:
+        return Response()
+
+    return Starlette(
+        routes=[
+            Route("/__stats", stats),
+            Route("/__reset", reset, methods=["POST"]),
+            Route("/stable/{endpoint}", api, methods=["GET", "HEAD"]),
+            Route("/stable/", root, methods=["GET", "HEAD"]),
+        ]
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the mock server's behavior options to a parser."""
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--requests-per-minute", type=float)
+    parser.add_argument("--seed", type=int)
+
+
+def settings_from_args(args: argparse.Namespace) -> MockSettings:
+    """Build mock settings from parsed ``add_arguments`` options."""
+    return MockSettings(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        requests_per_minute=args.requests_per_minute,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    """Serve the mock FMP API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    app = create_app(args.fixtures, settings_from_args(args))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Run the server with ``python -m fmp_mcp_server``."""
+
+from .cli import main
+
+main()
@@ -0,0 +1,93 @@
+"""HTTP deployment of the MCP server, shared by many agents.
+
+The streamable HTTP transport serves ``/mcp`` and the SSE transport serves
+``/sse``. The app holds a reference to the shared FMPClient from startup to
+shutdown, so its connection pool and caches outlive individual sessions.
+
+With several workers, sessions are stateless so any worker can answer any
+request. The workers share the SQLite statement cache, and each one gets an
+equal share of the configured rate limits.
+"""
+
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Literal
+
+import uvicorn
+from starlette.applications import Starlette
+
+from .server import client_lifespan, mcp
+
+Transport = Literal["http", "sse"]
+
+logger = logging.getLogger(__name__)
+
+
+def create_app(transport: Transport = "http") -> Starlette:
+    """Build the ASGI app for the streamable HTTP or SSE transport."""
+    app = mcp.streamable_http_app() if transport == "http" else mcp.sse_app()
+    transport_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with client_lifespan(mcp), transport_lifespan(app):
+            yield
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def create_http_app() -> Starlette:
+    """App factory for uvicorn workers."""
+    return create_app("http")
+
+
+def default_cache_path() -> Path:
+    """Statement cache shared by workers when FMP_CACHE_PATH is unset."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "fmp-mcp-server" / "cache.db"
+
+
+def serve(
+    transport: Transport = "http",
+    host: str | None = None,
+    port: int | None = None,
+    workers: int = 1,
+) -> None:
+    """Serve the MCP server over HTTP until interrupted.
+
+    Args:
+        transport: "http" for streamable HTTP, "sse" for server-sent events
+        host: Interface to bind (defaults to FASTMCP_HOST, then 127.0.0.1)
+        port: Port to bind (defaults to FASTMCP_PORT, then 8000)
+        workers: Worker processes; more than one requires the http transport
+
+    Raises:
+        ValueError: If several workers are requested for the sse transport
+    """
+    host = host or mcp.settings.host
+    port = port or mcp.settings.port
+    if workers <= 1:
+        uvicorn.run(create_app(transport), host=host, port=port)
+        return
+
+    if transport != "http":
+        raise ValueError("SSE sessions live in one process; use --transport http")
+    # Worker processes import the server afresh and read these on startup
+    os.environ["FASTMCP_STATELESS_HTTP"] = "true"
+    os.environ["FMP_WORKERS"] = str(workers)
+    cache_path = Path(
+        os.environ.setdefault("FMP_CACHE_PATH", str(default_cache_path())),
+    )
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("Starting %d workers sharing cache %s", workers, cache_path)
+    uvicorn.run(
+        f"{__name__}:create_http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+    )
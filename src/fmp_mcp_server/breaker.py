@@ -0,0 +1,211 @@
+"""Circuit breakers that stop calling FMP endpoints while they are failing."""
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+import httpx
+
+State = Literal["closed", "open", "half_open"]
+
+logger = logging.getLogger(__name__)
+
+# Endpoints that share a breaker, since they fail together upstream
+ENDPOINT_FAMILIES: dict[str, str] = {
+    "quote": "quotes",
+    "batch-quote": "quotes",
+    "market-capitalization": "quotes",
+    "profile": "company",
+    "search-symbol": "company",
+    "income-statement": "statements",
+    "balance-sheet-statement": "statements",
+    "cash-flow-statement": "statements",
+    "key-metrics": "metrics",
+    "ratios": "metrics",
+    "financial-scores": "metrics",
+    "discounted-cash-flow": "metrics",
+    "sector-performance": "market",
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint family whose circuit is open."""
+
+    def __init__(self, family: str, retry_in: float):
+        super().__init__(
+            f"FMP {family} endpoints are failing; not retrying for {retry_in:.0f}s",
+        )
+        self.family = family
+        self.retry_in = retry_in
+
+
+def is_failure(error: Exception) -> bool:
+    """Whether an error means FMP is degraded, as opposed to a bad request.
+
+    Connection failures, timeouts and 5xx responses count; 4xx responses,
+    including throttling, do not.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+    return isinstance(error, httpx.TransportError)
+
+
+@dataclass
+class BreakerStats:
+    """Counters describing a circuit breaker."""
+
+    state: State = "closed"
+    consecutive_failures: int = 0
+    opened: int = 0
+    rejected: int = 0
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint family.
+
+    After ``failure_threshold`` failures in a row, counting successes slower
+    than ``slow_call`` seconds as failures, the circuit opens and calls are
+    rejected for ``reset_timeout`` seconds. Then it is half-open: one trial
+    call goes through, closing the circuit if it succeeds in time and opening
+    it again otherwise.
+    """
+
+    def __init__(
+        self,
+        family: str,
+        failure_threshold: int = 5,
+        slow_call: float | None = 10.0,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            family: Name of the endpoint family, used in errors
+            failure_threshold: Consecutive failures that open the circuit
+            slow_call: Latency SLO in seconds, or None to only count errors
+            reset_timeout: Seconds the circuit stays open before a trial call
+            clock: Monotonic time source
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.slow_call = slow_call
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._stats = BreakerStats()
+
+    @property
+    def state(self) -> State:
+        """Current state, moving from open to half-open once the timeout ends."""
+        if (
+            self._stats.state == "open"
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._stats.state = "half_open"
+            self._trial_in_flight = False
+        return self._stats.state
+
+    def before_call(self) -> None:
+        """Admit a call, or reject it while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                trial call still in flight
+        """
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+
+        self._stats.rejected += 1
+        retry_in = max(self.reset_timeout - (self._clock() - self._opened_at), 0.0)
+        raise CircuitOpenError(self.family, retry_in)
+
+    def record_success(self, elapsed: float) -> None:
+        """Record a completed call, a failure if it broke the latency SLO."""
+        if self.slow_call is not None and elapsed > self.slow_call:
+            self.record_failure()
+            return
+        self._stats.consecutive_failures = 0
+        self._trial_in_flight = False
+        self._stats.state = "closed"
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit past the threshold."""
+        self._stats.consecutive_failures += 1
+        self._trial_in_flight = False
+        if (
+            self._stats.state == "half_open"
+            or self._stats.consecutive_failures >= self.failure_threshold
+        ):
+            if self._stats.state != "open":
+                self._stats.opened += 1
+                logger.warning(
+                    "Circuit for FMP %s endpoints opened after %d failures",
+                    self.family,
+                    self._stats.consecutive_failures,
+                )
+            self._stats.state = "open"
+            self._opened_at = self._clock()
+
+    def record_error(self, error: Exception, elapsed: float) -> None:
+        """Record a call that raised, as a failure only if FMP is degraded."""
+        if is_failure(error):
+            self.record_failure()
+        else:
+            self.record_success(elapsed)
+
+    def release(self) -> None:
+        """Give back an admitted call that ended without an outcome."""
+        self._trial_in_flight = False
+
+    def stats(self) -> BreakerStats:
+        """Get a snapshot of the breaker counters."""
+        return BreakerStats(**{**vars(self._stats), "state": self.state})
+
+
+class CircuitBreakers:
+    """One circuit breaker per endpoint family, created on first use."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        slow_call: float | None = 10.0,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breakers; arguments are passed to each CircuitBreaker."""
+        self.failure_threshold = failure_threshold
+        self.slow_call = slow_call
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        """Get the breaker of an endpoint's family."""
+        endpoint = endpoint.strip("/")
+        family = ENDPOINT_FAMILIES.get(endpoint, endpoint)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                family,
+                self.failure_threshold,
+                self.slow_call,
+                self.reset_timeout,
+                self._clock,
+            )
+            self._breakers[family] = breaker
+        return breaker
+
+    def stats(self) -> dict[str, BreakerStats]:
+        """Get a snapshot of the counters of every breaker used so far."""
+        return {family: b.stats() for family, b in self._breakers.items()}
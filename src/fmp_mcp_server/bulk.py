@@ -0,0 +1,158 @@
+"""Fetch several datasets for many symbols in one call."""
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, Literal
+
+from .output import project
+
+if TYPE_CHECKING:
+    from .client import FMPClient
+
+Dataset = Literal[
+    "profile",
+    "quote",
+    "income",
+    "balance",
+    "cashflow",
+    "key_metrics",
+    "ratios",
+    "dcf",
+    "scores",
+]
+ProgressCallback = Callable[[int, int, str], Awaitable[None]]
+
+# FMPClient methods per dataset, taking (symbol, period, limit)
+PERIODIC_DATASETS = {
+    "income": "get_income_statement",
+    "balance": "get_balance_sheet",
+    "cashflow": "get_cash_flow",
+    "key_metrics": "get_key_metrics",
+    "ratios": "get_financial_ratios",
+}
+# FMPClient methods per dataset, taking (symbol); quotes are fetched in batches
+SNAPSHOT_DATASETS = {
+    "profile": "get_company_profile",
+    "dcf": "get_dcf_valuation",
+    "scores": "get_financial_score",
+}
+# Datasets with one row per symbol, returned as an object instead of a list
+SINGLE_ROW = frozenset({"profile", "quote", "dcf", "scores"})
+
+DEFAULT_CONCURRENCY = 8
+MAX_SYMBOLS = 100
+
+
+def _compact(rows: Any, single: bool, fields: Sequence[str] | None) -> Any:
+    """Project rows and drop null fields and the symbol already used as the key."""
+    if not isinstance(rows, list):
+        rows = [rows]
+    rows = project([row for row in rows if isinstance(row, dict)], fields)
+    compacted = [
+        {k: v for k, v in row.items() if v is not None and k != "symbol"}
+        for row in rows
+    ]
+    if single:
+        return compacted[0] if compacted else None
+    return compacted
+
+
+async def fetch_bulk(  # noqa: PLR0913
+    client: "FMPClient",
+    symbols: Sequence[str],
+    datasets: Sequence[str],
+    period: str = "annual",
+    limit: int = 5,
+    concurrency: int | None = None,
+    on_progress: ProgressCallback | None = None,
+    fields: Sequence[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Fetch datasets for many symbols with bounded concurrency.
+
+    Quotes for all symbols are fetched with batched requests; other datasets
+    are fetched per symbol, with at most ``concurrency`` symbols in flight.
+    A failed dataset is reported under the symbol's ``errors`` instead of
+    failing the whole call.
+
+    Args:
+        client: FMP client
+        symbols: Ticker symbols, deduplicated case-insensitively
+        datasets: Names from ``Dataset``
+        period: Reporting period of statement datasets
+        limit: Number of periods of statement datasets
+        concurrency: Symbols fetched at once (defaults to
+            ``FMP_BULK_CONCURRENCY`` or 8)
+        on_progress: Awaited with (completed, total, symbol) as each symbol
+            completes
+        fields: Keys to keep in the rows of every dataset
+
+    Returns:
+        Compact datasets per symbol, in input order
+
+    Raises:
+        ValueError: If there are too many symbols or an unknown dataset
+    """
+    unique = list(dict.fromkeys(s.upper() for s in symbols))
+    if len(unique) > MAX_SYMBOLS:
+        raise ValueError(f"At most {MAX_SYMBOLS} symbols per call, got {len(unique)}")
+    unknown = set(datasets) - {*PERIODIC_DATASETS, *SNAPSHOT_DATASETS, "quote"}
+    if unknown:
+        raise ValueError(f"Unknown datasets: {', '.join(sorted(unknown))}")
+    names = [name for name in dict.fromkeys(datasets) if name != "quote"]
+
+    if concurrency is None:
+        concurrency = int(os.getenv("FMP_BULK_CONCURRENCY", str(DEFAULT_CONCURRENCY)))
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    completed = 0
+
+    async def fetch(name: str, symbol: str) -> Any:
+        if name in PERIODIC_DATASETS:
+            method = getattr(client, PERIODIC_DATASETS[name])
+            return await method(symbol, period, limit)
+        return await getattr(client, SNAPSHOT_DATASETS[name])(symbol)
+
+    async def fetch_symbol(symbol: str) -> dict[str, Any]:
+        nonlocal completed
+        async with semaphore:
+            results = await asyncio.gather(
+                *(fetch(name, symbol) for name in names),
+                return_exceptions=True,
+            )
+        entry: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, Exception):
+                errors[name] = str(result) or type(result).__name__
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                entry[name] = _compact(result, name in SINGLE_ROW, fields)
+        if errors:
+            entry["errors"] = errors
+        completed += 1
+        if on_progress is not None:
+            await on_progress(completed, len(unique), symbol)
+        return entry
+
+    async def fetch_quotes() -> dict[str, Any] | str:
+        if "quote" not in datasets:
+            return {}
+        try:
+            quotes = await client.get_quotes(unique)
+        except Exception as exc:
+            return str(exc) or type(exc).__name__
+        return {str(q.get("symbol")).upper(): _compact(q, True, fields) for q in quotes}
+
+    entries, quotes = await asyncio.gather(
+        asyncio.gather(*(fetch_symbol(symbol) for symbol in unique)),
+        fetch_quotes(),
+    )
+    results = dict(zip(unique, entries, strict=True))
+    if "quote" in datasets:
+        for symbol, entry in results.items():
+            if isinstance(quotes, str):
+                entry.setdefault("errors", {})["quote"] = quotes
+            else:
+                entry["quote"] = quotes.get(symbol)
+    return results
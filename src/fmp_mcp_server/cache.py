@@ -0,0 +1,206 @@
+"""In-memory response cache for the FMP client."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Time-to-live per FMP endpoint, in seconds
+DEFAULT_TTLS: dict[str, float] = {
+    "quote": 15.0,
+    "batch-quote": 15.0,
+    "market-capitalization": MINUTE,
+    "sector-performance": 5 * MINUTE,
+    "search-symbol": HOUR,
+    "profile": 6 * HOUR,
+    "discounted-cash-flow": 6 * HOUR,
+    "financial-scores": DAY,
+    "key-metrics": DAY,
+    "ratios": DAY,
+    "income-statement": 3 * DAY,
+    "balance-sheet-statement": 3 * DAY,
+    "cash-flow-statement": 3 * DAY,
+}
+
+DEFAULT_TTL = MINUTE
+
+# How long past its TTL a response may still be served while it is refreshed
+# in the background (stale-while-revalidate), per FMP endpoint, in seconds
+DEFAULT_STALE_TTLS: dict[str, float] = {
+    "quote": 5 * MINUTE,
+    "batch-quote": 5 * MINUTE,
+    "profile": 7 * DAY,
+}
+
+# Returned by ResponseCache.get when there is no usable entry
+MISSING: Any = object()
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    stale_hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served fresh from the cache."""
+        total = self.hits + self.misses + self.stale_hits
+        return self.hits / total if total else 0.0
+
+
+class _Entry(NamedTuple):
+    stored_at: float
+    expires_at: float
+    stale_until: float
+    value: Any
+
+
+class ResponseCache:
+    """Bounded LRU cache with per-endpoint time-to-live.
+
+    Endpoints with a stale TTL keep their responses that long past the TTL, for
+    ``get_stale`` to serve while they are being refreshed. Expired responses
+    stay until evicted, for ``peek`` to fall back on while FMP is unavailable.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+        stale_ttls: dict[str, float] | None = None,
+    ):
+        """Initialize response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses before LRU eviction
+            ttls: Per-endpoint TTL overrides in seconds (0 disables caching)
+            default_ttl: TTL for endpoints without an explicit entry
+            clock: Monotonic time source
+            stale_ttls: Per-endpoint stale TTL overrides in seconds (0 disables
+                serving stale responses)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.stale_ttls = {**DEFAULT_STALE_TTLS, **(stale_ttls or {})}
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any] | None = None) -> CacheKey:
+        """Build a cache key from an endpoint and its query parameters.
+
+        The API key is excluded and parameter order does not matter.
+        """
+        items = (params or {}).items()
+        normalized = tuple(sorted((k, str(v)) for k, v in items if k != "apikey"))
+        return endpoint.strip("/"), normalized
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL for an endpoint in seconds."""
+        return self.ttls.get(endpoint.strip("/"), self.default_ttl)
+
+    def stale_ttl_for(self, endpoint: str) -> float:
+        """Get how long past its TTL a response of an endpoint may be served."""
+        return self.stale_ttls.get(endpoint.strip("/"), 0.0)
+
+    def _lookup(self, key: CacheKey, now: float) -> _Entry | None:
+        """Get an entry that is fresh or still servable stale."""
+        entry = self._entries.get(key)
+        if entry is None or entry.stale_until <= now:
+            return None
+        return entry
+
+    def get(self, key: CacheKey) -> Any:
+        """Get a cached response, or MISSING if absent or expired."""
+        now = self._clock()
+        entry = self._lookup(key, now)
+        if entry is None or entry.expires_at <= now:
+            self._stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry.value
+
+    def get_stale(self, key: CacheKey) -> tuple[Any, float | None]:
+        """Get a cached response, even past its TTL but within its stale TTL.
+
+        Returns:
+            The response, or MISSING if absent or expired, and for stale
+            responses the seconds since they were stored (None when fresh)
+        """
+        now = self._clock()
+        entry = self._lookup(key, now)
+        if entry is None:
+            self._stats.misses += 1
+            return MISSING, None
+
+        self._entries.move_to_end(key)
+        if entry.expires_at <= now:
+            self._stats.stale_hits += 1
+            return entry.value, now - entry.stored_at
+        self._stats.hits += 1
+        return entry.value, None
+
+    def peek(self, key: CacheKey) -> tuple[Any, float | None]:
+        """Get a cached response however old, without counting a lookup.
+
+        Returns:
+            The response, or MISSING if absent or evicted, and the seconds
+            since it was stored
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING, None
+        return entry.value, self._clock() - entry.stored_at
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store a response using the TTL of its endpoint."""
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+
+        now = self._clock()
+        expires_at = now + ttl
+        stale_until = expires_at + self.stale_ttl_for(key[0])
+        self._entries[key] = _Entry(now, expires_at, stale_until, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            size=len(self._entries),
+            stale_hits=self._stats.stale_hits,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,123 @@
+"""Command line entry point.
+
+Only the standard library is imported here. Arguments are parsed and the
+environment is configured before the MCP server is imported, so ``--help`` and
+argument errors return at once. Settings that are read at import time, such as
+the FastMCP log level, also take effect.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+from . import __version__
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``fmp-mcp-server`` argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="fmp-mcp-server",
+        description="MCP server for the Financial Modelling Prep API",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default=os.getenv("FMP_TRANSPORT", "stdio"),
+        help="stdio for one agent (default), http or sse to serve many",
+    )
+    parser.add_argument(
+        "--host",
+        help="interface to bind for http and sse, and for metrics",
+    )
+    parser.add_argument("--port", type=int, help="port to bind for http and sse")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes for the http transport",
+    )
+    parser.add_argument(
+        "--cache-path",
+        help="SQLite file persisting financial statements (sets FMP_CACHE_PATH)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=os.getenv("FMP_METRICS_PORT") or None,
+        help="serve Prometheus metrics on this port (needs the metrics extra)",
+    )
+    parser.add_argument(
+        "--tracing",
+        choices=["otlp", "file"],
+        default=os.getenv("FMP_TRACING") or None,
+        help="export OpenTelemetry traces to an OTLP collector or a file "
+        "(needs the tracing extra)",
+    )
+    parser.add_argument(
+        "--trace-file",
+        help="JSON lines file for --tracing file (sets FMP_TRACE_FILE)",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=LOG_LEVELS,
+        default=os.getenv("FMP_LOG_LEVEL", "INFO").upper(),
+        help="log level of the server, written to stderr (default: INFO)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the server over stdio, or over HTTP for many agents at once."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.cache_path:
+        os.environ["FMP_CACHE_PATH"] = args.cache_path
+    if args.trace_file:
+        os.environ["FMP_TRACE_FILE"] = args.trace_file
+    if args.tracing:
+        # Read by the server module, here and in worker processes
+        os.environ["FMP_TRACING"] = args.tracing
+    # Read by FastMCP when the server module creates its instance
+    os.environ["FASTMCP_LOG_LEVEL"] = args.log_level
+    logging.basicConfig(level=args.log_level, stream=sys.stderr)
+
+    if args.metrics_port:
+        # Read by the server module, here and in worker processes
+        os.environ["FMP_METRICS_PORT"] = str(args.metrics_port)
+        if args.transport == "http" and args.workers > 1:
+            # Must be set before prometheus_client is imported anywhere
+            os.environ.setdefault(
+                "PROMETHEUS_MULTIPROC_DIR",
+                tempfile.mkdtemp(prefix="fmp-metrics-"),
+            )
+        from . import metrics  # noqa: PLC0415
+
+        if not metrics.enable():
+            parser.error("--metrics-port needs prometheus_client (metrics extra)")
+        metrics.start_exporter(args.metrics_port, args.host or "127.0.0.1")
+
+    if args.transport == "stdio":
+        from .server import mcp  # noqa: PLC0415
+
+        # The lifespan creates the shared FMPClient when a session starts and
+        # closes it once the last session ends.
+        mcp.run()
+        return
+
+    from .app import serve  # noqa: PLC0415
+
+    try:
+        serve(args.transport, args.host, args.port, args.workers)
+    except ValueError as exc:
+        parser.error(str(exc))
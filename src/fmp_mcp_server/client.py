@@ -1,20 +1,114 @@
 """Financial Modelling Prep API client."""
 
+import asyncio
+import importlib.util
+import logging
 import os
-from typing import Any
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 
+from . import metrics, tracing
+from .breaker import CircuitBreakers, CircuitOpenError
+from .cache import DEFAULT_STALE_TTLS, MISSING, CacheKey, ResponseCache
+from .decoding import Decoder, get_decoder
+from .output import mark_stale
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .store import PERIOD_DAYS, StatementHistory, StatementStore, merge_periods
+
+# Maximum number of symbols sent in one batch-quote request
+BATCH_QUOTE_CHUNK_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from .models import Record
+
+R = TypeVar("R", bound="Record")
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def default_limits() -> httpx.Limits:
+    """Build connection pool limits from FMP_* environment variables."""
+    return httpx.Limits(
+        max_connections=int(_env_float("FMP_MAX_CONNECTIONS", 100)),
+        max_keepalive_connections=int(_env_float("FMP_MAX_KEEPALIVE_CONNECTIONS", 20)),
+        keepalive_expiry=_env_float("FMP_KEEPALIVE_EXPIRY", 60.0),
+    )
+
+
+def default_timeout() -> httpx.Timeout:
+    """Build connect/read/write/pool timeouts from FMP_* environment variables."""
+    return httpx.Timeout(
+        connect=_env_float("FMP_CONNECT_TIMEOUT", 5.0),
+        read=_env_float("FMP_READ_TIMEOUT", 30.0),
+        write=_env_float("FMP_WRITE_TIMEOUT", 10.0),
+        pool=_env_float("FMP_POOL_TIMEOUT", 10.0),
+    )
+
 
 class FMPClient:
     """Client for Financial Modelling Prep API."""
 
-    def __init__(self, api_key: str | None = None, base_url: str | None = None):
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        http2: bool | None = None,
+        store: StatementStore | None = None,
+        json_decoder: str | None = None,
+        breakers: CircuitBreakers | None = None,
+    ):
         """Initialize FMP client.
 
         Args:
             api_key: FMP API key (defaults to FMP_API_KEY env var)
             base_url: Base URL for API (defaults to FMP_BASE_URL env var)
+            cache: Response cache (defaults to one sized by FMP_CACHE_MAX_ENTRIES,
+                where 0 disables caching, serving stale quotes and profiles
+                unless FMP_STALE_WHILE_REVALIDATE is false)
+            rate_limiter: Request rate limiter (defaults to one configured by
+                RATE_LIMIT_REQUESTS_PER_MINUTE, RATE_LIMIT_BURST and
+                RATE_LIMIT_REQUESTS_PER_DAY, split evenly between FMP_WORKERS
+                processes, or none when unset)
+            retry_policy: Retry policy for transient failures (defaults to one
+                allowing FMP_MAX_RETRIES retries, 3 unless set)
+            limits: Connection pool limits (defaults to default_limits())
+            timeout: Per-phase timeouts (defaults to default_timeout())
+            http2: Negotiate HTTP/2 (defaults to the FMP_HTTP2 env var); needs
+                the ``http2`` extra and falls back to HTTP/1.1 without it
+            store: Persistent statement cache (defaults to one at FMP_CACHE_PATH,
+                or none when unset)
+            json_decoder: JSON backend, "orjson", "msgspec", "json" or "auto"
+                (defaults to the FMP_JSON_DECODER env var, then "auto")
+            breakers: Circuit breakers per endpoint family (defaults to ones
+                opening after FMP_BREAKER_FAILURES consecutive failures, 5
+                unless set and 0 to disable, or calls slower than
+                FMP_BREAKER_SLOW_CALL seconds, 10 unless set, for
+                FMP_BREAKER_RESET seconds, 30 unless set)
         """
         self.api_key = api_key or os.getenv("FMP_API_KEY")
         self.base_url = base_url or os.getenv(
@@ -25,31 +119,428 @@ class FMPClient:
         if not self.api_key:
             raise ValueError("FMP API key is required")
 
-        self.client = httpx.AsyncClient(timeout=30.0)
+        if cache is None:
+            max_entries = _env_int("FMP_CACHE_MAX_ENTRIES", 1024)
+            stale_ttls = (
+                None
+                if _env_bool("FMP_STALE_WHILE_REVALIDATE", True)
+                else dict.fromkeys(DEFAULT_STALE_TTLS, 0.0)
+            )
+            cache = (
+                ResponseCache(max_entries, stale_ttls=stale_ttls)
+                if max_entries > 0
+                else None
+            )
+        self.cache = cache
+
+        if rate_limiter is None and os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE"):
+            # Worker processes sharing one API key each get an equal share
+            workers = max(int(os.getenv("FMP_WORKERS", "1")), 1)
+            burst = os.getenv("RATE_LIMIT_BURST")
+            daily_limit = os.getenv("RATE_LIMIT_REQUESTS_PER_DAY")
+            rate_limiter = RateLimiter(
+                float(os.environ["RATE_LIMIT_REQUESTS_PER_MINUTE"]) / workers,
+                burst=max(int(burst) // workers, 1) if burst else None,
+                daily_limit=(
+                    max(int(daily_limit) // workers, 1) if daily_limit else None
+                ),
+            )
+        self.rate_limiter = rate_limiter
+
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=_env_int("FMP_MAX_RETRIES", 3),
+        )
+
+        if store is None and os.getenv("FMP_CACHE_PATH"):
+            store = StatementStore(os.environ["FMP_CACHE_PATH"])
+        self.store = store
+
+        if breakers is None:
+            failures = _env_int("FMP_BREAKER_FAILURES", 5)
+            slow_call = _env_float("FMP_BREAKER_SLOW_CALL", 10.0)
+            if failures > 0:
+                breakers = CircuitBreakers(
+                    failure_threshold=failures,
+                    slow_call=slow_call or None,
+                    reset_timeout=_env_float("FMP_BREAKER_RESET", 30.0),
+                )
+        self.breakers = breakers
+
+        self.json_backend, self._loads = get_decoder(
+            json_decoder or os.getenv("FMP_JSON_DECODER"),
+        )
+
+        # Upstream requests currently in progress, shared by identical callers
+        self._inflight: dict[CacheKey, asyncio.Future[Any]] = {}
+
+        if http2 is None:
+            http2 = _env_bool("FMP_HTTP2")
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+            http2 = False
+
+        self.client = httpx.AsyncClient(
+            limits=limits or default_limits(),
+            timeout=timeout or default_timeout(),
+            http2=http2,
+            event_hooks={"request": [tracing.trace_connection]},
+        )
 
     async def _request(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
+        stale_fallback: bool = True,
     ) -> Any:
         """Make API request to FMP.
 
         Args:
             endpoint: API endpoint path
             params: Query parameters
+            stale_fallback: Whether to fall back to an expired cached response
+                while the endpoint's circuit is open, instead of raising
+                CircuitOpenError
+
+        Concurrent calls for the same endpoint and parameters share a single
+        upstream request. Responses past their TTL but within their stale TTL
+        (quotes and profiles by default) are returned at once, marked stale,
+        while one background request refreshes them. While the endpoint's
+        circuit breaker is open, any cached response is returned marked stale
+        instead of failing.
 
         Returns:
-            JSON response data
+            JSON response data, served from the cache when still fresh
         """
         if params is None:
             params = {}
 
-        params["apikey"] = self.api_key
+        key = ResponseCache.make_key(endpoint, params)
+        attributes = {
+            "fmp.endpoint": key[0],
+            "fmp.symbol": params.get("symbol") or params.get("symbols"),
+        }
+        with tracing.span(f"fmp {key[0]}", attributes) as current:
+            if self.cache is not None:
+                cached, stale_age = self.cache.get_stale(key)
+                if cached is MISSING:
+                    outcome = "miss"
+                elif stale_age is None:
+                    outcome = "hit"
+                else:
+                    outcome = "stale"
+                    self._revalidate(key, endpoint, params)
+                    cached = mark_stale(cached, stale_age)
+                metrics.record_cache(key[0], outcome)
+                current.set_attribute("fmp.cache", outcome)
+                if cached is not MISSING:
+                    return cached
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                inflight = self._start_fetch(key, endpoint, params)
+            else:
+                current.set_attribute("fmp.cache", "shared")
+
+            try:
+                # Shield so that one cancelled caller does not cancel the
+                # shared request
+                return await asyncio.shield(inflight)
+            except CircuitOpenError:
+                if self.cache is None or not stale_fallback:
+                    raise
+                cached, age = self.cache.peek(key)
+                if cached is MISSING:
+                    raise
+                current.set_attribute("fmp.cache", "fallback")
+                return mark_stale(cached, age)
+
+    def _start_fetch(
+        self,
+        key: CacheKey,
+        endpoint: str,
+        params: dict[str, Any],
+        decode: Decoder | None = None,
+    ) -> "asyncio.Future[Any]":
+        """Start an upstream request, shared by identical callers until done."""
+        inflight = asyncio.ensure_future(self._fetch(key, endpoint, params, decode))
+        self._inflight[key] = inflight
+        inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return inflight
+
+    def _revalidate(
+        self,
+        key: CacheKey,
+        endpoint: str,
+        params: dict[str, Any],
+    ) -> None:
+        """Refresh a stale response in the background, unless already underway.
+
+        Failures are logged; the stale response keeps being served until its
+        stale TTL runs out.
+        """
+        if key in self._inflight:
+            return
+
+        def log_failure(refresh: "asyncio.Future[Any]") -> None:
+            error = None if refresh.cancelled() else refresh.exception()
+            if error is not None:
+                level = (
+                    logging.DEBUG
+                    if isinstance(error, CircuitOpenError)
+                    else logging.WARNING
+                )
+                logger.log(level, "Background refresh of %s failed: %s", key[0], error)
+
+        self._start_fetch(key, endpoint, params).add_done_callback(log_failure)
+
+    async def _fetch(
+        self,
+        key: CacheKey,
+        endpoint: str,
+        params: dict[str, Any],
+        decode: Decoder | None = None,
+    ) -> Any:
+        """Fetch a response from FMP and store it in the cache.
+
+        The body is decoded with ``decode``, or the client's JSON backend.
+        Throttling, transient upstream errors and connection failures are
+        retried according to the retry policy. While the circuit breaker of
+        the endpoint's family is open, CircuitOpenError is raised at once.
+        """
+        query = {**params, "apikey": self.api_key}
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        breaker = None if self.breakers is None else self.breakers.for_endpoint(key[0])
+        self.retry_policy.budget.record_request()
+        attempt = 0
+        while True:
+            # Fail fast, before waiting for a rate limiter token
+            if breaker is not None:
+                try:
+                    breaker.before_call()
+                except CircuitOpenError:
+                    metrics.record_circuit_rejected(breaker.family)
+                    raise
+
+            attributes = {
+                "http.request.method": "GET",
+                "fmp.endpoint": key[0],
+                "fmp.attempt": attempt,
+            }
+            try:
+                if self.rate_limiter is not None:
+                    with metrics.track_rate_limit(), tracing.span("rate limit wait"):
+                        await self.rate_limiter.acquire()
+
+                with (
+                    tracing.span("GET", attributes) as current,
+                    metrics.track_upstream(key[0]) as call,
+                ):
+                    response = await self.client.get(url, params=query)
+                    call.status = response.status_code
+                    current.set_attribute("http.response.status_code", call.status)
+                    current.set_attribute(
+                        "http.response.body.size",
+                        len(response.content),
+                    )
+                    response.raise_for_status()
+            except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+                if breaker is not None:
+                    breaker.record_error(exc, call.elapsed)
+                delay = self.retry_policy.retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                breaker.record_success(call.elapsed)
+            logger.debug("GET %s: HTTP %s in %.3fs", key[0], call.status, call.elapsed)
+            break
+
+        attributes = {
+            "fmp.json_backend": self.json_backend,
+            "http.response.body.size": len(response.content),
+        }
+        with tracing.span("decode", attributes):
+            data = (decode or self._loads)(response.content)
+
+        if self.cache is not None:
+            self.cache.set(key, data)
+        return data
+
+    async def _get_periods(
+        self,
+        endpoint: str,
+        symbol: str,
+        period: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Get the most recent periods of a statement-like endpoint.
+
+        With a persistent store, the symbol's stored history is reused: it is
+        served as is while fresh, and once stale only the periods filed since
+        its newest fiscal date are fetched and merged in.
+        """
+        params = {"symbol": symbol, "period": period, "limit": limit}
+        store = self.store
+        if store is None or not store.handles(endpoint):
+            result = await self._request(endpoint, params)
+            return result if isinstance(result, list) else [result]
+
+        key = ResponseCache.make_key(endpoint, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            metrics.record_cache(key[0], "miss" if cached is MISSING else "hit")
+            if cached is not MISSING:
+                return list(cached)
+
+        history = await asyncio.to_thread(store.load, endpoint, symbol, period)
+        try:
+            if history is not None and history.covers(limit):
+                if history.expires_at <= store.now():
+                    metrics.record_store(key[0], "stale")
+                    history = await self._refresh_history(
+                        endpoint,
+                        symbol,
+                        period,
+                        history,
+                    )
+                else:
+                    metrics.record_store(key[0], "hit")
+            else:
+                metrics.record_store(key[0], "miss")
+                history = await self._replace_history(endpoint, symbol, period, limit)
+        except CircuitOpenError:
+            # Serve the stored periods rather than nothing, without caching them
+            if history is None or not history.rows:
+                raise
+            return list(mark_stale(history.rows[:limit]))
+
+        result = history.rows[:limit]
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return list(result)
+
+    async def _replace_history(
+        self,
+        endpoint: str,
+        symbol: str,
+        period: str,
+        limit: int,
+    ) -> StatementHistory:
+        """Fetch the latest ``limit`` periods and store them as the history."""
+        assert self.store is not None
+        # Expired responses must not be stored as a fresh history
+        result = await self._request(
+            endpoint,
+            {"symbol": symbol, "period": period, "limit": limit},
+            stale_fallback=False,
+        )
+        rows = merge_periods([], result if isinstance(result, list) else [result])
+        return await asyncio.to_thread(
+            self.store.save,
+            endpoint,
+            symbol,
+            period,
+            rows,
+            len(rows),
+            len(rows) < limit,
+        )
+
+    async def _refresh_history(
+        self,
+        endpoint: str,
+        symbol: str,
+        period: str,
+        history: StatementHistory,
+    ) -> StatementHistory:
+        """Fetch only the periods newer than a stale history and merge them in.
+
+        The request asks for enough periods to reach back to the newest stored
+        one; if that overlap is missing, the history is refetched in full.
+        """
+        assert self.store is not None
+        newest = history.newest_date
+        if newest is None:
+            return await self._replace_history(endpoint, symbol, period, history.depth)
+
+        today = datetime.fromtimestamp(self.store.now(), tz=timezone.utc).date()
+        elapsed = (today - newest).days // PERIOD_DAYS.get(
+            period,
+            PERIOD_DAYS["annual"],
+        )
+        gap = elapsed + 2
+        if gap >= history.depth:
+            return await self._replace_history(endpoint, symbol, period, history.depth)
+
+        result = await self._request(
+            endpoint,
+            {"symbol": symbol, "period": period, "limit": gap},
+            stale_fallback=False,
+        )
+        rows = result if isinstance(result, list) else [result]
+        newest_key = newest.isoformat()
+        fetched = {str(row.get("date"))[:10] for row in rows}
+        if newest_key not in fetched:
+            return await self._replace_history(endpoint, symbol, period, history.depth)
+
+        added = sum(1 for d in fetched if d > newest_key)
+        return await asyncio.to_thread(
+            self.store.save,
+            endpoint,
+            symbol,
+            period,
+            merge_periods(history.rows, rows),
+            history.depth + added,
+            history.complete,
+        )
+
+    async def get_records(
+        self,
+        model: type[R],
+        symbol: str,
+        period: str = "annual",
+        limit: int = 5,
+    ) -> list[R]:
+        """Get typed records from the endpoint of a record class.
+
+        Records are decoded straight from the response body and cached as
+        records, apart from the endpoint's dict rows. Statements kept in the
+        persistent store are built from its stored rows instead.
+
+        Args:
+            model: Record class such as IncomeStatement or Quote
+            symbol: Ticker symbol
+            period: Reporting period for per-period records
+            limit: Number of periods for per-period records
+        """
+        params: dict[str, Any] = {"symbol": symbol}
+        if model.PERIODIC:
+            params.update(period=period, limit=limit)
+            if self.store is not None and self.store.handles(model.ENDPOINT):
+                rows = await self._get_periods(model.ENDPOINT, symbol, period, limit)
+                return model.from_rows(rows)
+
+        key = ResponseCache.make_key(
+            model.ENDPOINT,
+            {**params, "record": model.__name__},
+        )
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            metrics.record_cache(key[0], "miss" if cached is MISSING else "hit")
+            if cached is not MISSING:
+                return list(cached)
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = self._start_fetch(key, model.ENDPOINT, params, model.decode)
+        return list(await asyncio.shield(inflight))
 
     async def get_company_profile(self, symbol: str) -> list[dict[str, Any]]:
         """Get company profile information."""
@@ -61,6 +552,34 @@ class FMPClient:
         result = await self._request("quote", {"symbol": symbol})
         return result if isinstance(result, list) else [result]
 
+    async def get_quotes(
+        self,
+        symbols: list[str],
+        chunk_size: int = BATCH_QUOTE_CHUNK_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Get real-time quotes for several symbols.
+
+        Symbols are split into batch-quote requests of at most ``chunk_size``
+        symbols that are sent concurrently. Quotes are returned in input order,
+        once per distinct symbol; unknown symbols are omitted.
+        """
+        ordered = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        chunks = [
+            ordered[i : i + chunk_size] for i in range(0, len(ordered), chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._request("batch-quote", {"symbols": ",".join(chunk)})
+                for chunk in chunks
+            ),
+        )
+
+        by_symbol: dict[str, dict[str, Any]] = {}
+        for result in results:
+            for quote in result if isinstance(result, list) else [result]:
+                by_symbol[str(quote.get("symbol", "")).upper()] = quote
+        return [by_symbol[symbol] for symbol in ordered if symbol in by_symbol]
+
     async def get_income_statement(
         self,
         symbol: str,
@@ -68,11 +587,7 @@ class FMPClient:
         limit: int = 5,
     ) -> list[dict[str, Any]]:
         """Get income statement data."""
-        result = await self._request(
-            "income-statement",
-            {"symbol": symbol, "period": period, "limit": limit},
-        )
-        return result if isinstance(result, list) else [result]
+        return await self._get_periods("income-statement", symbol, period, limit)
 
     async def get_balance_sheet(
         self,
@@ -81,11 +596,7 @@ class FMPClient:
         limit: int = 5,
     ) -> list[dict[str, Any]]:
         """Get balance sheet data."""
-        result = await self._request(
-            "balance-sheet-statement",
-            {"symbol": symbol, "period": period, "limit": limit},
-        )
-        return result if isinstance(result, list) else [result]
+        return await self._get_periods("balance-sheet-statement", symbol, period, limit)
 
     async def get_cash_flow(
         self,
@@ -94,11 +605,7 @@ class FMPClient:
         limit: int = 5,
     ) -> list[dict[str, Any]]:
         """Get cash flow statement data."""
-        result = await self._request(
-            "cash-flow-statement",
-            {"symbol": symbol, "period": period, "limit": limit},
-        )
-        return result if isinstance(result, list) else [result]
+        return await self._get_periods("cash-flow-statement", symbol, period, limit)
 
     async def get_key_metrics(
         self,
@@ -107,11 +614,7 @@ class FMPClient:
         limit: int = 5,
     ) -> list[dict[str, Any]]:
         """Get key financial metrics."""
-        result = await self._request(
-            "key-metrics",
-            {"symbol": symbol, "period": period, "limit": limit},
-        )
-        return result if isinstance(result, list) else [result]
+        return await self._get_periods("key-metrics", symbol, period, limit)
 
     async def get_financial_ratios(
         self,
@@ -120,11 +623,7 @@ class FMPClient:
         limit: int = 5,
     ) -> list[dict[str, Any]]:
         """Get financial ratios."""
-        result = await self._request(
-            "ratios",
-            {"symbol": symbol, "period": period, "limit": limit},
-        )
-        return result if isinstance(result, list) else [result]
+        return await self._get_periods("ratios", symbol, period, limit)
 
     async def get_dcf_valuation(self, symbol: str) -> list[dict[str, Any]]:
         """Get DCF valuation."""
@@ -147,9 +646,7 @@ class FMPClient:
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """Search for companies."""
-        result = await self._request(
-            "search-symbol", {"query": query, "limit": limit}
-        )
+        result = await self._request("search-symbol", {"query": query, "limit": limit})
         return result if isinstance(result, list) else [result]
 
     async def get_sector_performance(self) -> list[dict[str, Any]]:
@@ -157,6 +654,25 @@ class FMPClient:
         result = await self._request("sector-performance")
         return result if isinstance(result, list) else [result]
 
+    async def warmup(self) -> None:
+        """Open a pooled connection to FMP ahead of the first API call.
+
+        Sends an unauthenticated HEAD request so the TCP and TLS handshakes are
+        paid at startup; failures are logged and otherwise ignored.
+        """
+        try:
+            await self.client.head(f"{self.base_url}/")
+        except httpx.HTTPError as exc:
+            logger.warning(
+                "Could not pre-warm connection to %s: %s",
+                self.base_url,
+                exc,
+            )
+
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Cancel requests in flight, then close HTTP client and persistent store."""
+        for inflight in list(self._inflight.values()):
+            inflight.cancel()
         await self.client.aclose()
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,266 @@
+"""Monte Carlo discounted cash flow valuation.
+
+Revenue growth, free cash flow margin and WACC are drawn from normal
+distributions, by default fitted to the company's annual history, and every
+simulated path is valued at once with NumPy. Large runs are split into chunks
+with independent random streams and valued in a process pool, so callers on the
+event loop only await the result.
+
+Requires the ``analytics`` extra (NumPy).
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .frame import FloatArray, StatementFrame, fetch_statement_frame
+
+if TYPE_CHECKING:
+    from .client import FMPClient
+
+# Runs up to this many simulations are valued in a worker thread
+CHUNK_SIZE = 50_000
+# Limits per call, keeping the simulated arrays well within memory
+MAX_SIMULATIONS = 10_000_000
+MAX_SYMBOLS = 20
+MAX_YEARS = 50
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+_pool: ProcessPoolExecutor | None = None
+
+
+@dataclass(frozen=True)
+class DCFInputs:
+    """Distributions and starting point of a simulated DCF."""
+
+    base_revenue: float
+    net_debt: float
+    shares: float
+    growth_mean: float
+    growth_std: float
+    margin_mean: float
+    margin_std: float
+    wacc_mean: float = 0.09
+    wacc_std: float = 0.01
+    terminal_growth: float = 0.025
+    years: int = 5
+
+    @classmethod
+    def from_frame(cls, frame: StatementFrame, **overrides: Any) -> "DCFInputs":
+        """Fit distributions to an annual statement history.
+
+        Growth is fitted to year-over-year revenue growth and margin to free
+        cash flow over revenue. Keyword arguments that are not None replace the
+        fitted values.
+
+        Raises:
+            ValueError: If the history lacks revenue, share count or cash flow
+        """
+        revenue = frame.get("revenue")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = revenue[1:] / revenue[:-1] - 1
+            margin = frame.get("freeCashFlow") / revenue
+        growth = growth[np.isfinite(growth)]
+        margin = margin[np.isfinite(margin)]
+        latest = {
+            name: _latest(frame.get(name))
+            for name in ("revenue", "netDebt", "weightedAverageShsOutDil")
+        }
+        if not latest["revenue"] or not latest["weightedAverageShsOutDil"]:
+            raise ValueError(f"No revenue or share count history for {frame.symbol}")
+        params: dict[str, Any] = {
+            "growth_mean": float(growth.mean()) if growth.size else None,
+            "growth_std": float(growth.std()) if growth.size > 1 else 0.0,
+            "margin_mean": float(margin.mean()) if margin.size else None,
+            "margin_std": float(margin.std()) if margin.size > 1 else 0.0,
+        }
+        params.update((k, v) for k, v in overrides.items() if v is not None)
+        if params["growth_mean"] is None or params["margin_mean"] is None:
+            raise ValueError(f"Not enough cash flow history for {frame.symbol}")
+        return cls(
+            base_revenue=latest["revenue"],
+            net_debt=latest["netDebt"] or 0.0,
+            shares=latest["weightedAverageShsOutDil"],
+            **params,
+        )
+
+
+def _latest(values: FloatArray) -> float | None:
+    finite = values[np.isfinite(values)]
+    return float(finite[-1]) if finite.size else None
+
+
+def simulate(
+    inputs: DCFInputs,
+    simulations: int,
+    seed: np.random.SeedSequence | int | None = None,
+) -> FloatArray:
+    """Value ``simulations`` random paths.
+
+    Returns:
+        Intrinsic value per share of each path; NaN where WACC does not exceed
+        terminal growth
+    """
+    rng = np.random.default_rng(seed)
+    growth = rng.normal(inputs.growth_mean, inputs.growth_std, simulations)
+    margin = rng.normal(inputs.margin_mean, inputs.margin_std, simulations)
+    wacc = rng.normal(inputs.wacc_mean, inputs.wacc_std, simulations)
+
+    years = np.arange(1, inputs.years + 1)
+    revenue = inputs.base_revenue * (1 + growth[:, None]) ** years
+    cash_flows = revenue * margin[:, None]
+    discount = (1 + wacc[:, None]) ** -years
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        terminal = (
+            cash_flows[:, -1]
+            * (1 + inputs.terminal_growth)
+            / (wacc - inputs.terminal_growth)
+        )
+        enterprise = (cash_flows * discount).sum(axis=1) + terminal * discount[:, -1]
+        per_share = (enterprise - inputs.net_debt) / inputs.shares
+    per_share[wacc <= inputs.terminal_growth] = np.nan
+    result: FloatArray = per_share
+    return result
+
+
+def summarize(values: FloatArray, price: float | None = None) -> dict[str, Any]:
+    """Summarize simulated values per share as percentile bands."""
+    valid = values[np.isfinite(values)]
+    summary: dict[str, Any] = {
+        "simulations": int(values.size),
+        "valid": int(valid.size),
+    }
+    if not valid.size:
+        return summary
+    bands = np.percentile(valid, PERCENTILES)
+    summary["percentiles"] = {
+        f"p{p}": float(v) for p, v in zip(PERCENTILES, bands, strict=True)
+    }
+    summary["mean"] = float(valid.mean())
+    summary["std"] = float(valid.std())
+    if price:
+        summary["price"] = price
+        summary["probabilityUndervalued"] = float((valid > price).mean())
+    return summary
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, sized by ``FMP_DCF_WORKERS``."""
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        workers = int(os.getenv("FMP_DCF_WORKERS", "0")) or os.cpu_count() or 1
+        # Forking a process running an event loop and threads is unsafe
+        _pool = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Shut down the shared process pool, if started."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+async def run_simulations(
+    inputs: DCFInputs,
+    simulations: int,
+    seed: int | None = None,
+    executor: Executor | None = None,
+) -> FloatArray:
+    """Value ``simulations`` paths off the event loop.
+
+    Runs of up to ``CHUNK_SIZE`` paths are valued in a worker thread; larger
+    runs are split into chunks with independent random streams spawned from
+    ``seed`` and valued concurrently in ``executor`` (the shared process pool by
+    default).
+    """
+    if simulations <= CHUNK_SIZE:
+        return await asyncio.to_thread(simulate, inputs, simulations, seed)
+
+    sizes = [CHUNK_SIZE] * (simulations // CHUNK_SIZE)
+    if simulations % CHUNK_SIZE:
+        sizes.append(simulations % CHUNK_SIZE)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    loop = asyncio.get_running_loop()
+    pool = executor or get_pool()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, simulate, inputs, size, stream)
+            for size, stream in zip(sizes, streams, strict=True)
+        ),
+    )
+    return np.concatenate(chunks)
+
+
+async def simulate_dcf(
+    client: "FMPClient",
+    symbols: list[str],
+    simulations: int = 100_000,
+    history: int = 5,
+    seed: int | None = None,
+    **overrides: Any,
+) -> list[dict[str, Any]]:
+    """Run a Monte Carlo DCF for each symbol.
+
+    Statements come through the client's caches and current prices from one
+    batched quote request. All symbols' chunks share the process pool.
+
+    Args:
+        client: FMP client
+        symbols: Ticker symbols, at most ``MAX_SYMBOLS``
+        simulations: Paths per symbol; at most ``MAX_SIMULATIONS`` over all
+            symbols
+        history: Annual periods to fit the distributions to
+        seed: Seed for reproducible runs
+        **overrides: ``DCFInputs`` fields replacing the fitted values
+
+    Returns:
+        One result per symbol, in input order
+
+    Raises:
+        ValueError: If ``symbols``, ``simulations`` or ``years`` is out of
+            range, or a standard deviation is negative
+    """
+    if not 1 <= len(symbols) <= MAX_SYMBOLS:
+        raise ValueError(f"Between 1 and {MAX_SYMBOLS} symbols per call")
+    if not 1 <= simulations * len(symbols) <= MAX_SIMULATIONS:
+        raise ValueError(
+            f"simulations must be between 1 and {MAX_SIMULATIONS} over all symbols",
+        )
+    years = overrides.get("years")
+    if years is not None and not 1 <= years <= MAX_YEARS:
+        raise ValueError(f"years must be between 1 and {MAX_YEARS}")
+    for name in ("growth_std", "margin_std", "wacc_std"):
+        std = overrides.get(name)
+        if std is not None and std < 0:
+            raise ValueError(f"{name} must not be negative")
+    frames, quotes = await asyncio.gather(
+        asyncio.gather(
+            *(fetch_statement_frame(client, s, "annual", history) for s in symbols),
+        ),
+        client.get_quotes(symbols),
+    )
+    prices = {str(q.get("symbol")).upper(): q.get("price") for q in quotes}
+
+    async def run(symbol: str, frame: StatementFrame) -> dict[str, Any]:
+        symbol = symbol.upper()
+        try:
+            inputs = DCFInputs.from_frame(frame, **overrides)
+        except ValueError as exc:
+            return {"symbol": symbol, "error": str(exc)}
+        values = await run_simulations(inputs, simulations, seed)
+        summary = await asyncio.to_thread(summarize, values, prices.get(symbol))
+        return {"symbol": symbol, "inputs": asdict(inputs), **summary}
+
+    runs = (run(s, f) for s, f in zip(symbols, frames, strict=True))
+    return list(await asyncio.gather(*runs))
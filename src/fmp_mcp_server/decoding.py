@@ -0,0 +1,58 @@
+"""JSON decoding for FMP responses using the fastest available backend."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+Decoder = Callable[[bytes], Any]
+
+# Backends in order of preference for "auto"
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load_backend(name: str) -> Decoder:
+    if name == "orjson":
+        import orjson  # noqa: PLC0415
+
+        loads: Decoder = orjson.loads
+        return loads
+    if name == "msgspec":
+        import msgspec  # noqa: PLC0415
+
+        decode: Decoder = msgspec.json.Decoder().decode
+        return decode
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON decoder: {name}")
+
+
+def get_decoder(name: str | None = None) -> tuple[str, Decoder]:
+    """Select a JSON decoder.
+
+    Args:
+        name: One of BACKENDS, or "auto"/None for the fastest installed one
+
+    Returns:
+        Name of the selected backend and its decode function
+
+    Raises:
+        ImportError: If an explicitly requested backend is not installed
+    """
+    if name and name != "auto":
+        return name, _load_backend(name)
+
+    for backend in BACKENDS[:-1]:
+        decoder = _try_backend(backend)
+        if decoder is not None:
+            return backend, decoder
+    return "json", json.loads
+
+
+def _try_backend(name: str) -> Decoder | None:
+    try:
+        return _load_backend(name)
+    except ImportError:
+        return None
+
+
+BACKEND, loads = get_decoder()
@@ -0,0 +1,247 @@
+"""Columnar statement histories backed by NumPy arrays.
+
+Requires the ``analytics`` extra (NumPy).
+"""
+
+import asyncio
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .models import Record
+
+if TYPE_CHECKING:
+    from .client import FMPClient
+
+FloatArray = npt.NDArray[np.float64]
+DateArray = npt.NDArray[np.datetime64]
+
+# Row fields that describe the period rather than hold figures
+_META_FIELDS = frozenset(
+    {"date", "symbol", "reportedCurrency", "cik", "filingDate", "acceptedDate"},
+)
+
+
+class StatementFrame:
+    """A symbol's statement history as one float64 array per line item.
+
+    Periods are ordered oldest first and indexed by ``dates``. Line items are
+    rows of a single C-contiguous 2-D array, so ``frame["revenue"]`` is a
+    contiguous view and ``frame.between(start, end)`` slices without copying.
+    Missing values are NaN.
+
+    Example:
+        frame = StatementFrame.from_rows(await client.get_income_statement(...))
+        margin = frame["netIncome"] / frame["revenue"]
+    """
+
+    __slots__ = ("_index", "dates", "period", "symbol", "values")
+
+    def __init__(
+        self,
+        dates: DateArray,
+        values: FloatArray,
+        fields: Iterable[str],
+        symbol: str | None = None,
+        period: str | None = None,
+    ):
+        """Initialize statement frame.
+
+        Args:
+            dates: Fiscal dates, oldest first, as datetime64[D]
+            values: Array of shape (len(fields), len(dates))
+            fields: Line item names, in row order of ``values``
+            symbol: Ticker symbol
+            period: Reporting period, "annual" or "quarter"
+        """
+        self._index = {name: i for i, name in enumerate(fields)}
+        if values.shape != (len(self._index), len(dates)):
+            raise ValueError(
+                f"values shape {values.shape} does not match "
+                f"{len(self._index)} fields and {len(dates)} dates",
+            )
+        self.dates = dates
+        self.values = values
+        self.symbol = symbol
+        self.period = period
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Mapping[str, Any] | Record],
+        fields: Iterable[str] | None = None,
+        period: str | None = None,
+    ) -> "StatementFrame":
+        """Build a frame from FMP statement rows or records.
+
+        Args:
+            rows: Statement rows in any order, as dicts or typed records
+            fields: Line items to keep (defaults to every numeric field)
+            period: Reporting period of the rows
+
+        Returns:
+            Frame with one column per period, sorted by date
+        """
+        dicts = [row.to_dict() if isinstance(row, Record) else row for row in rows]
+        dicts.sort(key=lambda row: str(row.get("date")))
+
+        if fields is None:
+            names: dict[str, None] = {}
+            for row in dicts:
+                for key, value in row.items():
+                    if key not in _META_FIELDS and _is_number(value):
+                        names[key] = None
+            fields = names
+        field_list = list(fields)
+
+        values = np.full((len(field_list), len(dicts)), np.nan)
+        for j, row in enumerate(dicts):
+            for i, name in enumerate(field_list):
+                value = row.get(name)
+                if _is_number(value):
+                    values[i, j] = value
+
+        dates = np.array([str(row.get("date"))[:10] for row in dicts], "datetime64[D]")
+        symbol = next((str(row["symbol"]) for row in dicts if row.get("symbol")), None)
+        return cls(dates, values, field_list, symbol, period)
+
+    @property
+    def fields(self) -> list[str]:
+        """Line item names."""
+        return list(self._index)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __getitem__(self, name: str) -> FloatArray:
+        """Get the values of a line item, oldest first."""
+        try:
+            column: FloatArray = self.values[self._index[name]]
+        except KeyError:
+            raise KeyError(f"No line item {name!r} in frame") from None
+        return column
+
+    def get(self, name: str) -> FloatArray:
+        """Get a line item, or an all-NaN array if the frame lacks it."""
+        if name in self._index:
+            return self[name]
+        return np.full(len(self.dates), np.nan)
+
+    def _slice(self, index: slice) -> "StatementFrame":
+        return StatementFrame(
+            self.dates[index],
+            self.values[:, index],
+            self._index,
+            self.symbol,
+            self.period,
+        )
+
+    def between(
+        self,
+        start: str | np.datetime64 | None = None,
+        end: str | np.datetime64 | None = None,
+    ) -> "StatementFrame":
+        """Get the periods dated within [start, end] as a view of this frame."""
+        lo = 0 if start is None else np.searchsorted(self.dates, np.datetime64(start))
+        hi = (
+            len(self.dates)
+            if end is None
+            else np.searchsorted(self.dates, np.datetime64(end), side="right")
+        )
+        return self._slice(slice(int(lo), int(hi)))
+
+    def tail(self, n: int) -> "StatementFrame":
+        """Get the ``n`` most recent periods as a view of this frame."""
+        return self._slice(slice(max(len(self.dates) - n, 0), None))
+
+    def assign(self, **columns: FloatArray) -> "StatementFrame":
+        """Get a copy of the frame with added or replaced line items."""
+        index = dict(self._index)
+        for name in columns:
+            index.setdefault(name, len(index))
+        values = np.empty((len(index), len(self.dates)))
+        values[: len(self._index)] = self.values
+        for name, column in columns.items():
+            values[index[name]] = column
+        return StatementFrame(self.dates, values, index, self.symbol, self.period)
+
+    def join(self, other: "StatementFrame") -> "StatementFrame":
+        """Combine line items of two frames over the dates they share.
+
+        Items present in both frames take the values of ``self``.
+        """
+        dates, left, right = np.intersect1d(
+            self.dates,
+            other.dates,
+            assume_unique=True,
+            return_indices=True,
+        )
+        extra = [name for name in other._index if name not in self._index]
+        values = np.empty((len(self._index) + len(extra), len(dates)))
+        values[: len(self._index)] = self.values[:, left]
+        for i, name in enumerate(extra, start=len(self._index)):
+            values[i] = other.values[other._index[name], right]
+        return StatementFrame(
+            dates,
+            values,
+            [*self._index, *extra],
+            self.symbol or other.symbol,
+            self.period or other.period,
+        )
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Convert back to FMP-style rows, newest first, with NaN as None."""
+        rows = []
+        for j in range(len(self.dates) - 1, -1, -1):
+            row: dict[str, Any] = {"date": str(self.dates[j])}
+            if self.symbol:
+                row["symbol"] = self.symbol
+            column = self.values[:, j]
+            row.update(
+                (name, None if np.isnan(v) else float(v))
+                for name, v in zip(self._index, column.tolist(), strict=True)
+            )
+            rows.append(row)
+        return rows
+
+    def __repr__(self) -> str:
+        span = f"{self.dates[0]}..{self.dates[-1]}" if len(self.dates) else "empty"
+        return (
+            f"StatementFrame(symbol={self.symbol!r}, periods={len(self.dates)}, "
+            f"fields={len(self._index)}, {span})"
+        )
+
+
+async def fetch_statement_frame(
+    client: "FMPClient",
+    symbol: str,
+    period: str = "annual",
+    limit: int = 5,
+) -> StatementFrame:
+    """Fetch a symbol's three statements and join them into one frame.
+
+    Line items reported on more than one statement (such as ``netIncome``)
+    take the income statement value, then the balance sheet value.
+    """
+    income, balance, cash_flow = await asyncio.gather(
+        client.get_income_statement(symbol, period, limit),
+        client.get_balance_sheet(symbol, period, limit),
+        client.get_cash_flow(symbol, period, limit),
+    )
+    return (
+        StatementFrame.from_rows(income, period=period)
+        .join(StatementFrame.from_rows(balance, period=period))
+        .join(StatementFrame.from_rows(cash_flow, period=period))
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
@@ -0,0 +1,252 @@
+"""Prometheus metrics for tool calls and upstream FMP requests.
+
+Recording is off until ``enable()`` is called, which the server does when
+FMP_METRICS_PORT is set. ``prometheus_client`` (the ``metrics`` extra) is only
+imported then, and the recording helpers return at once while disabled.
+
+With several worker processes, set PROMETHEUS_MULTIPROC_DIR before the
+workers start; the exporter then sums the metrics of all of them.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets in seconds, from cached answers to the 30 s read timeout
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Metrics:
+    """The Prometheus collectors recorded by the server."""
+
+    def __init__(self, registry: "CollectorRegistry | None" = None):
+        """Create the collectors.
+
+        Args:
+            registry: Registry to register them in (defaults to the global one)
+
+        Raises:
+            ImportError: If prometheus_client is not installed
+        """
+        from prometheus_client import (  # noqa: PLC0415
+            REGISTRY,
+            Counter,
+            Gauge,
+            Histogram,
+        )
+
+        registry = registry or REGISTRY
+        self.tool_duration = Histogram(
+            "fmp_tool_duration_seconds",
+            "Duration of MCP tool calls",
+            ["tool", "outcome"],
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.tools_in_progress = Gauge(
+            "fmp_tool_calls_in_progress",
+            "MCP tool calls in progress",
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.upstream_duration = Histogram(
+            "fmp_upstream_request_duration_seconds",
+            "Duration of each FMP API request attempt",
+            ["endpoint"],
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.upstream_responses = Counter(
+            "fmp_upstream_responses_total",
+            "FMP API responses by HTTP status, or 'error' for transport failures",
+            ["endpoint", "status"],
+            registry=registry,
+        )
+        self.upstream_in_progress = Gauge(
+            "fmp_upstream_requests_in_progress",
+            "FMP API requests in progress",
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.cache_lookups = Counter(
+            "fmp_cache_lookups_total",
+            "Response cache lookups by result (hit, stale or miss)",
+            ["endpoint", "result"],
+            registry=registry,
+        )
+        self.store_lookups = Counter(
+            "fmp_store_lookups_total",
+            "Statement store lookups by result (hit, stale or miss)",
+            ["endpoint", "result"],
+            registry=registry,
+        )
+        self.rate_limit_queue = Gauge(
+            "fmp_rate_limit_queue_depth",
+            "Requests waiting for a rate limiter token",
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.circuit_rejected = Counter(
+            "fmp_circuit_rejected_total",
+            "FMP requests rejected while their circuit breaker was open",
+            ["family"],
+            registry=registry,
+        )
+        self.rate_limit_wait = Histogram(
+            "fmp_rate_limit_wait_seconds",
+            "Time requests waited for a rate limiter token",
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+
+
+# Active collectors, or None while metrics are disabled
+_metrics: Metrics | None = None
+
+
+def enable() -> bool:
+    """Start recording metrics.
+
+    Returns:
+        Whether metrics are enabled; False if prometheus_client is missing
+    """
+    global _metrics  # noqa: PLW0603
+    if _metrics is None:
+        try:
+            _metrics = Metrics()
+        except ImportError:
+            logger.warning(
+                "Metrics need prometheus_client; install the 'metrics' extra",
+            )
+            return False
+    return True
+
+
+def enabled() -> bool:
+    """Whether metrics are being recorded."""
+    return _metrics is not None
+
+
+def start_exporter(port: int, host: str = "127.0.0.1") -> None:
+    """Serve the metrics for Prometheus on ``http://host:port/metrics``.
+
+    Runs in a daemon thread. With PROMETHEUS_MULTIPROC_DIR set, the metrics of
+    every worker process writing there are aggregated.
+    """
+    from prometheus_client import (  # noqa: PLC0415
+        REGISTRY,
+        CollectorRegistry,
+        start_http_server,
+    )
+
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess  # noqa: PLC0415
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    start_http_server(port, host, registry)
+    logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+
+
+@contextmanager
+def track_tool(tool: str) -> Iterator[None]:
+    """Record the duration and outcome of a tool call."""
+    metrics = _metrics
+    if metrics is None:
+        yield
+        return
+
+    metrics.tools_in_progress.inc()
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        metrics.tools_in_progress.dec()
+        metrics.tool_duration.labels(tool, outcome).observe(time.perf_counter() - start)
+
+
+@dataclass
+class UpstreamCall:
+    """Outcome of one upstream request, filled in by the caller."""
+
+    status: int | str = "error"
+    elapsed: float = 0.0
+
+
+@contextmanager
+def track_upstream(endpoint: str) -> Iterator[UpstreamCall]:
+    """Time one upstream request; the caller sets ``status`` on the result."""
+    metrics = _metrics
+    call = UpstreamCall()
+    if metrics is not None:
+        metrics.upstream_in_progress.inc()
+    start = time.perf_counter()
+    try:
+        yield call
+    finally:
+        call.elapsed = time.perf_counter() - start
+        if metrics is not None:
+            metrics.upstream_in_progress.dec()
+            metrics.upstream_duration.labels(endpoint).observe(call.elapsed)
+            metrics.upstream_responses.labels(endpoint, str(call.status)).inc()
+
+
+@contextmanager
+def track_rate_limit() -> Iterator[None]:
+    """Count a request as queued for a rate limiter token while waiting."""
+    metrics = _metrics
+    if metrics is None:
+        yield
+        return
+
+    metrics.rate_limit_queue.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.rate_limit_queue.dec()
+        metrics.rate_limit_wait.observe(time.perf_counter() - start)
+
+
+def record_cache(endpoint: str, result: str) -> None:
+    """Count a response cache lookup ("hit", "stale" or "miss")."""
+    if _metrics is not None:
+        _metrics.cache_lookups.labels(endpoint, result).inc()
+
+
+def record_store(endpoint: str, result: str) -> None:
+    """Count a statement store lookup ("hit", "stale" or "miss")."""
+    if _metrics is not None:
+        _metrics.store_lookups.labels(endpoint, result).inc()
+
+
+def record_circuit_rejected(family: str) -> None:
+    """Count a request rejected by an open circuit breaker."""
+    if _metrics is not None:
+        _metrics.circuit_rejected.labels(family).inc()
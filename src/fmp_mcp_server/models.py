@@ -0,0 +1,471 @@
+"""Typed, slotted records for FMP payloads.
+
+Each record class mirrors one FMP response row with snake_case attributes and
+``__slots__`` storage, which takes about half the memory of the decoded
+``dict`` when many rows are held in process. ``to_dict()`` gives back the
+camelCase view that FMP returns, for code that expects plain dicts.
+
+Example:
+    rows = await client.get_records(IncomeStatement, "AAPL", "quarter", 40)
+    revenue = [row.revenue for row in rows]
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .decoding import loads
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_ALIASES: dict[type, dict[str, str]] = {}
+_ROW_DECODERS: dict[type, Callable[[bytes], list[tuple[Any, ...]]] | None] = {}
+
+
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+def aliases(cls: type) -> dict[str, str]:
+    """Map attribute names of a record class to FMP field names."""
+    mapping = _ALIASES.get(cls)
+    if mapping is None:
+        mapping = {f.name: f.metadata.get("alias", _camel(f.name)) for f in fields(cls)}
+        _ALIASES[cls] = mapping
+    return mapping
+
+
+def row_decoder(cls: type) -> Callable[[bytes], list[tuple[Any, ...]]] | None:
+    """Get a decoder from a response body to the field values of each row.
+
+    The body is decoded with msgspec into a small struct per row, so no dict
+    is built for it. Returns None when msgspec is not installed.
+    """
+    if cls in _ROW_DECODERS:
+        return _ROW_DECODERS[cls]
+
+    try:
+        import msgspec  # noqa: PLC0415
+    except ImportError:
+        _ROW_DECODERS[cls] = None
+        return None
+
+    mapping = aliases(cls)
+    row = msgspec.defstruct(
+        f"{cls.__name__}Row",
+        [(name, Any, None) for name in mapping],
+        rename=mapping,
+        gc=False,
+    )
+    decode = msgspec.json.Decoder(list[row] | row).decode  # type: ignore[valid-type]
+    astuple = msgspec.structs.astuple
+
+    def decode_rows(payload: bytes) -> list[tuple[Any, ...]]:
+        data = decode(payload)
+        if not isinstance(data, list):
+            data = [data]
+        return [astuple(item) for item in data]
+
+    _ROW_DECODERS[cls] = decode_rows
+    return decode_rows
+
+
+class Record:
+    """Base class for FMP records."""
+
+    __slots__ = ()
+
+    # FMP endpoint the record is returned by
+    ENDPOINT: ClassVar[str]
+    # Whether the endpoint takes period and limit parameters
+    PERIODIC: ClassVar[bool] = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Self":
+        """Build a record from a decoded FMP row, ignoring unknown fields."""
+        return cls(**{name: data.get(key) for name, key in aliases(cls).items()})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]]) -> "list[Self]":
+        """Build records from decoded FMP rows."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
+
+    @classmethod
+    def decode(cls, payload: bytes) -> "list[Self]":
+        """Decode records from a raw FMP response body.
+
+        With msgspec installed the body is decoded straight into field values;
+        otherwise it is decoded into dicts first.
+        """
+        decode_rows = row_decoder(cls)
+        if decode_rows is None:
+            data = loads(payload)
+            return cls.from_rows(data if isinstance(data, list) else [data])
+        return [cls(*values) for values in decode_rows(payload)]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the row as a dict keyed by FMP field names."""
+        return {key: getattr(self, name) for name, key in aliases(type(self)).items()}
+
+
+@dataclass(slots=True)
+class Profile(Record):
+    """Company profile."""
+
+    ENDPOINT: ClassVar[str] = "profile"
+
+    symbol: str | None = None
+    price: float | None = None
+    market_cap: float | None = None
+    beta: float | None = None
+    last_dividend: float | None = None
+    range: str | None = None
+    change: float | None = None
+    change_percentage: float | None = None
+    volume: float | None = None
+    average_volume: float | None = None
+    company_name: str | None = None
+    currency: str | None = None
+    cik: str | None = None
+    isin: str | None = None
+    cusip: str | None = None
+    exchange_full_name: str | None = None
+    exchange: str | None = None
+    industry: str | None = None
+    website: str | None = None
+    description: str | None = None
+    ceo: str | None = None
+    sector: str | None = None
+    country: str | None = None
+    full_time_employees: str | None = None
+    phone: str | None = None
+    address: str | None = None
+    city: str | None = None
+    state: str | None = None
+    zip: str | None = None
+    image: str | None = None
+    ipo_date: str | None = None
+    default_image: bool | None = None
+    is_etf: bool | None = None
+    is_actively_trading: bool | None = None
+    is_adr: bool | None = None
+    is_fund: bool | None = None
+
+
+@dataclass(slots=True)
+class Quote(Record):
+    """Real-time stock quote."""
+
+    ENDPOINT: ClassVar[str] = "quote"
+
+    symbol: str | None = None
+    name: str | None = None
+    price: float | None = None
+    change_percentage: float | None = None
+    change: float | None = None
+    volume: float | None = None
+    day_low: float | None = None
+    day_high: float | None = None
+    year_high: float | None = None
+    year_low: float | None = None
+    market_cap: float | None = None
+    price_avg50: float | None = None
+    price_avg200: float | None = None
+    exchange: str | None = None
+    open: float | None = None
+    previous_close: float | None = None
+    timestamp: float | None = None
+
+
+@dataclass(slots=True)
+class PeriodRecord(Record):
+    """Fields shared by all per-period records."""
+
+    PERIODIC: ClassVar[bool] = True
+
+    symbol: str | None = None
+    date: str | None = None
+    fiscal_year: str | None = None
+    period: str | None = None
+    reported_currency: str | None = None
+
+
+@dataclass(slots=True)
+class Statement(PeriodRecord):
+    """Fields shared by the financial statements."""
+
+    cik: str | None = None
+    filing_date: str | None = None
+    accepted_date: str | None = None
+
+
+@dataclass(slots=True)
+class IncomeStatement(Statement):
+    """Income statement for one period."""
+
+    ENDPOINT: ClassVar[str] = "income-statement"
+
+    revenue: float | None = None
+    cost_of_revenue: float | None = None
+    gross_profit: float | None = None
+    research_and_development_expenses: float | None = None
+    general_and_administrative_expenses: float | None = None
+    selling_and_marketing_expenses: float | None = None
+    selling_general_and_administrative_expenses: float | None = None
+    other_expenses: float | None = None
+    operating_expenses: float | None = None
+    cost_and_expenses: float | None = None
+    net_interest_income: float | None = None
+    interest_income: float | None = None
+    interest_expense: float | None = None
+    depreciation_and_amortization: float | None = None
+    ebitda: float | None = None
+    ebit: float | None = None
+    non_operating_income_excluding_interest: float | None = None
+    operating_income: float | None = None
+    total_other_income_expenses_net: float | None = None
+    income_before_tax: float | None = None
+    income_tax_expense: float | None = None
+    net_income_from_continuing_operations: float | None = None
+    net_income_from_discontinued_operations: float | None = None
+    other_adjustments_to_net_income: float | None = None
+    net_income: float | None = None
+    net_income_deductions: float | None = None
+    bottom_line_net_income: float | None = None
+    eps: float | None = None
+    eps_diluted: float | None = None
+    weighted_average_shs_out: float | None = None
+    weighted_average_shs_out_dil: float | None = None
+
+
+@dataclass(slots=True)
+class BalanceSheet(Statement):
+    """Balance sheet statement for one period."""
+
+    ENDPOINT: ClassVar[str] = "balance-sheet-statement"
+
+    cash_and_cash_equivalents: float | None = None
+    short_term_investments: float | None = None
+    cash_and_short_term_investments: float | None = None
+    net_receivables: float | None = None
+    accounts_receivables: float | None = None
+    other_receivables: float | None = None
+    inventory: float | None = None
+    prepaids: float | None = None
+    other_current_assets: float | None = None
+    total_current_assets: float | None = None
+    property_plant_equipment_net: float | None = None
+    goodwill: float | None = None
+    intangible_assets: float | None = None
+    goodwill_and_intangible_assets: float | None = None
+    long_term_investments: float | None = None
+    tax_assets: float | None = None
+    other_non_current_assets: float | None = None
+    total_non_current_assets: float | None = None
+    other_assets: float | None = None
+    total_assets: float | None = None
+    total_payables: float | None = None
+    account_payables: float | None = None
+    other_payables: float | None = None
+    accrued_expenses: float | None = None
+    short_term_debt: float | None = None
+    capital_lease_obligations_current: float | None = None
+    tax_payables: float | None = None
+    deferred_revenue: float | None = None
+    other_current_liabilities: float | None = None
+    total_current_liabilities: float | None = None
+    long_term_debt: float | None = None
+    deferred_revenue_non_current: float | None = None
+    deferred_tax_liabilities_non_current: float | None = None
+    other_non_current_liabilities: float | None = None
+    total_non_current_liabilities: float | None = None
+    other_liabilities: float | None = None
+    capital_lease_obligations: float | None = None
+    total_liabilities: float | None = None
+    treasury_stock: float | None = None
+    preferred_stock: float | None = None
+    common_stock: float | None = None
+    retained_earnings: float | None = None
+    additional_paid_in_capital: float | None = None
+    accumulated_other_comprehensive_income_loss: float | None = None
+    other_total_stockholders_equity: float | None = None
+    total_stockholders_equity: float | None = None
+    total_equity: float | None = None
+    minority_interest: float | None = None
+    total_liabilities_and_total_equity: float | None = None
+    total_investments: float | None = None
+    total_debt: float | None = None
+    net_debt: float | None = None
+
+
+@dataclass(slots=True)
+class CashFlowStatement(Statement):
+    """Cash flow statement for one period."""
+
+    ENDPOINT: ClassVar[str] = "cash-flow-statement"
+
+    net_income: float | None = None
+    depreciation_and_amortization: float | None = None
+    deferred_income_tax: float | None = None
+    stock_based_compensation: float | None = None
+    change_in_working_capital: float | None = None
+    accounts_receivables: float | None = None
+    inventory: float | None = None
+    accounts_payables: float | None = None
+    other_working_capital: float | None = None
+    other_non_cash_items: float | None = None
+    net_cash_provided_by_operating_activities: float | None = None
+    investments_in_property_plant_and_equipment: float | None = None
+    acquisitions_net: float | None = None
+    purchases_of_investments: float | None = None
+    sales_maturities_of_investments: float | None = None
+    other_investing_activities: float | None = None
+    net_cash_provided_by_investing_activities: float | None = None
+    net_debt_issuance: float | None = None
+    long_term_net_debt_issuance: float | None = None
+    short_term_net_debt_issuance: float | None = None
+    net_stock_issuance: float | None = None
+    net_common_stock_issuance: float | None = None
+    common_stock_issuance: float | None = None
+    common_stock_repurchased: float | None = None
+    net_preferred_stock_issuance: float | None = None
+    net_dividends_paid: float | None = None
+    common_dividends_paid: float | None = None
+    preferred_dividends_paid: float | None = None
+    other_financing_activities: float | None = None
+    net_cash_provided_by_financing_activities: float | None = None
+    effect_of_forex_changes_on_cash: float | None = None
+    net_change_in_cash: float | None = None
+    cash_at_end_of_period: float | None = None
+    cash_at_beginning_of_period: float | None = None
+    operating_cash_flow: float | None = None
+    capital_expenditure: float | None = None
+    free_cash_flow: float | None = None
+    income_taxes_paid: float | None = None
+    interest_paid: float | None = None
+
+
+@dataclass(slots=True)
+class KeyMetrics(PeriodRecord):
+    """Key financial metrics for one period."""
+
+    ENDPOINT: ClassVar[str] = "key-metrics"
+
+    market_cap: float | None = None
+    enterprise_value: float | None = None
+    ev_to_sales: float | None = None
+    ev_to_operating_cash_flow: float | None = None
+    ev_to_free_cash_flow: float | None = None
+    ev_to_ebitda: float | None = field(default=None, metadata={"alias": "evToEBITDA"})
+    net_debt_to_ebitda: float | None = field(
+        default=None,
+        metadata={"alias": "netDebtToEBITDA"},
+    )
+    current_ratio: float | None = None
+    income_quality: float | None = None
+    graham_number: float | None = None
+    graham_net_net: float | None = None
+    tax_burden: float | None = None
+    interest_burden: float | None = None
+    working_capital: float | None = None
+    invested_capital: float | None = None
+    return_on_assets: float | None = None
+    operating_return_on_assets: float | None = None
+    return_on_tangible_assets: float | None = None
+    return_on_equity: float | None = None
+    return_on_invested_capital: float | None = None
+    return_on_capital_employed: float | None = None
+    earnings_yield: float | None = None
+    free_cash_flow_yield: float | None = None
+    capex_to_operating_cash_flow: float | None = None
+    capex_to_depreciation: float | None = None
+    capex_to_revenue: float | None = None
+    sales_general_and_administrative_to_revenue: float | None = None
+    research_and_developement_to_revenue: float | None = None
+    stock_based_compensation_to_revenue: float | None = None
+    intangibles_to_total_assets: float | None = None
+    average_receivables: float | None = None
+    average_payables: float | None = None
+    average_inventory: float | None = None
+    days_of_sales_outstanding: float | None = None
+    days_of_payables_outstanding: float | None = None
+    days_of_inventory_outstanding: float | None = None
+    operating_cycle: float | None = None
+    cash_conversion_cycle: float | None = None
+    free_cash_flow_to_equity: float | None = None
+    free_cash_flow_to_firm: float | None = None
+    tangible_asset_value: float | None = None
+    net_current_asset_value: float | None = None
+
+
+@dataclass(slots=True)
+class FinancialRatios(PeriodRecord):
+    """Financial ratios for one period."""
+
+    ENDPOINT: ClassVar[str] = "ratios"
+
+    gross_profit_margin: float | None = None
+    ebit_margin: float | None = None
+    ebitda_margin: float | None = None
+    operating_profit_margin: float | None = None
+    pretax_profit_margin: float | None = None
+    continuous_operations_profit_margin: float | None = None
+    net_profit_margin: float | None = None
+    bottom_line_profit_margin: float | None = None
+    receivables_turnover: float | None = None
+    payables_turnover: float | None = None
+    inventory_turnover: float | None = None
+    fixed_asset_turnover: float | None = None
+    asset_turnover: float | None = None
+    current_ratio: float | None = None
+    quick_ratio: float | None = None
+    solvency_ratio: float | None = None
+    cash_ratio: float | None = None
+    price_to_earnings_ratio: float | None = None
+    price_to_earnings_growth_ratio: float | None = None
+    forward_price_to_earnings_growth_ratio: float | None = None
+    price_to_book_ratio: float | None = None
+    price_to_sales_ratio: float | None = None
+    price_to_free_cash_flow_ratio: float | None = None
+    price_to_operating_cash_flow_ratio: float | None = None
+    debt_to_assets_ratio: float | None = None
+    debt_to_equity_ratio: float | None = None
+    debt_to_capital_ratio: float | None = None
+    long_term_debt_to_capital_ratio: float | None = None
+    financial_leverage_ratio: float | None = None
+    working_capital_turnover_ratio: float | None = None
+    operating_cash_flow_ratio: float | None = None
+    operating_cash_flow_sales_ratio: float | None = None
+    free_cash_flow_operating_cash_flow_ratio: float | None = None
+    debt_service_coverage_ratio: float | None = None
+    interest_coverage_ratio: float | None = None
+    short_term_operating_cash_flow_coverage_ratio: float | None = None
+    operating_cash_flow_coverage_ratio: float | None = None
+    capital_expenditure_coverage_ratio: float | None = None
+    dividend_paid_and_capex_coverage_ratio: float | None = None
+    dividend_payout_ratio: float | None = None
+    dividend_yield: float | None = None
+    dividend_yield_percentage: float | None = None
+    revenue_per_share: float | None = None
+    net_income_per_share: float | None = None
+    interest_debt_per_share: float | None = None
+    cash_per_share: float | None = None
+    book_value_per_share: float | None = None
+    tangible_book_value_per_share: float | None = None
+    shareholders_equity_per_share: float | None = None
+    operating_cash_flow_per_share: float | None = None
+    capex_per_share: float | None = None
+    free_cash_flow_per_share: float | None = None
+    net_income_per_ebt: float | None = field(
+        default=None,
+        metadata={"alias": "netIncomePerEBT"},
+    )
+    ebt_per_ebit: float | None = None
+    price_to_fair_value: float | None = None
+    debt_to_market_cap: float | None = None
+    effective_tax_rate: float | None = None
+    enterprise_value_multiple: float | None = None
+    dividend_per_share: float | None = None
@@ -0,0 +1,61 @@
+"""Shaping of tool results before they are serialized."""
+
+from collections.abc import Sequence
+from typing import Any, Literal
+
+OutputFormat = Literal["rows", "columnar"]
+
+# Keys kept by a projection so that rows stay identifiable
+ID_FIELDS = ("symbol", "date")
+# Keys marking rows served from the cache past their TTL, also always kept
+STALE_FIELDS = ("stale", "ageSeconds")
+
+
+def project(rows: list[dict[str, Any]], fields: Sequence[str] | None) -> list[dict]:
+    """Keep only ``fields`` (and ``ID_FIELDS`` and ``STALE_FIELDS``) in each row.
+
+    Rows are copied rather than modified, since they may be shared with the
+    client's caches. Requested fields that a row lacks are left out.
+    """
+    if not fields:
+        return rows
+    keep = list(dict.fromkeys([*ID_FIELDS, *fields, *STALE_FIELDS]))
+    return [{key: row[key] for key in keep if key in row} for row in rows]
+
+
+def mark_stale(data: Any, age: float | None = None) -> Any:
+    """Copy a response with each row marked stale, with its age in seconds."""
+    marker: dict[str, Any] = {"stale": True}
+    if age is not None:
+        marker["ageSeconds"] = round(age, 1)
+    if isinstance(data, dict):
+        return {**data, **marker}
+    if isinstance(data, list):
+        return [{**row, **marker} if isinstance(row, dict) else row for row in data]
+    return data
+
+
+def to_columnar(rows: list[dict[str, Any]]) -> dict[str, list]:
+    """Convert rows to a table with each key named once.
+
+    Returns:
+        ``{"columns": [...], "index": [...], "data": [[...], ...]}`` where
+        ``index`` holds each row's date and ``data`` one list of values per
+        row, in ``columns`` order, with None for keys a row lacks
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row if key != "date"))
+    return {
+        "columns": columns,
+        "index": [row.get("date") for row in rows],
+        "data": [[row.get(key) for key in columns] for row in rows],
+    }
+
+
+def shape(
+    rows: list[dict[str, Any]],
+    fields: Sequence[str] | None = None,
+    output_format: OutputFormat = "rows",
+) -> list[dict] | dict[str, list]:
+    """Project rows and convert them to the requested output format."""
+    rows = project(rows, fields)
+    return to_columnar(rows) if output_format == "columnar" else rows
@@ -0,0 +1,129 @@
+"""Client-side rate limiting for FMP API requests."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+
+class RateLimitExceededError(Exception):
+    """Raised when the daily request cap has been used up."""
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters describing rate limiter queueing."""
+
+    acquired: int = 0
+    queued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+    daily_used: int = 0
+
+    @property
+    def average_wait(self) -> float:
+        """Mean time in seconds a request spent waiting for a token."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+class RateLimiter:
+    """Async token bucket that queues requests instead of rejecting them.
+
+    Requests are served first come, first served. Each one takes a token from a
+    bucket refilled at ``requests_per_minute / 60`` tokens per second and holding
+    at most ``burst`` tokens, so bursts of parallel calls are smoothed to the
+    configured budget. An optional daily cap rejects requests once used up.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        requests_per_minute: float,
+        burst: int | None = None,
+        daily_limit: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        today: Callable[[], date] = _utc_today,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Sustained request budget
+            burst: Bucket capacity (defaults to one second worth of requests)
+            daily_limit: Maximum requests per UTC day, or None for no cap
+            clock: Monotonic time source
+            sleep: Coroutine used to wait for tokens
+            today: Source of the current UTC date for the daily cap
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst or max(1, round(self.rate)))
+        self.daily_limit = daily_limit
+        self._clock = clock
+        self._sleep = sleep
+        self._today = today
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._day = today()
+        self._lock = asyncio.Lock()
+        self._stats = RateLimiterStats()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+    def _reserve_daily(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._stats.daily_used = 0
+
+        if self.daily_limit is not None and self._stats.daily_used >= self.daily_limit:
+            raise RateLimitExceededError(
+                f"Daily FMP request limit of {self.daily_limit} reached",
+            )
+        self._stats.daily_used += 1
+
+    async def acquire(self) -> float:
+        """Wait for a request slot.
+
+        Returns:
+            Seconds spent waiting in the queue
+
+        Raises:
+            RateLimitExceededError: If the daily cap has been reached
+        """
+        start = self._clock()
+        self._stats.queued += 1
+        try:
+            async with self._lock:
+                self._reserve_daily()
+                self._refill()
+                while self._tokens < 1:
+                    await self._sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._stats.queued -= 1
+
+        waited = self._clock() - start
+        self._stats.acquired += 1
+        self._stats.total_wait += waited
+        self._stats.max_wait = max(self._stats.max_wait, waited)
+        self._stats.last_wait = waited
+        return waited
+
+    def stats(self) -> RateLimiterStats:
+        """Get a snapshot of the limiter counters."""
+        return RateLimiterStats(**vars(self._stats))
@@ -0,0 +1,258 @@
+"""Financial ratios computed locally from statement histories.
+
+The ratios are derived from income, balance sheet and cash flow figures with
+NumPy, for every period of every symbol at once, so they cost no FMP calls
+beyond the (cached) statements. Output fields use FMP's names from the
+``ratios`` and ``key-metrics`` endpoints.
+
+Requires the ``analytics`` extra (NumPy).
+"""
+
+import asyncio
+import math
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from .frame import FloatArray, StatementFrame, fetch_statement_frame
+
+if TYPE_CHECKING:
+    from .client import FMPClient
+
+Items = Mapping[str, FloatArray]
+Formula = Callable[[Items], FloatArray]
+RatioKind = Literal["ratios", "key-metrics"]
+
+
+def _div(numerator: FloatArray, denominator: FloatArray) -> FloatArray:
+    """Element-wise division with NaN wherever the result is not finite."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.divide(numerator, denominator)
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+def _per_share(field: str) -> Formula:
+    return lambda x: _div(x[field], x["weightedAverageShsOutDil"])
+
+
+def _to_revenue(field: str) -> Formula:
+    return lambda x: _div(x[field], x["revenue"])
+
+
+def _invested_capital(x: Items) -> FloatArray:
+    return x["totalDebt"] + x["totalStockholdersEquity"] - x["cashAndCashEquivalents"]
+
+
+RATIO_FORMULAS: dict[str, Formula] = {
+    "grossProfitMargin": _to_revenue("grossProfit"),
+    "ebitdaMargin": _to_revenue("ebitda"),
+    "operatingProfitMargin": _to_revenue("operatingIncome"),
+    "pretaxProfitMargin": _to_revenue("incomeBeforeTax"),
+    "netProfitMargin": _to_revenue("netIncome"),
+    "assetTurnover": lambda x: _div(x["revenue"], x["totalAssets"]),
+    "currentRatio": lambda x: _div(
+        x["totalCurrentAssets"],
+        x["totalCurrentLiabilities"],
+    ),
+    "quickRatio": lambda x: _div(
+        x["cashAndShortTermInvestments"] + x["netReceivables"],
+        x["totalCurrentLiabilities"],
+    ),
+    "cashRatio": lambda x: _div(
+        x["cashAndCashEquivalents"],
+        x["totalCurrentLiabilities"],
+    ),
+    "debtToAssetsRatio": lambda x: _div(x["totalDebt"], x["totalAssets"]),
+    "debtToEquityRatio": lambda x: _div(x["totalDebt"], x["totalStockholdersEquity"]),
+    "financialLeverageRatio": lambda x: _div(
+        x["totalAssets"],
+        x["totalStockholdersEquity"],
+    ),
+    "interestCoverageRatio": lambda x: _div(x["operatingIncome"], x["interestExpense"]),
+    "effectiveTaxRate": lambda x: _div(x["incomeTaxExpense"], x["incomeBeforeTax"]),
+    "operatingCashFlowSalesRatio": _to_revenue("operatingCashFlow"),
+    "freeCashFlowOperatingCashFlowRatio": lambda x: _div(
+        x["freeCashFlow"],
+        x["operatingCashFlow"],
+    ),
+    "revenuePerShare": _per_share("revenue"),
+    "netIncomePerShare": _per_share("netIncome"),
+    "bookValuePerShare": _per_share("totalStockholdersEquity"),
+    "cashPerShare": _per_share("cashAndShortTermInvestments"),
+    "operatingCashFlowPerShare": _per_share("operatingCashFlow"),
+    "freeCashFlowPerShare": _per_share("freeCashFlow"),
+    "capexPerShare": _per_share("capitalExpenditure"),
+}
+
+KEY_METRIC_FORMULAS: dict[str, Formula] = {
+    "returnOnEquity": lambda x: _div(x["netIncome"], x["totalStockholdersEquity"]),
+    "returnOnAssets": lambda x: _div(x["netIncome"], x["totalAssets"]),
+    "returnOnInvestedCapital": lambda x: _div(
+        x["operatingIncome"] * (1 - _div(x["incomeTaxExpense"], x["incomeBeforeTax"])),
+        _invested_capital(x),
+    ),
+    "investedCapital": _invested_capital,
+    "currentRatio": RATIO_FORMULAS["currentRatio"],
+    "workingCapital": lambda x: x["totalCurrentAssets"] - x["totalCurrentLiabilities"],
+    "netDebtToEBITDA": lambda x: _div(x["netDebt"], x["ebitda"]),
+    "incomeQuality": lambda x: _div(x["operatingCashFlow"], x["netIncome"]),
+    "capexToOperatingCashFlow": lambda x: _div(
+        -x["capitalExpenditure"],
+        x["operatingCashFlow"],
+    ),
+    "capexToRevenue": lambda x: _div(-x["capitalExpenditure"], x["revenue"]),
+    "capexToDepreciation": lambda x: _div(
+        -x["capitalExpenditure"],
+        x["depreciationAndAmortization"],
+    ),
+    "researchAndDevelopementToRevenue": _to_revenue("researchAndDevelopmentExpenses"),
+    "stockBasedCompensationToRevenue": _to_revenue("stockBasedCompensation"),
+}
+
+# Key metrics that need the current market capitalization
+MARKET_FORMULAS: dict[str, Formula] = {
+    "marketCap": lambda x: x["marketCap"],
+    "earningsYield": lambda x: _div(x["netIncome"], x["marketCap"]),
+    "freeCashFlowYield": lambda x: _div(x["freeCashFlow"], x["marketCap"]),
+}
+
+INPUT_FIELDS = (
+    "revenue",
+    "grossProfit",
+    "ebitda",
+    "operatingIncome",
+    "incomeBeforeTax",
+    "incomeTaxExpense",
+    "interestExpense",
+    "netIncome",
+    "researchAndDevelopmentExpenses",
+    "depreciationAndAmortization",
+    "weightedAverageShsOutDil",
+    "totalAssets",
+    "totalCurrentAssets",
+    "totalCurrentLiabilities",
+    "cashAndCashEquivalents",
+    "cashAndShortTermInvestments",
+    "netReceivables",
+    "totalDebt",
+    "netDebt",
+    "totalStockholdersEquity",
+    "operatingCashFlow",
+    "capitalExpenditure",
+    "freeCashFlow",
+    "stockBasedCompensation",
+)
+
+
+def stack_frames(
+    frames: Sequence[StatementFrame],
+    fields: Sequence[str] = INPUT_FIELDS,
+) -> dict[str, FloatArray]:
+    """Stack frames into one (symbols x periods) array per line item.
+
+    Histories are aligned on their most recent period, so column -1 holds each
+    symbol's latest figures; shorter histories are padded with NaN on the left.
+    """
+    width = max((len(frame) for frame in frames), default=0)
+    items = {name: np.full((len(frames), width), np.nan) for name in fields}
+    for row, frame in enumerate(frames):
+        if not len(frame):
+            continue
+        for name in fields:
+            if name in frame:
+                items[name][row, width - len(frame) :] = frame[name]
+    return items
+
+
+def compute_ratios(
+    items: Items,
+    kind: RatioKind = "ratios",
+) -> dict[str, FloatArray]:
+    """Evaluate ratio formulas over arrays of line items.
+
+    Args:
+        items: Line item arrays of any matching shape; a ``marketCap`` array
+            enables the market-based key metrics
+        kind: Which FMP endpoint's ratios to compute
+
+    Returns:
+        Ratio arrays keyed by FMP field name
+    """
+    formulas = dict(RATIO_FORMULAS if kind == "ratios" else KEY_METRIC_FORMULAS)
+    if kind == "key-metrics" and "marketCap" in items:
+        formulas.update(MARKET_FORMULAS)
+    return {name: formula(items) for name, formula in formulas.items()}
+
+
+def local_ratios(
+    frames: Sequence[StatementFrame],
+    kind: RatioKind = "ratios",
+    market_caps: Mapping[str, float] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Compute ratios for many symbols in one vectorized pass.
+
+    Args:
+        frames: Joined statement frames, one per symbol
+        kind: Which FMP endpoint's ratios to compute
+        market_caps: Current market capitalization per symbol; market-based
+            key metrics are only reported for each symbol's latest period
+
+    Returns:
+        FMP-style rows, newest first, keyed by symbol
+    """
+    items = stack_frames(frames)
+    if kind == "key-metrics" and market_caps is not None:
+        market_cap = np.full_like(items["revenue"], np.nan)
+        if market_cap.size:
+            market_cap[:, -1] = [
+                market_caps.get(frame.symbol or "", np.nan) for frame in frames
+            ]
+        items = {**items, "marketCap": market_cap}
+
+    ratios = {
+        name: values.tolist() for name, values in compute_ratios(items, kind).items()
+    }
+    width = items["revenue"].shape[1]
+    results: dict[str, list[dict[str, Any]]] = {}
+    for row, frame in enumerate(frames):
+        dates = frame.dates.astype(str).tolist()
+        rows = []
+        for j in range(len(frame) - 1, -1, -1):
+            column = width - len(frame) + j
+            record: dict[str, Any] = {"symbol": frame.symbol, "date": dates[j]}
+            for name, values in ratios.items():
+                value = values[row][column]
+                record[name] = None if math.isnan(value) else value
+            rows.append(record)
+        results[frame.symbol or str(row)] = rows
+    return results
+
+
+async def fetch_local_ratios(
+    client: "FMPClient",
+    symbols: Sequence[str],
+    kind: RatioKind = "ratios",
+    period: str = "annual",
+    limit: int = 5,
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch statements for several symbols and compute their ratios locally.
+
+    Statements come through the client's caches. Key metrics also fetch
+    current market capitalizations with batched quotes.
+    """
+    frames = await asyncio.gather(
+        *(fetch_statement_frame(client, s, period, limit) for s in symbols),
+    )
+    market_caps = None
+    if kind == "key-metrics":
+        quotes = await client.get_quotes(list(symbols))
+        market_caps = {
+            str(q["symbol"]).upper(): q["marketCap"]
+            for q in quotes
+            if q.get("marketCap") is not None
+        }
+    for frame, symbol in zip(frames, symbols, strict=True):
+        frame.symbol = (frame.symbol or symbol).upper()
+    return local_ratios(frames, kind, market_caps)
@@ -0,0 +1,132 @@
+"""Retry policy for transient FMP API failures."""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+# HTTP statuses worth retrying: throttling and transient upstream errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one, so during
+    an outage retries add at most ``ratio`` extra load instead of multiplying it.
+    A small reserve keeps retries available at low traffic.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0):
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per request on average
+            reserve: Initial and maximum number of stored retry tokens
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+
+    def record_request(self) -> None:
+        """Credit the budget for a first attempt."""
+        self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take a token for a retry, returning False if the budget is spent."""
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+    @property
+    def balance(self) -> float:
+        """Retry tokens currently available."""
+        return self._balance
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter that honors Retry-After."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        max_retry_after: float = 30.0,
+        budget: RetryBudget | None = None,
+        rng: random.Random | None = None,
+    ):
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum retries per request (0 disables retrying)
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Upper bound on the backoff ceiling, in seconds
+            max_retry_after: Longest Retry-After delay worth waiting for; the
+                error is raised instead when the server asks for more
+            budget: Shared retry budget (defaults to a new RetryBudget)
+            rng: Random source for jitter
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget or RetryBudget()
+        self._rng = rng or random.Random()
+
+    def backoff(self, attempt: int) -> float:
+        """Get a jittered delay before retry number ``attempt + 1``."""
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        return self._rng.uniform(0, ceiling)
+
+    def retry_delay(self, error: Exception, attempt: int) -> float | None:
+        """Decide whether a failed attempt should be retried.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code not in RETRYABLE_STATUS_CODES:
+                return None
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+        elif isinstance(error, httpx.TransportError):
+            retry_after = None
+        else:
+            return None
+
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if not self.budget.try_spend():
+            return None
+        return self.backoff(attempt) if retry_after is None else retry_after
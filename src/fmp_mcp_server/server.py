@@ -1,126 +1,397 @@
 """MCP server for Financial Modelling Prep API using FastMCP."""
 
-from typing import Literal, Optional
+import asyncio
+import os
+import sys
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import Field
 
+from . import metrics, tracing
+from .bulk import Dataset, fetch_bulk
 from .client import FMPClient
+from .output import OutputFormat, project, shape
 
-# Initialize FastMCP server
-mcp = FastMCP(
-    "fmp",
-    instructions="A server that provides tools to access the Financial Modelling Prep API."
-)
+if TYPE_CHECKING:
+    from .ttm import TTMEngine
 
-# Global FMPClient instance, initialized on first use
-fmp_client: Optional[FMPClient] = None
+# Global FMPClient instance, shared by all sessions and initialized on first use
+fmp_client: FMPClient | None = None
+_client_lock = asyncio.Lock()
+_client_users = 0
+_warmup_task: "asyncio.Task[None] | None" = None
+# TTM results per symbol, kept across calls to extend them incrementally
+_ttm_engine: "TTMEngine | None" = None
 
 
 async def get_client() -> FMPClient:
     """Get or create the FMPClient instance."""
-    global fmp_client
+    global fmp_client, _warmup_task
     if fmp_client is None:
-        fmp_client = FMPClient()
+        async with _client_lock:
+            if fmp_client is None:
+                client = FMPClient()
+                # Open the upstream connection without holding up startup
+                _warmup_task = asyncio.create_task(client.warmup())
+                fmp_client = client
     return fmp_client
 
 
+async def close_client() -> None:
+    """Close the shared FMPClient instance, if any."""
+    global fmp_client, _warmup_task
+    async with _client_lock:
+        client, fmp_client = fmp_client, None
+        warmup, _warmup_task = _warmup_task, None
+    if warmup is not None:
+        warmup.cancel()
+    if client is not None:
+        await client.close()
+
+
+@asynccontextmanager
+async def client_lifespan(_server: FastMCP) -> AsyncIterator[FMPClient]:
+    """Create the shared client at startup and close it after the last user."""
+    global _client_users
+    client = await get_client()
+    _client_users += 1
+    try:
+        yield client
+    finally:
+        _client_users -= 1
+        if _client_users == 0:
+            await close_client()
+            await _shutdown_workers()
+
+
+async def _shutdown_workers() -> None:
+    """Stop the DCF process pool if a simulation started it."""
+    dcf = sys.modules.get(f"{__package__}.dcf")
+    if dcf is not None:
+        await asyncio.to_thread(dcf.shutdown_pool)
+
+
+Fields = Annotated[
+    list[str] | None,
+    Field(
+        description="Only return these keys in each row "
+        "(symbol and date are always kept), e.g. ['revenue', 'netIncome']",
+    ),
+]
+
+Format = Annotated[
+    OutputFormat,
+    Field(
+        description="'columnar' returns {columns, index, data} with each key "
+        "named once and dates as the index, instead of one object per period",
+    ),
+]
+
+
+class InstrumentedFastMCP(FastMCP):
+    """FastMCP recording the duration, outcome and trace of every tool call."""
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+    ) -> Sequence[Any] | dict[str, Any]:
+        """Call a tool by name with arguments."""
+        # Unknown names are not used as labels, to keep the label set bounded
+        label = name if self._tool_manager.get_tool(name) else "unknown"
+        attributes = {
+            "mcp.tool.name": label,
+            "fmp.symbol": arguments.get("symbol") or arguments.get("symbols"),
+        }
+        with (
+            metrics.track_tool(label),
+            tracing.span(f"tools/call {label}", attributes),
+        ):
+            return await super().call_tool(name, arguments)
+
+
+if os.getenv("FMP_METRICS_PORT"):
+    metrics.enable()
+if os.getenv("FMP_TRACING"):
+    tracing.enable(os.environ["FMP_TRACING"])
+
+# Initialize FastMCP server
+mcp = InstrumentedFastMCP(
+    "fmp",
+    instructions="A server that provides tools to access the Financial Modelling Prep API.",
+    lifespan=client_lifespan,
+)
+
+
 @mcp.tool()
-async def get_company_profile(symbol: str) -> list[dict]:
+async def get_company_profile(symbol: str, fields: Fields = None) -> list[dict]:
     """
     Get comprehensive company profile information including business description,
-    sector, industry, and key metrics.
+    sector, industry, and key metrics. A recently expired profile may be returned
+    with "stale": true and its "ageSeconds" while it is refreshed.
     """
     client = await get_client()
-    return await client.get_company_profile(symbol)
+    return project(await client.get_company_profile(symbol), fields)
 
 
 @mcp.tool()
-async def get_stock_quote(symbol: str) -> list[dict]:
+async def get_stock_quote(symbol: str, fields: Fields = None) -> list[dict]:
     """
     Get real-time stock quote with current price, volume, and market data.
+    A quote up to a few minutes old may be returned with "stale": true and its
+    "ageSeconds" while a fresh one is fetched; call again for the fresh quote.
+    """
+    client = await get_client()
+    return project(await client.get_quote(symbol), fields)
+
+
+@mcp.tool()
+async def get_stock_quotes(symbols: list[str], fields: Fields = None) -> list[dict]:
+    """
+    Get real-time stock quotes for several symbols at once, in the order given.
+    Prefer this over repeated get_stock_quote calls for watchlists and portfolios.
+    Quotes may be marked stale as in get_stock_quote.
     """
     client = await get_client()
-    return await client.get_quote(symbol)
+    return project(await client.get_quotes(symbols), fields)
 
 
 @mcp.tool()
-async def get_financial_statements(
+async def get_fundamentals_bulk(  # noqa: PLR0913
+    symbols: list[str],
+    ctx: Context,
+    datasets: list[Dataset] | None = None,
+    period: Literal["annual", "quarter"] = "annual",
+    limit: int = 5,
+    concurrency: int | None = None,
+    fields: Fields = None,
+) -> dict[str, dict]:
+    """
+    Get several datasets for up to 100 companies in one call.
+    Datasets: profile, quote, income, balance, cashflow, key_metrics, ratios,
+    dcf, scores (default: profile, key_metrics, income). Statement datasets use
+    `period` and `limit`. Returns {symbol: {dataset: data}} without null fields;
+    failed datasets are listed under "errors". Progress is reported per symbol.
+    """
+
+    async def on_progress(completed: int, total: int, symbol: str) -> None:
+        await ctx.report_progress(completed, total, f"Fetched {symbol}")
+
+    client = await get_client()
+    return await fetch_bulk(
+        client,
+        symbols,
+        datasets or ["profile", "key_metrics", "income"],
+        period,
+        limit,
+        concurrency,
+        on_progress,
+        fields,
+    )
+
+
+@mcp.tool()
+async def get_financial_statements(  # noqa: PLR0913
     symbol: str,
     statement_type: Literal["income", "balance", "cashflow"],
     period: Literal["annual", "quarter"] = "annual",
     limit: int = 5,
-) -> list[dict]:
+    fields: Fields = None,
+    format: Format = "rows",
+) -> list[dict] | dict[str, list]:
     """
     Get financial statements (income statement, balance sheet, cash flow) for a company.
     """
     client = await get_client()
     if statement_type == "income":
-        return await client.get_income_statement(symbol, period, limit)
-    if statement_type == "balance":
-        return await client.get_balance_sheet(symbol, period, limit)
-    if statement_type == "cashflow":
-        return await client.get_cash_flow(symbol, period, limit)
-    # This part should not be reached due to Literal type hint validation
-    raise ValueError(f"Invalid statement type: {statement_type}")
+        rows = await client.get_income_statement(symbol, period, limit)
+    elif statement_type == "balance":
+        rows = await client.get_balance_sheet(symbol, period, limit)
+    elif statement_type == "cashflow":
+        rows = await client.get_cash_flow(symbol, period, limit)
+    else:
+        # This part should not be reached due to Literal type hint validation
+        raise ValueError(f"Invalid statement type: {statement_type}")
+    return shape(rows, fields, format)
+
+
+async def _local_ratios(
+    kind: Literal["ratios", "key-metrics"],
+    symbol: str,
+    period: str,
+    limit: int,
+) -> list[dict]:
+    """Compute ratios from cached statements instead of calling FMP."""
+    try:
+        from .ratio_engine import fetch_local_ratios  # noqa: PLC0415
+    except ImportError as exc:
+        raise ValueError(
+            "source='local' requires NumPy; install the 'analytics' extra",
+        ) from exc
+
+    client = await get_client()
+    results = await fetch_local_ratios(client, [symbol], kind, period, limit)
+    return next(iter(results.values()), [])
 
 
 @mcp.tool()
-async def get_key_metrics(
+async def get_key_metrics(  # noqa: PLR0913
     symbol: str,
     period: Literal["annual", "quarter"] = "annual",
     limit: int = 5,
-) -> list[dict]:
+    source: Literal["fmp", "local"] = "fmp",
+    fields: Fields = None,
+    format: Format = "rows",
+) -> list[dict] | dict[str, list]:
     """
     Get key financial metrics and ratios for fundamental analysis.
+    With source="local", returns (ROE, ROA, ROIC), liquidity, capex and yield metrics
+    are computed from the financial statements without an extra FMP call
+    (yields use the current market cap and are given for the latest period only).
     """
-    client = await get_client()
-    return await client.get_key_metrics(symbol, period, limit)
+    if source == "local":
+        rows = await _local_ratios("key-metrics", symbol, period, limit)
+    else:
+        client = await get_client()
+        rows = await client.get_key_metrics(symbol, period, limit)
+    return shape(rows, fields, format)
 
 
 @mcp.tool()
-async def get_financial_ratios(
+async def get_financial_ratios(  # noqa: PLR0913
     symbol: str,
     period: Literal["annual", "quarter"] = "annual",
     limit: int = 5,
-) -> list[dict]:
+    source: Literal["fmp", "local"] = "fmp",
+    fields: Fields = None,
+    format: Format = "rows",
+) -> list[dict] | dict[str, list]:
     """
     Get comprehensive financial ratios for valuation and analysis.
+    With source="local", margins, liquidity, leverage, coverage and per-share
+    ratios are computed from the financial statements without an extra FMP call
+    (price-based ratios are omitted).
+    """
+    if source == "local":
+        rows = await _local_ratios("ratios", symbol, period, limit)
+    else:
+        client = await get_client()
+        rows = await client.get_financial_ratios(symbol, period, limit)
+    return shape(rows, fields, format)
+
+
+@mcp.tool()
+async def get_ttm_financials(
+    symbol: str,
+    limit: int = 4,
+    fields: Fields = None,
+    format: Format = "rows",
+) -> list[dict] | dict[str, list]:
     """
+    Get trailing-twelve-month (TTM) financials computed from quarterly statements.
+    Income and cash flow items are summed over the last four quarters, share
+    counts are averaged and balance sheet items are taken at the end of each window.
+    Returns one row per TTM period ending at each of the latest `limit` quarters.
+    """
+    global _ttm_engine
+    try:
+        from .ttm import TTMEngine, fetch_ttm  # noqa: PLC0415
+    except ImportError as exc:
+        raise ValueError(
+            "get_ttm_financials requires NumPy; install the 'analytics' extra",
+        ) from exc
+
+    if _ttm_engine is None:
+        _ttm_engine = TTMEngine()
     client = await get_client()
-    return await client.get_financial_ratios(symbol, period, limit)
+    return shape(await fetch_ttm(client, _ttm_engine, symbol, limit), fields, format)
 
 
 @mcp.tool()
-async def get_dcf_valuation(symbol: str) -> list[dict]:
+async def get_dcf_valuation(symbol: str, fields: Fields = None) -> list[dict]:
     """
     Get discounted cash flow valuation analysis.
     """
     client = await get_client()
-    return await client.get_dcf_valuation(symbol)
+    return project(await client.get_dcf_valuation(symbol), fields)
+
+
+@mcp.tool()
+async def simulate_dcf(  # noqa: PLR0913
+    # Bounds match dcf.MAX_SYMBOLS, MAX_SIMULATIONS and MAX_YEARS, which would
+    # need NumPy to import here
+    symbols: Annotated[list[str], Field(min_length=1, max_length=20)],
+    simulations: Annotated[int, Field(ge=1, le=10_000_000)] = 100_000,
+    years: Annotated[int, Field(ge=1, le=50)] = 5,
+    growth_mean: float | None = None,
+    growth_std: Annotated[float | None, Field(ge=0)] = None,
+    margin_mean: float | None = None,
+    margin_std: Annotated[float | None, Field(ge=0)] = None,
+    wacc_mean: float = 0.09,
+    wacc_std: Annotated[float, Field(ge=0)] = 0.01,
+    terminal_growth: float = 0.025,
+    seed: int | None = None,
+    fields: Fields = None,
+) -> list[dict]:
+    """
+    Run a Monte Carlo discounted cash flow valuation for one or more companies.
+    Revenue growth, free cash flow margin and WACC are drawn from normal
+    distributions; growth and margin default to the mean and standard deviation
+    of the last five annual periods. Returns percentile bands of intrinsic value
+    per share, the current price and the share of simulations above it.
+    Up to 20 symbols and 10,000,000 simulations in total per call.
+    """
+    try:
+        from . import dcf  # noqa: PLC0415
+    except ImportError as exc:
+        raise ValueError(
+            "simulate_dcf requires NumPy; install the 'analytics' extra",
+        ) from exc
+
+    client = await get_client()
+    results = await dcf.simulate_dcf(
+        client,
+        symbols,
+        simulations,
+        seed=seed,
+        years=years,
+        growth_mean=growth_mean,
+        growth_std=growth_std,
+        margin_mean=margin_mean,
+        margin_std=margin_std,
+        wacc_mean=wacc_mean,
+        wacc_std=wacc_std,
+        terminal_growth=terminal_growth,
+    )
+    return project(results, fields)
 
 
 @mcp.tool()
-async def search_companies(query: str, limit: int = 10) -> list[dict]:
+async def search_companies(
+    query: str,
+    limit: int = 10,
+    fields: Fields = None,
+) -> list[dict]:
     """
     Search for companies by name or symbol.
     """
     client = await get_client()
-    return await client.search_companies(query, limit)
+    return project(await client.search_companies(query, limit), fields)
 
 
 @mcp.tool()
-async def get_sector_performance() -> list[dict]:
+async def get_sector_performance(fields: Fields = None) -> list[dict]:
     """
     Get sector performance overview.
     """
     client = await get_client()
-    return await client.get_sector_performance()
+    return project(await client.get_sector_performance(), fields)
 
 
 if __name__ == "__main__":
-    # For stdio transport, FastMCP handles the lifecycle.
-    # The server runs until the client disconnects.
-    # Cleanup of the FMPClient is not explicitly handled here,
-    # as the process will terminate. For persistent servers (e.g., SSE),
-    # a more graceful shutdown hook for client.close() would be needed.
-    mcp.run()
+    from fmp_mcp_server.cli import main
+
+    main()
@@ -0,0 +1,234 @@
+"""Persistent on-disk cache for financial statement histories."""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .cache import DAY
+from .decoding import loads
+
+# Endpoints whose responses only change when a company files a new report
+PERSISTENT_ENDPOINTS = frozenset(
+    {
+        "income-statement",
+        "balance-sheet-statement",
+        "cash-flow-statement",
+        "key-metrics",
+        "ratios",
+    },
+)
+
+# Length of a reporting period and typical delay until its figures are filed
+PERIOD_DAYS = {"annual": 365, "quarter": 91}
+FILING_LAG_DAYS = {"annual": 90, "quarter": 45}
+
+# Bounds on how long a stored response is considered fresh
+MIN_FRESHNESS = DAY
+MAX_FRESHNESS = 30 * DAY
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    endpoint TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    period TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (endpoint, symbol, period)
+)
+"""
+
+
+@dataclass
+class StatementHistory:
+    """Stored periods of one statement for one symbol, newest first."""
+
+    rows: list[dict[str, Any]]
+    depth: int
+    complete: bool
+    expires_at: float
+
+    @property
+    def newest_date(self) -> date | None:
+        """Fiscal date of the most recent stored period."""
+        return latest_report_date(self.rows)
+
+    def covers(self, limit: int) -> bool:
+        """Check whether the history holds every period a request could return."""
+        return self.complete or self.depth >= limit
+
+
+def merge_periods(
+    older: list[dict[str, Any]],
+    newer: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Merge two lists of statement rows by fiscal date, newest first.
+
+    Rows in ``newer`` replace rows with the same date in ``older``, so restated
+    figures win.
+    """
+    by_date = {str(row.get("date")): row for row in older}
+    by_date.update((str(row.get("date")), row) for row in newer)
+    return [by_date[d] for d in sorted(by_date, reverse=True)]
+
+
+def latest_report_date(data: Any) -> date | None:
+    """Get the most recent ``date`` field from a list of statement rows."""
+    rows = data if isinstance(data, list) else [data]
+    dates = []
+    for row in rows:
+        if isinstance(row, dict) and row.get("date"):
+            try:
+                dates.append(date.fromisoformat(str(row["date"])[:10]))
+            except ValueError:
+                continue
+    return max(dates, default=None)
+
+
+def freshness_deadline(period: str, data: Any, now: float) -> float:
+    """Compute when a stored statement response should be refetched.
+
+    A response stays fresh until the next report is expected: one period plus
+    the filing lag after its latest fiscal date, within MIN_FRESHNESS and
+    MAX_FRESHNESS. Once a report is overdue it is rechecked daily.
+
+    Args:
+        period: Reporting period, "annual" or "quarter"
+        data: Statement rows
+        now: Current time as a Unix timestamp
+
+    Returns:
+        Expiry time as a Unix timestamp
+    """
+    period = "quarter" if period == "quarter" else "annual"
+    latest = latest_report_date(data)
+    if latest is None:
+        return now + MIN_FRESHNESS
+
+    latest_ts = datetime(
+        latest.year,
+        latest.month,
+        latest.day,
+        tzinfo=timezone.utc,
+    ).timestamp()
+    next_due = latest_ts + (PERIOD_DAYS[period] + FILING_LAG_DAYS[period]) * DAY
+    if next_due <= now:
+        return now + MIN_FRESHNESS
+    return min(max(next_due, now + MIN_FRESHNESS), now + MAX_FRESHNESS)
+
+
+class StatementStore:
+    """SQLite store of statement histories that survives process restarts.
+
+    Each (endpoint, symbol, period) history is stored as zlib-compressed JSON
+    along with how deep it has been fetched. Methods are blocking and
+    thread-safe, so async callers should run them with ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize statement store.
+
+        Args:
+            path: SQLite database file, created if missing
+            clock: Wall-clock time source returning Unix timestamps
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def handles(endpoint: str) -> bool:
+        """Check whether histories from an endpoint are stored."""
+        return endpoint.strip("/") in PERSISTENT_ENDPOINTS
+
+    def now(self) -> float:
+        """Current time according to the store clock."""
+        return self._clock()
+
+    def load(self, endpoint: str, symbol: str, period: str) -> StatementHistory | None:
+        """Load the stored history of a statement, fresh or not."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT depth, complete, expires_at, payload FROM statements "
+                "WHERE endpoint = ? AND symbol = ? AND period = ?",
+                (endpoint, symbol.upper(), period),
+            ).fetchone()
+
+        if row is None:
+            return None
+        depth, complete, expires_at, payload = row
+        return StatementHistory(
+            rows=loads(zlib.decompress(payload)),
+            depth=depth,
+            complete=bool(complete),
+            expires_at=expires_at,
+        )
+
+    def save(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        symbol: str,
+        period: str,
+        rows: list[dict[str, Any]],
+        depth: int,
+        complete: bool,
+    ) -> StatementHistory:
+        """Replace the stored history of a statement.
+
+        Args:
+            endpoint: Statement endpoint
+            symbol: Ticker symbol
+            period: Reporting period
+            rows: All known periods, newest first
+            depth: Number of most recent periods known to have no gaps
+            complete: Whether FMP has no periods older than the stored ones
+
+        Returns:
+            The stored history with its period-aware expiry
+        """
+        now = self._clock()
+        history = StatementHistory(
+            rows=rows,
+            depth=depth,
+            complete=complete,
+            expires_at=freshness_deadline(period, rows, now),
+        )
+        payload = zlib.compress(json.dumps(rows, separators=(",", ":")).encode())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO statements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    endpoint,
+                    symbol.upper(),
+                    period,
+                    depth,
+                    int(complete),
+                    now,
+                    history.expires_at,
+                    payload,
+                ),
+            )
+        return history
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
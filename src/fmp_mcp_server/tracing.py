@@ -0,0 +1,146 @@
+"""OpenTelemetry tracing of tool calls down to upstream FMP requests.
+
+Each tool call gets a span, with a child span per ``FMPClient._request`` call,
+one per HTTP attempt and one for decoding the response. HTTP attempt spans
+carry the connection events reported by httpx, so pool waits, handshakes and
+FMP server time can be told apart.
+
+Tracing is off until ``enable()`` is called, which the server does when
+FMP_TRACING is set. The OpenTelemetry SDK (the ``tracing`` extra) is only
+imported then; until then ``span()`` hands out a stand-in that records nothing.
+"""
+
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+    from opentelemetry.trace import Tracer
+
+EXPORTERS = ("otlp", "file")
+
+DEFAULT_TRACE_FILE = "fmp-traces.jsonl"
+SERVICE_NAME = "fmp-mcp-server"
+
+logger = logging.getLogger(__name__)
+
+
+class _NoopSpan:
+    """Stands in for a span while tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# Active tracer, or None while tracing is disabled
+_tracer: "Tracer | None" = None
+
+
+def enable(exporter: str = "otlp", path: str | None = None) -> bool:
+    """Start tracing and export spans in batches.
+
+    Args:
+        exporter: "otlp" to send spans to an OTLP/HTTP collector, configured
+            by the standard OTEL_EXPORTER_OTLP_* variables (by default
+            http://localhost:4318), or "file" to append them as JSON lines
+        path: File for the "file" exporter (defaults to FMP_TRACE_FILE, then
+            fmp-traces.jsonl)
+
+    Returns:
+        Whether tracing is enabled; False if the OpenTelemetry SDK or the OTLP
+        exporter is missing
+
+    Raises:
+        ValueError: If the exporter is unknown
+    """
+    global _tracer  # noqa: PLW0603
+    if _tracer is not None:
+        return True
+    if exporter not in EXPORTERS:
+        raise ValueError(f"Unknown trace exporter: {exporter}")
+
+    try:
+        from opentelemetry import trace  # noqa: PLC0415
+        from opentelemetry.sdk.resources import Resource  # noqa: PLC0415
+        from opentelemetry.sdk.trace import TracerProvider  # noqa: PLC0415
+        from opentelemetry.sdk.trace.export import (  # noqa: PLC0415
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SpanExporter,
+        )
+
+        span_exporter: SpanExporter
+        if exporter == "otlp":
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (  # noqa: PLC0415
+                OTLPSpanExporter,
+            )
+
+            span_exporter = OTLPSpanExporter()
+        else:
+            path = path or os.getenv("FMP_TRACE_FILE") or DEFAULT_TRACE_FILE
+            # Open for the life of the process
+            trace_file = Path(path).open("a")  # noqa: SIM115
+            span_exporter = ConsoleSpanExporter(
+                out=trace_file,
+                formatter=lambda span: span.to_json(indent=None) + "\n",
+            )
+    except ImportError:
+        logger.warning("Tracing needs OpenTelemetry; install the 'tracing' extra")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+    _tracer = provider.get_tracer(__name__)
+    logger.info("Exporting traces with the %s exporter", exporter)
+    return True
+
+
+def enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _tracer is not None
+
+
+@contextmanager
+def span(name: str, attributes: dict[str, Any] | None = None) -> Iterator[Any]:
+    """Record a span for the enclosed block, as a child of the current one.
+
+    Attributes that are None are left out. Exceptions raised in the block are
+    recorded on the span and mark it as failed.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+
+    attributes = {k: v for k, v in (attributes or {}).items() if v is not None}
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+async def trace_connection(request: "httpx.Request") -> None:
+    """httpx request hook adding connection events to the current span.
+
+    The events come from the ``trace`` extension of httpx: TCP connect
+    (including DNS), TLS handshake, request sent, and response headers and
+    body received. Time before the first event was spent waiting for a pooled
+    connection.
+    """
+    if _tracer is None:
+        return
+    from opentelemetry import trace  # noqa: PLC0415
+
+    current = trace.get_current_span()
+    if not current.is_recording():
+        return
+
+    async def hook(event: str, _info: dict[str, Any]) -> None:
+        current.add_event(event)
+
+    request.extensions["trace"] = hook
@@ -0,0 +1,222 @@
+"""Trailing-twelve-month figures from quarterly statements.
+
+Flow items (income and cash flow statement lines) are summed over rolling
+windows of four consecutive quarters, share counts are averaged, and balance
+sheet items take the value at the end of each window. Windows are computed
+with NumPy over the whole history at once, and ``TTMEngine`` keeps the result
+per symbol so a newly reported quarter only adds its own window.
+
+Requires the ``analytics`` extra (NumPy).
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import fields
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .frame import StatementFrame
+from .models import (
+    BalanceSheet,
+    CashFlowStatement,
+    IncomeStatement,
+    Statement,
+    aliases,
+)
+
+if TYPE_CHECKING:
+    from .client import FMPClient
+
+WINDOW = 4
+# Longest span between the first and last quarter end of a window; longer
+# spans mean a quarter is missing from the history
+MAX_WINDOW_DAYS = 3 * 92 + 14
+
+
+def _line_items(model: type[Statement]) -> list[str]:
+    names = aliases(model)
+    shared = {f.name for f in fields(Statement)}
+    return [names[f.name] for f in fields(model) if f.name not in shared]
+
+
+INCOME_FIELDS = _line_items(IncomeStatement)
+BALANCE_FIELDS = _line_items(BalanceSheet)
+CASH_FLOW_FIELDS = _line_items(CashFlowStatement)
+
+# Items that are averaged rather than summed over a window
+AVERAGE_FIELDS = frozenset({"weightedAverageShsOut", "weightedAverageShsOutDil"})
+# Items valued at the start of a window
+OPENING_FIELDS = frozenset({"cashAtBeginningOfPeriod"})
+# Items valued at the end of a window, besides the balance sheet
+CLOSING_FIELDS = frozenset({"cashAtEndOfPeriod"})
+
+# Line items in frame order; items reported on more than one statement keep
+# their first statement's meaning, as in ``frame.fetch_statement_frame``
+TTM_FIELDS = list(dict.fromkeys([*INCOME_FIELDS, *BALANCE_FIELDS, *CASH_FLOW_FIELDS]))
+
+_CLOSING = frozenset(BALANCE_FIELDS) | CLOSING_FIELDS
+
+
+def _rows(names: "set[str] | frozenset[str]") -> np.ndarray:
+    return np.array(
+        [i for i, name in enumerate(TTM_FIELDS) if name in names],
+        dtype=np.intp,
+    )
+
+
+_AVERAGE_ROWS = _rows(AVERAGE_FIELDS)
+_OPENING_ROWS = _rows(OPENING_FIELDS)
+_CLOSING_ROWS = _rows(_CLOSING)
+_FLOW_ROWS = _rows(set(TTM_FIELDS) - AVERAGE_FIELDS - OPENING_FIELDS - _CLOSING)
+
+
+def trailing_twelve_months(quarters: StatementFrame) -> StatementFrame:
+    """Compute a TTM value for every window of four consecutive quarters.
+
+    Args:
+        quarters: Quarterly frame laid out with ``TTM_FIELDS``, oldest first
+
+    Returns:
+        Frame with one column per window, dated by the window's last quarter.
+        Windows spanning a gap in the history are NaN.
+    """
+    if quarters.fields != TTM_FIELDS:
+        raise ValueError("Quarterly frame must be laid out with TTM_FIELDS")
+
+    count = max(len(quarters) - WINDOW + 1, 0)
+    values = np.full((len(TTM_FIELDS), count), np.nan)
+    if count:
+        windows = sliding_window_view(quarters.values, WINDOW, axis=1)
+        values[_FLOW_ROWS] = windows[_FLOW_ROWS].sum(axis=-1)
+        values[_AVERAGE_ROWS] = windows[_AVERAGE_ROWS].mean(axis=-1)
+        values[_OPENING_ROWS] = quarters.values[_OPENING_ROWS, :count]
+        values[_CLOSING_ROWS] = quarters.values[_CLOSING_ROWS, WINDOW - 1 :]
+
+        span = quarters.dates[WINDOW - 1 :] - quarters.dates[:count]
+        values[:, span > np.timedelta64(MAX_WINDOW_DAYS, "D")] = np.nan
+
+    return StatementFrame(
+        quarters.dates[WINDOW - 1 :],
+        values,
+        TTM_FIELDS,
+        quarters.symbol,
+        "TTM",
+    )
+
+
+def _concat(head: StatementFrame, tail: StatementFrame) -> StatementFrame:
+    return StatementFrame(
+        np.concatenate([head.dates, tail.dates]),
+        np.concatenate([head.values, tail.values], axis=1),
+        TTM_FIELDS,
+        tail.symbol,
+        tail.period,
+    )
+
+
+class TTMEngine:
+    """TTM frames per symbol, extended incrementally as quarters arrive.
+
+    ``update`` compares the quarters with those of the previous call for the
+    symbol. Windows made only of unchanged quarters are reused, so a newly
+    reported quarter costs one window instead of a full recomputation;
+    restated or earlier quarters trigger a full recomputation.
+    """
+
+    def __init__(self, max_symbols: int = 256):
+        """Initialize TTM engine.
+
+        Args:
+            max_symbols: Number of symbols to keep, least recently used first out
+        """
+        self.max_symbols = max_symbols
+        self._frames: OrderedDict[str, tuple[StatementFrame, StatementFrame]] = (
+            OrderedDict()
+        )
+        self.windows_computed = 0
+
+    def _compute(self, quarters: StatementFrame) -> StatementFrame:
+        ttm = trailing_twelve_months(quarters)
+        self.windows_computed += len(ttm)
+        return ttm
+
+    def _extend(
+        self,
+        previous: tuple[StatementFrame, StatementFrame] | None,
+        quarters: StatementFrame,
+    ) -> StatementFrame:
+        if previous is None or not len(quarters):
+            return self._compute(quarters)
+        old_quarters, old_ttm = previous
+
+        # Position of the first new quarter among the previous ones
+        start = int(np.searchsorted(old_quarters.dates, quarters.dates[0]))
+        overlap = len(old_quarters) - start
+        if (
+            overlap > len(quarters)
+            or not np.array_equal(old_quarters.dates[start:], quarters.dates[:overlap])
+            or not np.array_equal(
+                old_quarters.values[:, start:],
+                quarters.values[:, :overlap],
+                equal_nan=True,
+            )
+        ):
+            return self._compute(quarters)
+
+        # Old windows that end within the overlap still hold
+        kept = old_ttm.tail(max(len(old_ttm) - start, 0))
+        first_new = max(overlap, WINDOW - 1)
+        added = self._compute(quarters.tail(len(quarters) - first_new + WINDOW - 1))
+        return _concat(kept, added)
+
+    def update(self, quarters: StatementFrame) -> StatementFrame:
+        """Get the TTM frame for a symbol's quarterly history.
+
+        Args:
+            quarters: Quarterly frame laid out with ``TTM_FIELDS``, oldest first
+
+        Returns:
+            TTM frame, one column per four-quarter window
+        """
+        key = quarters.symbol or ""
+        ttm = self._extend(self._frames.pop(key, None), quarters)
+        self._frames[key] = (quarters, ttm)
+        while len(self._frames) > self.max_symbols:
+            self._frames.popitem(last=False)
+        return ttm
+
+
+async def fetch_quarters(
+    client: "FMPClient",
+    symbol: str,
+    limit: int,
+) -> StatementFrame:
+    """Fetch a symbol's quarterly statements as one frame with ``TTM_FIELDS``."""
+    income, balance, cash_flow = await asyncio.gather(
+        client.get_income_statement(symbol, "quarter", limit),
+        client.get_balance_sheet(symbol, "quarter", limit),
+        client.get_cash_flow(symbol, "quarter", limit),
+    )
+    frame = (
+        StatementFrame.from_rows(income, INCOME_FIELDS, "quarter")
+        .join(StatementFrame.from_rows(balance, BALANCE_FIELDS, "quarter"))
+        .join(StatementFrame.from_rows(cash_flow, CASH_FLOW_FIELDS, "quarter"))
+    )
+    frame.symbol = (frame.symbol or symbol).upper()
+    return frame
+
+
+async def fetch_ttm(
+    client: "FMPClient",
+    engine: TTMEngine,
+    symbol: str,
+    limit: int = 4,
+) -> list[dict]:
+    """Get the ``limit`` most recent TTM periods for a symbol, newest first."""
+    quarters = await fetch_quarters(client, symbol, limit + WINDOW - 1)
+    rows = engine.update(quarters).tail(limit).to_rows()
+    for row in rows:
+        row["period"] = "TTM"
+    return rows
@@ -0,0 +1,18 @@
+"""Shared test fixtures."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fmp_mcp_server import server
+
+
+@pytest.fixture
+def fake_client_class():
+    """Patch FMPClient with a mock and reset the shared instance."""
+    server.fmp_client = None
+    with patch.object(server, "FMPClient") as client_class:
+        client_class.return_value.warmup = AsyncMock()
+        client_class.return_value.close = AsyncMock()
+        yield client_class
+    server.fmp_client = None
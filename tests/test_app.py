@@ -0,0 +1,59 @@
+"""Tests for the HTTP deployment."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from fmp_mcp_server import app, server
+
+
+@pytest.mark.asyncio
+async def test_app_keeps_client_across_sessions(fake_client_class):
+    """Test that the shared client lives as long as the app, not a session."""
+    client = fake_client_class.return_value
+    asgi_app = app.create_app("sse")
+
+    async with asgi_app.router.lifespan_context(asgi_app):
+        async with server.client_lifespan(server.mcp):
+            pass
+        client.close.assert_not_awaited()
+        async with server.client_lifespan(server.mcp):
+            pass
+
+    fake_client_class.assert_called_once()
+    client.close.assert_awaited_once()
+
+
+def test_serve_single_worker():
+    """Test that one worker runs the app in process."""
+    with patch.object(app.uvicorn, "run") as run:
+        app.serve("sse", "127.0.0.1", 9000)
+
+    (asgi_app,), kwargs = run.call_args
+    assert kwargs == {"host": "127.0.0.1", "port": 9000}
+
+
+def test_serve_workers_share_cache_and_quota(monkeypatch, tmp_path):
+    """Test that several workers run stateless with a shared cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("FMP_CACHE_PATH", raising=False)
+    monkeypatch.setenv("FASTMCP_STATELESS_HTTP", "false")
+    monkeypatch.setenv("FMP_WORKERS", "1")
+    # serve() configures the workers through the environment
+    with patch.dict(os.environ), patch.object(app.uvicorn, "run") as run:
+        app.serve("http", workers=3)
+        environ = dict(os.environ)
+
+    run.assert_called_once_with(
+        "fmp_mcp_server.app:create_http_app",
+        factory=True,
+        host=server.mcp.settings.host,
+        port=server.mcp.settings.port,
+        workers=3,
+    )
+    assert environ["FASTMCP_STATELESS_HTTP"] == "true"
+    assert environ["FMP_WORKERS"] == "3"
+    assert environ["FMP_CACHE_PATH"] == str(tmp_path / "fmp-mcp-server" / "cache.db")
+    assert "FMP_CACHE_PATH" not in os.environ
+    assert (tmp_path / "fmp-mcp-server").is_dir()
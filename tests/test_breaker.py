@@ -0,0 +1,120 @@
+"""Tests for circuit breakers."""
+
+import httpx
+import pytest
+
+from fmp_mcp_server.breaker import CircuitBreaker, CircuitBreakers, CircuitOpenError
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    """Build the error raised for an HTTP status."""
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state changes."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the threshold and rejects calls."""
+        breaker = CircuitBreaker("quotes", failure_threshold=3, clock=FakeClock())
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        breaker.before_call()
+        breaker.record_success(0.1)
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError, match="quotes") as excinfo:
+            breaker.before_call()
+        assert excinfo.value.retry_in == breaker.reset_timeout
+        assert breaker.stats().rejected == 1
+        assert breaker.stats().opened == 1
+
+    def test_half_open_allows_one_trial(self):
+        """Test that one trial call closes the circuit again on success."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("quotes", failure_threshold=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+
+        assert breaker.state == "half_open"
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success(0.1)
+        assert breaker.state == "closed"
+        breaker.before_call()
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial call opens the circuit for another timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("quotes", failure_threshold=5, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now = 30.0
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        clock.now = 59.0
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_released_trial_can_be_retried(self):
+        """Test that a cancelled trial call does not leave the circuit stuck."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("quotes", failure_threshold=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+        breaker.before_call()
+        breaker.release()
+
+        breaker.before_call()
+
+    def test_slow_calls_count_as_failures(self):
+        """Test that successes slower than the latency SLO open the circuit."""
+        breaker = CircuitBreaker(
+            "statements",
+            failure_threshold=2,
+            slow_call=5.0,
+            clock=FakeClock(),
+        )
+        breaker.record_success(6.0)
+        breaker.record_success(7.0)
+
+        assert breaker.state == "open"
+
+    def test_client_errors_do_not_count(self):
+        """Test that 4xx responses reset the count and 5xx responses add to it."""
+        breaker = CircuitBreaker("quotes", failure_threshold=2, clock=FakeClock())
+        breaker.record_error(status_error(503), 0.1)
+        breaker.record_error(status_error(429), 0.1)
+        breaker.record_error(httpx.ConnectError("refused"), 0.1)
+
+        assert breaker.state == "closed"
+        breaker.record_error(status_error(502), 0.1)
+        assert breaker.state == "open"
+
+
+def test_endpoint_families_share_breakers():
+    """Test that endpoints of one family share a breaker."""
+    breakers = CircuitBreakers()
+
+    assert breakers.for_endpoint("quote") is breakers.for_endpoint("/batch-quote")
+    assert breakers.for_endpoint("quote") is not breakers.for_endpoint("ratios")
+    assert breakers.for_endpoint("unknown").family == "unknown"
+    assert set(breakers.stats()) == {"quotes", "metrics", "unknown"}
@@ -0,0 +1,123 @@
+"""Tests for multi-symbol fan-out."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fmp_mcp_server.bulk import MAX_SYMBOLS, fetch_bulk
+
+
+@pytest.fixture
+def client():
+    """Mock client whose statement calls track how many run at once."""
+    client = AsyncMock()
+    client.in_flight = client.max_in_flight = 0
+
+    async def income(symbol, _period, _limit):
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        await asyncio.sleep(0.01)
+        client.in_flight -= 1
+        if symbol == "FAIL":
+            raise RuntimeError("upstream error")
+        return [{"symbol": symbol, "date": "2024-12-31", "revenue": 1.0, "eps": None}]
+
+    client.get_income_statement.side_effect = income
+    client.get_company_profile.side_effect = lambda s: [{"symbol": s, "beta": 1.2}]
+    client.get_quotes.side_effect = lambda symbols: [
+        {"symbol": s, "price": 10.0} for s in symbols
+    ]
+    return client
+
+
+class TestFetchBulk:
+    """Test fetching datasets for many symbols."""
+
+    @pytest.mark.asyncio
+    async def test_merges_compact_datasets_in_input_order(self, client):
+        """Test that results are keyed by symbol without nulls or symbol fields."""
+        results = await fetch_bulk(
+            client,
+            ["msft", "aapl", "MSFT"],
+            ["profile", "income", "quote"],
+        )
+
+        assert list(results) == ["MSFT", "AAPL"]
+        assert results["AAPL"] == {
+            "profile": {"beta": 1.2},
+            "income": [{"date": "2024-12-31", "revenue": 1.0}],
+            "quote": {"price": 10.0},
+        }
+        client.get_quotes.assert_awaited_once_with(["MSFT", "AAPL"])
+        client.get_income_statement.assert_any_await("AAPL", "annual", 5)
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_reports_progress(self, client):
+        """Test the semaphore and one progress callback per symbol."""
+        symbols = [f"S{i}" for i in range(10)]
+        concurrency = 3
+        progress = []
+
+        async def on_progress(completed, total, _symbol):
+            progress.append((completed, total))
+
+        await fetch_bulk(
+            client,
+            symbols,
+            ["income"],
+            concurrency=concurrency,
+            on_progress=on_progress,
+        )
+
+        assert client.max_in_flight == concurrency
+        assert progress == [(i, 10) for i in range(1, 11)]
+
+    @pytest.mark.asyncio
+    async def test_failed_dataset_reported_per_symbol(self, client):
+        """Test that one failure does not fail the whole call."""
+        results = await fetch_bulk(client, ["FAIL", "AAPL"], ["profile", "income"])
+
+        assert results["FAIL"]["errors"] == {"income": "upstream error"}
+        assert results["FAIL"]["profile"] == {"beta": 1.2}
+        assert "errors" not in results["AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_failed_quotes_reported_per_symbol(self, client):
+        """Test that failed batch quotes keep the other datasets."""
+        client.get_quotes.side_effect = RuntimeError("rate limited")
+
+        results = await fetch_bulk(client, ["FAIL", "AAPL"], ["income", "quote"])
+
+        assert results["AAPL"] == {
+            "income": [{"date": "2024-12-31", "revenue": 1.0}],
+            "errors": {"quote": "rate limited"},
+        }
+        assert results["FAIL"]["errors"] == {
+            "income": "upstream error",
+            "quote": "rate limited",
+        }
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_requests(self, client):
+        """Test limits on symbols and dataset names."""
+        with pytest.raises(ValueError, match="symbols"):
+            await fetch_bulk(client, [f"S{i}" for i in range(MAX_SYMBOLS + 1)], [])
+        with pytest.raises(ValueError, match="earnings"):
+            await fetch_bulk(client, ["AAPL"], ["earnings"])
+
+    @pytest.mark.asyncio
+    async def test_projects_fields_of_every_dataset(self, client):
+        """Test that fields apply to each dataset's rows."""
+        results = await fetch_bulk(
+            client,
+            ["AAPL"],
+            ["profile", "income", "quote"],
+            fields=["revenue"],
+        )
+
+        assert results["AAPL"] == {
+            "profile": {},
+            "income": [{"date": "2024-12-31", "revenue": 1.0}],
+            "quote": {},
+        }
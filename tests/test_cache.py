@@ -0,0 +1,97 @@
+"""Tests for the response cache."""
+
+import pytest
+
+from fmp_mcp_server.cache import MISSING, ResponseCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """Test response cache behavior."""
+
+    def test_key_ignores_api_key_and_param_order(self):
+        """Test that keys are normalized."""
+        a = ResponseCache.make_key("profile", {"symbol": "AAPL", "apikey": "x"})
+        b = ResponseCache.make_key("/profile", {"symbol": "AAPL"})
+        c = ResponseCache.make_key("ratios", {"limit": 5, "symbol": "AAPL"})
+        d = ResponseCache.make_key("ratios", {"symbol": "AAPL", "limit": "5"})
+        assert a == b
+        assert c == d
+
+    def test_entries_expire_per_endpoint(self):
+        """Test that quote entries expire long before profile entries."""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        quote = ResponseCache.make_key("quote", {"symbol": "AAPL"})
+        profile = ResponseCache.make_key("profile", {"symbol": "AAPL"})
+        cache.set(quote, [{"price": 1.0}])
+        cache.set(profile, [{"companyName": "Apple"}])
+
+        clock.now = 60.0
+        assert cache.get(quote) is MISSING
+        assert cache.get(profile) == [{"companyName": "Apple"}]
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(max_entries=2)
+        keys = [ResponseCache.make_key("profile", {"symbol": s}) for s in "ABC"]
+        cache.set(keys[0], "a")
+        cache.set(keys[1], "b")
+        cache.get(keys[0])
+        cache.set(keys[2], "c")
+
+        assert cache.get(keys[1]) is MISSING
+        assert cache.get(keys[0]) == "a"
+        assert cache.stats().evictions == 1
+
+    def test_stale_responses_served_within_stale_ttl(self):
+        """Test that quotes stay servable as stale past their TTL for a while."""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock, stale_ttls={"quote": 60.0})
+        quote = ResponseCache.make_key("quote", {"symbol": "AAPL"})
+        cache.set(quote, [{"price": 1.0}])
+
+        assert cache.get_stale(quote) == ([{"price": 1.0}], None)
+        clock.now = 30.0
+        assert cache.get(quote) is MISSING
+        assert cache.get_stale(quote) == ([{"price": 1.0}], 30.0)
+        clock.now = 75.0
+        assert cache.get_stale(quote) == (MISSING, None)
+        assert cache.peek(quote) == ([{"price": 1.0}], 75.0)
+        assert cache.stats().stale_hits == 1
+
+    def test_stale_ttl_only_for_configured_endpoints(self):
+        """Test that other endpoints expire at their TTL."""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        ratios = ResponseCache.make_key("ratios", {"symbol": "AAPL"})
+        cache.set(ratios, [{"currentRatio": 1.0}])
+
+        clock.now = cache.ttl_for("ratios")
+        assert cache.get_stale(ratios) == (MISSING, None)
+
+    def test_stats(self):
+        """Test hit and miss counters."""
+        cache = ResponseCache()
+        key = ResponseCache.make_key("profile", {"symbol": "AAPL"})
+        cache.get(key)
+        cache.set(key, "x")
+        cache.get(key)
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_ratio == pytest.approx(0.5)
+
+    def test_invalid_size(self):
+        """Test that the cache must hold at least one entry."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResponseCache(max_entries=0)
@@ -0,0 +1,100 @@
+"""Tests for the command line entry point."""
+
+import logging
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from fmp_mcp_server import cli
+
+
+@pytest.fixture
+def cli_env():
+    """Undo the environment variables and logging setup of cli.main()."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    with patch.dict(os.environ):
+        yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_cli_does_not_import_server():
+    """Test that parsing arguments does not pay for importing the server."""
+    code = "import sys, fmp_mcp_server.cli; print('mcp' in sys.modules)"
+    result = subprocess.run(  # noqa: S603 - runs this interpreter
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.usefixtures("cli_env")
+def test_stdio_applies_cache_path_and_log_level(tmp_path):
+    """Test that settings reach the environment before the server starts."""
+    cache_path = str(tmp_path / "cache.db")
+    from fmp_mcp_server import server  # noqa: PLC0415
+
+    with patch.object(server.mcp, "run") as run:
+        cli.main(["--cache-path", cache_path, "--log-level", "debug"])
+
+    run.assert_called_once_with()
+    assert os.environ["FMP_CACHE_PATH"] == cache_path
+    assert os.environ["FASTMCP_LOG_LEVEL"] == "DEBUG"
+
+
+@pytest.mark.usefixtures("cli_env")
+def test_http_transport_serves_app():
+    """Test that network transports are handed to the HTTP app."""
+    from fmp_mcp_server import app  # noqa: PLC0415
+
+    with patch.object(app, "serve") as serve:
+        cli.main(["--transport", "http", "--port", "9000", "--workers", "2"])
+
+    serve.assert_called_once_with("http", None, 9000, 2)
+
+
+@pytest.mark.usefixtures("cli_env")
+def test_rejects_sse_workers(capsys):
+    """Test that SSE cannot be spread over several workers."""
+    with pytest.raises(SystemExit):
+        cli.main(["--transport", "sse", "--workers", "2"])
+
+    assert "use --transport http" in capsys.readouterr().err
+
+
+@pytest.mark.usefixtures("cli_env")
+def test_metrics_port_starts_exporter():
+    """Test that --metrics-port enables metrics before the server starts."""
+    from fmp_mcp_server import app, metrics  # noqa: PLC0415
+
+    with (
+        patch.object(metrics, "enable", return_value=True),
+        patch.object(metrics, "start_exporter") as start_exporter,
+        patch.object(app, "serve"),
+    ):
+        cli.main(["--transport", "http", "--metrics-port", "9100"])
+
+    start_exporter.assert_called_once_with(9100, "127.0.0.1")
+    assert os.environ["FMP_METRICS_PORT"] == "9100"
+
+
+@pytest.mark.usefixtures("cli_env")
+def test_tracing_options_reach_environment(tmp_path):
+    """Test that tracing settings are set before the server is imported."""
+    trace_file = str(tmp_path / "traces.jsonl")
+    from fmp_mcp_server import app  # noqa: PLC0415
+
+    with patch.object(app, "serve"):
+        cli.main(
+            ["--transport", "http", "--tracing", "file", "--trace-file", trace_file],
+        )
+
+    assert os.environ["FMP_TRACING"] == "file"
+    assert os.environ["FMP_TRACE_FILE"] == trace_file
@@ -1,10 +1,19 @@
 """Tests for FMP client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, call, patch
 
+import httpx
 import pytest
 
+from fmp_mcp_server.breaker import CircuitBreakers, CircuitOpenError
+from fmp_mcp_server.cache import MISSING, ResponseCache
 from fmp_mcp_server.client import FMPClient
+from fmp_mcp_server.models import IncomeStatement, Quote
+from fmp_mcp_server.retry import RetryPolicy
+from fmp_mcp_server.store import StatementStore
 
 
 class TestFMPClient:
@@ -22,6 +31,60 @@ class TestFMPClient:
         assert client.api_key == "test_key"
         assert client.base_url == "https://financialmodelingprep.com/stable"
 
+    def test_pool_and_timeouts_from_env(self):
+        """Test that pool limits and per-phase timeouts come from the env."""
+        env = {
+            "FMP_API_KEY": "test_key",
+            "FMP_MAX_CONNECTIONS": "8",
+            "FMP_CONNECT_TIMEOUT": "2.5",
+            "FMP_READ_TIMEOUT": "12",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            client = FMPClient()
+
+        pool = client.client._transport._pool
+        assert pool._max_connections == int(env["FMP_MAX_CONNECTIONS"])
+        assert client.client.timeout.connect == float(env["FMP_CONNECT_TIMEOUT"])
+        assert client.client.timeout.read == float(env["FMP_READ_TIMEOUT"])
+
+    def test_empty_env_uses_defaults(self):
+        """Test that variables set to an empty string fall back to defaults."""
+        env = {
+            "FMP_API_KEY": "test_key",
+            "FMP_CACHE_MAX_ENTRIES": "",
+            "FMP_MAX_RETRIES": "",
+            "FMP_BREAKER_FAILURES": "",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            client = FMPClient()
+
+        assert client.cache.max_entries == ResponseCache().max_entries
+        assert client.retry_policy.max_retries == RetryPolicy().max_retries
+        assert client.breakers.failure_threshold == CircuitBreakers().failure_threshold
+
+    def test_rate_limits_split_between_workers(self):
+        """Test that each worker process gets an equal share of the quota."""
+        env = {
+            "FMP_API_KEY": "test_key",
+            "FMP_WORKERS": "4",
+            "RATE_LIMIT_REQUESTS_PER_MINUTE": "300",
+            "RATE_LIMIT_REQUESTS_PER_DAY": "250",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            client = FMPClient()
+
+        assert client.rate_limiter.rate == pytest.approx(75 / 60)
+        assert client.rate_limiter.daily_limit == (
+            int(env["RATE_LIMIT_REQUESTS_PER_DAY"]) // int(env["FMP_WORKERS"])
+        )
+
+    def test_http2_falls_back_without_h2(self):
+        """Test that HTTP/2 is only enabled when h2 is installed."""
+        with patch("importlib.util.find_spec", return_value=None):
+            client = FMPClient(api_key="test_key", http2=True)
+
+        assert client.client._transport._pool._http2 is False
+
     @pytest.mark.asyncio
     async def test_request_adds_api_key(self):
         """Test that API key is added to requests."""
@@ -29,7 +92,7 @@ class TestFMPClient:
 
         with patch.object(client.client, "get") as mock_get:
             mock_response = MagicMock()
-            mock_response.json.return_value = {"test": "data"}
+            mock_response.content = b'{"test": "data"}'
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
 
@@ -41,6 +104,317 @@ class TestFMPClient:
             )
             assert result == {"test": "data"}
 
+    @pytest.mark.asyncio
+    async def test_request_uses_cache(self):
+        """Test that repeated requests are served from the cache."""
+        client = FMPClient(api_key="test_key")
+
+        with patch.object(client.client, "get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.content = b'[{"symbol": "AAPL"}]'
+            mock_response.raise_for_status.return_value = None
+            mock_get.return_value = mock_response
+
+            first = await client._request("profile", {"symbol": "AAPL"})
+            second = await client._request("profile", {"symbol": "AAPL"})
+
+            mock_get.assert_called_once()
+            assert first == second == [{"symbol": "AAPL"}]
+            assert client.cache is not None
+            assert client.cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_request_retries_transient_errors(self):
+        """Test that transient failures are retried before succeeding."""
+        client = FMPClient(
+            api_key="test_key",
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0),
+        )
+        request = httpx.Request("GET", "https://example.com/quote")
+        responses = [
+            httpx.Response(503, request=request),
+            httpx.Response(429, headers={"Retry-After": "0"}, request=request),
+            httpx.Response(200, json=[{"price": 1.0}], request=request),
+        ]
+
+        with patch.object(client.client, "get", side_effect=responses) as mock_get:
+            result = await client._request("quote", {"symbol": "AAPL"})
+
+        assert mock_get.call_count == len(responses)
+        assert result == [{"price": 1.0}]
+
+    @pytest.mark.asyncio
+    async def test_request_gives_up_after_max_retries(self):
+        """Test that the last error is raised once retries are exhausted."""
+        client = FMPClient(
+            api_key="test_key",
+            retry_policy=RetryPolicy(max_retries=1, base_delay=0),
+        )
+        error = httpx.ConnectError("reset")
+
+        with patch.object(client.client, "get", side_effect=error) as mock_get:
+            with pytest.raises(httpx.ConnectError):
+                await client._request("quote", {"symbol": "AAPL"})
+
+        assert mock_get.call_count == 1 + client.retry_policy.max_retries
+
+    @pytest.mark.asyncio
+    async def test_statements_served_from_store_after_restart(self, tmp_path):
+        """Test that a new client reads statements from the persistent store."""
+        path = tmp_path / "cache.db"
+        rows = [{"date": "2099-12-31", "revenue": 1.0}]
+
+        client = FMPClient(api_key="test_key", store=StatementStore(path))
+        with patch.object(client, "_request", return_value=rows):
+            await client.get_income_statement("AAPL", limit=5)
+        await client.close()
+
+        restarted = FMPClient(api_key="test_key", store=StatementStore(path))
+        with patch.object(restarted, "_request") as mock_request:
+            assert await restarted.get_income_statement("AAPL", limit=1) == rows
+            mock_request.assert_not_called()
+        await restarted.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_history_fetches_only_new_periods(self, tmp_path):
+        """Test that a stale history is topped up with recent periods only."""
+        now = [datetime(2024, 3, 1, tzinfo=timezone.utc).timestamp()]
+        store = StatementStore(tmp_path / "cache.db", clock=lambda: now[0])
+        history = [{"date": f"{year}-12-31"} for year in range(2023, 2013, -1)]
+        client = FMPClient(api_key="test_key", store=store)
+        client.cache = None
+
+        with patch.object(client, "_request", return_value=history) as mock:
+            await client.get_cash_flow("AAPL", limit=10)
+            mock.assert_called_once_with(
+                "cash-flow-statement",
+                {"symbol": "AAPL", "period": "annual", "limit": 10},
+                stale_fallback=False,
+            )
+
+        now[0] = datetime(2025, 4, 1, tzinfo=timezone.utc).timestamp()
+        latest = [
+            {"date": "2024-12-31"},
+            {"date": "2023-12-31"},
+            {"date": "2022-12-31"},
+        ]
+        with patch.object(client, "_request", return_value=latest) as mock:
+            result = await client.get_cash_flow("AAPL", limit=10)
+            mock.assert_called_once_with(
+                "cash-flow-statement",
+                {"symbol": "AAPL", "period": "annual", "limit": 3},
+                stale_fallback=False,
+            )
+
+        assert [row["date"] for row in result] == [
+            f"{year}-12-31" for year in range(2024, 2014, -1)
+        ]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_stored_history(self, tmp_path):
+        """Test that a stale stored history is served while FMP is unavailable."""
+        now = [datetime(2024, 3, 1, tzinfo=timezone.utc).timestamp()]
+        store = StatementStore(tmp_path / "cache.db", clock=lambda: now[0])
+        history = [{"date": f"{year}-12-31"} for year in range(2023, 2018, -1)]
+        client = FMPClient(api_key="test_key", store=store)
+        client.cache = None
+
+        with patch.object(client, "_request", return_value=history):
+            await client.get_cash_flow("AAPL", limit=5)
+
+        now[0] = datetime(2025, 4, 1, tzinfo=timezone.utc).timestamp()
+        with patch.object(
+            client,
+            "_request",
+            side_effect=CircuitOpenError("statements", 30),
+        ):
+            result = await client.get_cash_flow("AAPL", limit=2)
+
+        assert result == [
+            {"date": "2023-12-31", "stale": True},
+            {"date": "2022-12-31", "stale": True},
+        ]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_does_not_store_expired_cache(self, tmp_path):
+        """Test that cached responses served while open are not stored."""
+        now = [datetime(2024, 3, 1, tzinfo=timezone.utc).timestamp()]
+        store = StatementStore(tmp_path / "cache.db", clock=lambda: now[0])
+        client = FMPClient(
+            api_key="test_key",
+            cache=ResponseCache(clock=lambda: now[0]),
+            store=store,
+            retry_policy=RetryPolicy(max_retries=0),
+            breakers=CircuitBreakers(failure_threshold=1),
+        )
+        response = MagicMock()
+        response.content = json.dumps(
+            [{"date": f"{year}-12-31"} for year in range(2023, 2018, -1)],
+        ).encode()
+
+        with patch.object(client.client, "get", return_value=response):
+            await client.get_cash_flow("AAPL", limit=5)
+        saved = store.load("cash-flow-statement", "AAPL", "annual")
+
+        # Far enough ahead that the whole history is refetched
+        now[0] = datetime(2030, 4, 1, tzinfo=timezone.utc).timestamp()
+        with patch.object(
+            client.client,
+            "get",
+            side_effect=httpx.ConnectError("refused"),
+        ):
+            with pytest.raises(httpx.ConnectError):
+                await client.get_cash_flow("AAPL", limit=5)
+            result = await client.get_cash_flow("AAPL", limit=2)
+
+        assert result == [
+            {"date": "2023-12-31", "stale": True},
+            {"date": "2022-12-31", "stale": True},
+        ]
+        assert store.load("cash-flow-statement", "AAPL", "annual") == saved
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Test that identical in-flight requests share one upstream call."""
+        client = FMPClient(api_key="test_key")
+        client.cache = None
+        calls = 0
+
+        async def slow_get(*_args, **_kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            response = MagicMock()
+            response.content = b'[{"symbol": "AAPL"}]'
+            return response
+
+        symbols = ["AAPL"] * 5 + ["MSFT"]
+        with patch.object(client.client, "get", side_effect=slow_get):
+            results = await asyncio.gather(
+                *(client._request("profile", {"symbol": s}) for s in symbols),
+            )
+
+        assert calls == len(set(symbols))
+        assert results[0] == [{"symbol": "AAPL"}]
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_quote_served_while_refreshed(self):
+        """Test that stale quotes are returned at once and refreshed once."""
+        clock = {"now": 0.0}
+        cache = ResponseCache(clock=lambda: clock["now"])
+        client = FMPClient(api_key="test_key", cache=cache)
+        prices = [1.0, 2.0]
+        pending = iter(prices)
+        calls = 0
+
+        async def get(*_args, **_kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            response = MagicMock()
+            response.content = f'[{{"symbol": "AAPL", "price": {next(pending)}}}]'
+            return response
+
+        with patch.object(client.client, "get", side_effect=get):
+            await client.get_quote("AAPL")
+            clock["now"] = cache.ttl_for("quote") + 5
+            stale = await asyncio.gather(*(client.get_quote("AAPL") for _ in range(3)))
+            assert calls == len(prices)
+            await asyncio.gather(*client._inflight.values())
+            fresh = await client.get_quote("AAPL")
+
+        assert stale[0] == [
+            {"symbol": "AAPL", "price": 1.0, "stale": True, "ageSeconds": 20.0},
+        ]
+        assert fresh == [{"symbol": "AAPL", "price": 2.0}]
+        assert calls == len(prices)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_quote(self, caplog):
+        """Test that a failed background refresh is logged, not raised."""
+        clock = {"now": 0.0}
+        cache = ResponseCache(clock=lambda: clock["now"])
+        client = FMPClient(
+            api_key="test_key",
+            cache=cache,
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+        key = ResponseCache.make_key("quote", {"symbol": "AAPL"})
+        cache.set(key, [{"symbol": "AAPL"}])
+        clock["now"] = cache.ttl_for("quote") + 1
+        refreshes = 2
+
+        with patch.object(
+            client.client,
+            "get",
+            side_effect=httpx.ConnectError("refused"),
+        ):
+            for _ in range(refreshes):
+                assert (await client.get_quote("AAPL"))[0]["stale"] is True
+                await asyncio.gather(*client._inflight.values(), return_exceptions=True)
+                await asyncio.sleep(0)
+
+        assert caplog.text.count("Background refresh of quote failed") == refreshes
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test that a failing endpoint family stops being called."""
+        client = FMPClient(
+            api_key="test_key",
+            retry_policy=RetryPolicy(max_retries=0),
+            breakers=CircuitBreakers(failure_threshold=2),
+        )
+
+        with patch.object(
+            client.client,
+            "get",
+            side_effect=httpx.ConnectError("refused"),
+        ) as mock_get:
+            for symbol in ("A", "B"):
+                with pytest.raises(httpx.ConnectError):
+                    await client.get_quote(symbol)
+            with pytest.raises(CircuitOpenError):
+                await client.get_quotes(["C"])
+
+        assert mock_get.call_count == client.breakers.failure_threshold
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_expired_cache(self):
+        """Test that expired responses are served marked stale while open."""
+        clock = {"now": 0.0}
+        cache = ResponseCache(clock=lambda: clock["now"])
+        client = FMPClient(
+            api_key="test_key",
+            cache=cache,
+            retry_policy=RetryPolicy(max_retries=0),
+            breakers=CircuitBreakers(failure_threshold=1),
+        )
+        key = ResponseCache.make_key("ratios", {"symbol": "AAPL"})
+        cache.set(key, [{"symbol": "AAPL", "currentRatio": 1.0}])
+        clock["now"] = cache.ttl_for("ratios") + 60
+
+        with patch.object(
+            client.client,
+            "get",
+            side_effect=httpx.ConnectError("refused"),
+        ):
+            with pytest.raises(httpx.ConnectError):
+                await client._request("ratios", {"symbol": "AAPL"})
+            result = await client._request("ratios", {"symbol": "AAPL"})
+
+        assert result == [
+            {
+                "symbol": "AAPL",
+                "currentRatio": 1.0,
+                "stale": True,
+                "ageSeconds": cache.ttl_for("ratios") + 60,
+            },
+        ]
+
     @pytest.mark.asyncio
     async def test_get_company_profile(self):
         """Test get company profile."""
@@ -66,3 +440,63 @@ class TestFMPClient:
 
             mock_request.assert_called_once_with("quote", {"symbol": "AAPL"})
             assert result == [{"symbol": "AAPL"}]
+
+    @pytest.mark.asyncio
+    async def test_get_quotes_chunks_and_orders(self):
+        """Test that batch quotes are chunked and merged in input order."""
+        client = FMPClient(api_key="test_key")
+
+        async def fake_request(endpoint, params):
+            assert endpoint == "batch-quote"
+            return [{"symbol": s} for s in reversed(params["symbols"].split(","))]
+
+        with patch.object(client, "_request", side_effect=fake_request) as mock:
+            result = await client.get_quotes(
+                ["msft", "AAPL", "NVDA", "MSFT", "AMZN"],
+                chunk_size=2,
+            )
+
+        assert mock.call_args_list == [
+            call("batch-quote", {"symbols": "MSFT,AAPL"}),
+            call("batch-quote", {"symbols": "NVDA,AMZN"}),
+        ]
+        assert [q["symbol"] for q in result] == ["MSFT", "AAPL", "NVDA", "AMZN"]
+
+    @pytest.mark.asyncio
+    async def test_get_records(self):
+        """Test that records are decoded from the body and cached as records."""
+        client = FMPClient(api_key="test_key")
+        client._loads = MagicMock(side_effect=AssertionError("decoded to dicts"))
+        statement = MagicMock(content=b'[{"date": "2024-06-29", "revenue": 1.0}]')
+        quote = MagicMock(content=b'{"symbol": "AAPL", "price": 1.0}')
+        responses = [statement, quote]
+
+        with patch.object(client.client, "get", side_effect=responses) as mock_get:
+            statements = await client.get_records(IncomeStatement, "AAPL", "quarter")
+            quotes = await client.get_records(Quote, "AAPL")
+            assert await client.get_records(Quote, "AAPL") == quotes
+
+        assert mock_get.call_args_list[0].kwargs["params"] == {
+            "symbol": "AAPL",
+            "period": "quarter",
+            "limit": 5,
+            "apikey": "test_key",
+        }
+        assert mock_get.call_count == len(responses)
+        assert statements == [IncomeStatement(date="2024-06-29", revenue=1.0)]
+        assert quotes == [Quote(symbol="AAPL", price=1.0)]
+        # Cached apart from the endpoint's dict rows
+        key = ResponseCache.make_key("quote", {"symbol": "AAPL"})
+        assert client.cache.get(key) is MISSING
+
+    @pytest.mark.asyncio
+    async def test_get_records_from_store(self, tmp_path):
+        """Test that stored statements are built into records."""
+        client = FMPClient(api_key="test_key", store=StatementStore(tmp_path / "db"))
+        rows = [{"date": "2099-12-31", "revenue": 1.0}]
+
+        with patch.object(client, "_request", return_value=rows):
+            statements = await client.get_records(IncomeStatement, "AAPL")
+
+        assert statements == [IncomeStatement(date="2099-12-31", revenue=1.0)]
+        await client.close()
@@ -0,0 +1,184 @@
+"""Tests for the Monte Carlo DCF."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_mcp_server import dcf  # noqa: E402
+from fmp_mcp_server.frame import StatementFrame  # noqa: E402
+
+NET_DEBT = 50.0
+HISTORY = StatementFrame.from_rows(
+    [
+        {
+            "date": f"{2020 + i}-12-31",
+            "symbol": "AAPL",
+            "revenue": 100.0 * 1.1**i,
+            "freeCashFlow": 20.0 * 1.1**i,
+            "netDebt": NET_DEBT,
+            "weightedAverageShsOutDil": 10.0,
+        }
+        for i in range(5)
+    ],
+)
+
+
+def fixed_inputs(**changes):
+    inputs = {
+        "base_revenue": 100.0,
+        "net_debt": 0.0,
+        "shares": 1.0,
+        "growth_mean": 0.0,
+        "growth_std": 0.0,
+        "margin_mean": 0.1,
+        "margin_std": 0.0,
+        "wacc_mean": 0.1,
+        "wacc_std": 0.0,
+        "terminal_growth": 0.0,
+        "years": 2,
+    }
+    return dcf.DCFInputs(**{**inputs, **changes})
+
+
+class TestInputs:
+    """Test fitting distributions to statement history."""
+
+    def test_from_frame_fits_growth_and_margin(self):
+        """Test growth and margin fitted to annual history."""
+        wacc = 0.08
+        inputs = dcf.DCFInputs.from_frame(HISTORY, wacc_mean=wacc, margin_std=None)
+
+        assert inputs.base_revenue == pytest.approx(146.41)
+        assert inputs.growth_mean == pytest.approx(0.1)
+        assert inputs.growth_std == pytest.approx(0.0, abs=1e-12)
+        assert inputs.margin_mean == pytest.approx(0.2)
+        assert inputs.net_debt == NET_DEBT
+        assert inputs.wacc_mean == wacc
+
+    def test_from_frame_requires_history(self):
+        """Test that a frame without revenue is rejected."""
+        with pytest.raises(ValueError, match="revenue"):
+            dcf.DCFInputs.from_frame(StatementFrame.from_rows([]))
+
+
+class TestSimulate:
+    """Test vectorized path valuation."""
+
+    def test_deterministic_paths_match_closed_form(self):
+        """Test that zero-variance paths equal a hand-computed DCF."""
+        values = dcf.simulate(fixed_inputs(), 3, seed=1)
+
+        # Cash flows of 10 for two years and a terminal value of 100, at 10%
+        np.testing.assert_allclose(values, 100.0)
+
+    def test_wacc_below_terminal_growth_is_nan(self):
+        """Test that paths without a finite terminal value are dropped."""
+        values = dcf.simulate(fixed_inputs(terminal_growth=0.2), 4)
+        summary = dcf.summarize(values)
+
+        assert np.isnan(values).all()
+        assert summary == {"simulations": 4, "valid": 0}
+
+    def test_summarize_percentiles_and_price(self):
+        """Test percentile bands and the probability of undervaluation."""
+        summary = dcf.summarize(np.arange(1.0, 101.0), price=90.0)
+
+        assert summary["percentiles"]["p50"] == pytest.approx(50.5)
+        assert summary["probabilityUndervalued"] == pytest.approx(0.1)
+
+
+class TestRunSimulations:
+    """Test running simulations off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_large_runs_are_chunked_reproducibly(self, monkeypatch):
+        """Test that chunks are sized and seeded independently of scheduling."""
+        monkeypatch.setattr(dcf, "CHUNK_SIZE", 1000)
+        inputs = fixed_inputs(growth_std=0.05, wacc_std=0.01)
+        with ThreadPoolExecutor(2) as pool:
+            first = await dcf.run_simulations(inputs, 2500, seed=7, executor=pool)
+            second = await dcf.run_simulations(inputs, 2500, seed=7, executor=pool)
+
+        assert first.shape == (2500,)
+        np.testing.assert_array_equal(first, second)
+        assert len(np.unique(first[: dcf.CHUNK_SIZE])) == dcf.CHUNK_SIZE
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self, monkeypatch):
+        """Test that chunks run in the shared process pool."""
+        monkeypatch.setattr(dcf, "CHUNK_SIZE", 100)
+        monkeypatch.setenv("FMP_DCF_WORKERS", "2")
+        try:
+            values = await dcf.run_simulations(fixed_inputs(), 250)
+        finally:
+            dcf.shutdown_pool()
+
+        np.testing.assert_allclose(values, 100.0)
+
+
+@pytest.mark.asyncio
+async def test_simulate_dcf_per_symbol():
+    """Test valuing several symbols from the client's statements and quotes."""
+    client = AsyncMock()
+    client.get_income_statement.side_effect = lambda s, _period, _limit: (
+        [] if s == "NONE" else HISTORY.to_rows()
+    )
+    client.get_balance_sheet.return_value = HISTORY.to_rows()
+    client.get_cash_flow.return_value = HISTORY.to_rows()
+    client.get_quotes.return_value = [{"symbol": "AAPL", "price": 1.0}]
+
+    simulations = 1000
+    results = await dcf.simulate_dcf(client, ["aapl", "NONE"], simulations, seed=3)
+
+    assert results[0]["symbol"] == "AAPL"
+    assert results[0]["valid"] == simulations
+    assert results[0]["price"] == 1.0
+    assert set(results[0]["percentiles"]) == {f"p{p}" for p in dcf.PERCENTILES}
+    assert "error" in results[1]
+
+    with pytest.raises(ValueError, match="simulations"):
+        await dcf.simulate_dcf(client, ["AAPL"], 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("symbols", "simulations", "message"),
+    [
+        ([], 1000, "symbols per call"),
+        ([f"S{i}" for i in range(dcf.MAX_SYMBOLS + 1)], 1000, "symbols per call"),
+        (["AAPL", "MSFT"], dcf.MAX_SIMULATIONS // 2 + 1, "over all symbols"),
+    ],
+)
+async def test_simulate_dcf_limits_work_per_call(symbols, simulations, message):
+    """Test that symbol count and total simulations are bounded per call."""
+    client = AsyncMock()
+
+    with pytest.raises(ValueError, match=message):
+        await dcf.simulate_dcf(client, symbols, simulations)
+
+    client.get_quotes.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"years": 0}, "years must be between 1"),
+        ({"years": dcf.MAX_YEARS + 1}, "years must be between 1"),
+        ({"growth_std": -0.1}, "growth_std must not be negative"),
+        ({"margin_std": -0.1}, "margin_std must not be negative"),
+        ({"wacc_std": -0.01}, "wacc_std must not be negative"),
+    ],
+)
+async def test_simulate_dcf_rejects_invalid_inputs(overrides, message):
+    """Test that invalid overrides are rejected before fetching anything."""
+    client = AsyncMock()
+
+    with pytest.raises(ValueError, match=message):
+        await dcf.simulate_dcf(client, ["AAPL"], 1000, **overrides)
+
+    client.get_quotes.assert_not_called()
+    client.get_income_statement.assert_not_called()
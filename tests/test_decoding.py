@@ -0,0 +1,35 @@
+"""Tests for JSON decoder selection."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from fmp_mcp_server import decoding
+
+
+class TestDecoding:
+    """Test JSON decoder selection."""
+
+    @pytest.mark.parametrize("name", ["auto", None, "json"])
+    def test_decoders_agree_with_stdlib(self, name):
+        """Test that every selected backend decodes like the stdlib."""
+        payload = b'[{"date": "2024-06-30", "revenue": 8.5e10, "eps": 1.4}]'
+        _, loads = decoding.get_decoder(name)
+        assert loads(payload) == json.loads(payload)
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Test that auto selection falls back when no fast backend exists."""
+
+        def missing(name):
+            if name != "json":
+                raise ImportError(name)
+            return json.loads
+
+        with patch.object(decoding, "_load_backend", side_effect=missing):
+            assert decoding.get_decoder()[0] == "json"
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            decoding.get_decoder("yaml")
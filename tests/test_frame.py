@@ -0,0 +1,103 @@
+"""Tests for columnar statement frames."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_mcp_server.frame import StatementFrame, fetch_statement_frame  # noqa: E402
+from fmp_mcp_server.models import IncomeStatement  # noqa: E402
+
+ROWS = [
+    {"date": "2024-12-31", "symbol": "AAPL", "revenue": 400.0, "netIncome": 100},
+    {"date": "2022-12-31", "symbol": "AAPL", "revenue": 300.0, "netIncome": None},
+    {"date": "2023-12-31", "symbol": "AAPL", "revenue": 350.0, "netIncome": 70},
+]
+
+
+class TestStatementFrame:
+    """Test statement frame construction and slicing."""
+
+    def test_from_rows_sorts_and_fills_nan(self):
+        """Test that rows become date-sorted float64 columns."""
+        frame = StatementFrame.from_rows(ROWS, period="annual")
+
+        assert frame.symbol == "AAPL"
+        assert frame.fields == ["revenue", "netIncome"]
+        assert str(frame.dates[0]) == "2022-12-31"
+        np.testing.assert_array_equal(frame["revenue"], [300.0, 350.0, 400.0])
+        assert np.isnan(frame["netIncome"][0])
+        assert frame["revenue"].flags.c_contiguous
+
+    def test_from_records(self):
+        """Test building a frame from typed records."""
+        records = IncomeStatement.from_rows(ROWS)
+        frame = StatementFrame.from_rows(records, fields=["revenue", "grossProfit"])
+        np.testing.assert_array_equal(frame["revenue"], [300.0, 350.0, 400.0])
+        assert np.isnan(frame["grossProfit"]).all()
+
+    def test_between_is_zero_copy(self):
+        """Test that period slicing returns views of the same buffer."""
+        frame = StatementFrame.from_rows(ROWS)
+        recent = frame.between("2023-01-01", "2024-12-31")
+
+        assert len(recent) == len(ROWS) - 1
+        assert np.shares_memory(recent["revenue"], frame["revenue"])
+        assert len(frame.tail(1)) == 1
+        assert len(frame.between(end="2022-12-31")) == 1
+
+    def test_vectorized_arithmetic_and_assign(self):
+        """Test deriving new line items with array operations."""
+        frame = StatementFrame.from_rows(ROWS)
+        frame = frame.assign(margin=frame["netIncome"] / frame["revenue"])
+        np.testing.assert_allclose(frame["margin"][1:], [0.2, 0.25])
+
+    def test_join_aligns_dates(self):
+        """Test joining frames of different statements on shared dates."""
+        income = StatementFrame.from_rows(ROWS)
+        balance = StatementFrame.from_rows(
+            [
+                {"date": "2023-12-31", "totalAssets": 1000},
+                {"date": "2024-12-31", "totalAssets": 1100},
+            ],
+        )
+        joined = income.join(balance)
+
+        assert len(joined) == len(balance)
+        np.testing.assert_array_equal(joined["totalAssets"], [1000, 1100])
+        np.testing.assert_array_equal(joined["revenue"], [350.0, 400.0])
+
+    def test_to_rows(self):
+        """Test converting back to FMP-style rows."""
+        rows = StatementFrame.from_rows(ROWS).to_rows()
+        assert rows[0] == {
+            "date": "2024-12-31",
+            "symbol": "AAPL",
+            "revenue": 400.0,
+            "netIncome": 100.0,
+        }
+        assert rows[-1]["netIncome"] is None
+
+    def test_missing_item(self):
+        """Test lookups of unknown line items."""
+        frame = StatementFrame.from_rows(ROWS)
+        with pytest.raises(KeyError, match="ebitda"):
+            frame["ebitda"]
+        assert np.isnan(frame.get("ebitda")).all()
+
+    @pytest.mark.asyncio
+    async def test_fetch_statement_frame(self):
+        """Test fetching and joining the three statements."""
+        client = AsyncMock()
+        client.get_income_statement.return_value = ROWS
+        client.get_balance_sheet.return_value = [
+            {"date": "2024-12-31", "totalAssets": 1100, "netIncome": -1},
+        ]
+        client.get_cash_flow.return_value = [{"date": "2024-12-31", "freeCashFlow": 90}]
+
+        frame = await fetch_statement_frame(client, "AAPL", "annual", 3)
+
+        client.get_cash_flow.assert_awaited_once_with("AAPL", "annual", 3)
+        assert frame.fields == ["revenue", "netIncome", "totalAssets", "freeCashFlow"]
+        assert frame["netIncome"][0] == ROWS[0]["netIncome"]
@@ -0,0 +1,130 @@
+"""Tests for Prometheus metrics."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from fmp_mcp_server import metrics
+from fmp_mcp_server.client import FMPClient
+from fmp_mcp_server.retry import RetryPolicy
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record metrics into a fresh registry."""
+    registry = prometheus_client.CollectorRegistry()
+    monkeypatch.setattr(metrics, "_metrics", metrics.Metrics(registry))
+    return registry
+
+
+def mock_client(handler) -> FMPClient:
+    """Build a client whose requests are answered by ``handler``."""
+    client = FMPClient(
+        api_key="test_key",
+        retry_policy=RetryPolicy(max_retries=1, base_delay=0, max_delay=0),
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestMetrics:
+    """Test metrics recording."""
+
+    def test_helpers_are_noops_while_disabled(self, monkeypatch):
+        """Test that recording without prometheus_client collectors is harmless."""
+        monkeypatch.setattr(metrics, "_metrics", None)
+
+        with metrics.track_tool("get_stock_quote"):
+            pass
+        with metrics.track_upstream("quote") as call:
+            call.status = 200
+        metrics.record_cache("quote", "hit")
+
+        assert not metrics.enabled()
+        assert call.elapsed >= 0
+
+    def test_track_tool_records_outcome(self, registry):
+        """Test that failed tool calls are labelled as errors."""
+        with metrics.track_tool("get_stock_quote"):
+            pass
+        with pytest.raises(RuntimeError), metrics.track_tool("get_stock_quote"):
+            raise RuntimeError("boom")
+
+        def count(outcome: str) -> float:
+            return registry.get_sample_value(
+                "fmp_tool_duration_seconds_count",
+                {"tool": "get_stock_quote", "outcome": outcome},
+            )
+
+        assert count("ok") == 1
+        assert count("error") == 1
+        assert registry.get_sample_value("fmp_tool_calls_in_progress") == 0
+
+    @pytest.mark.asyncio
+    async def test_client_records_upstream_and_cache(self, registry):
+        """Test that statuses, latency and cache outcomes are recorded."""
+        responses = [httpx.Response(503), httpx.Response(200, json=[{}])]
+        pending = iter(responses)
+        client = mock_client(lambda _request: next(pending))
+
+        await client._request("quote", {"symbol": "AAPL"})
+        await client._request("quote", {"symbol": "AAPL"})
+
+        def sample(name: str, **labels: str) -> float:
+            return registry.get_sample_value(name, {"endpoint": "quote", **labels})
+
+        assert sample("fmp_upstream_responses_total", status="503") == 1
+        assert sample("fmp_upstream_responses_total", status="200") == 1
+        assert sample("fmp_upstream_request_duration_seconds_count") == len(responses)
+        assert sample("fmp_cache_lookups_total", result="miss") == 1
+        assert sample("fmp_cache_lookups_total", result="hit") == 1
+        assert registry.get_sample_value("fmp_upstream_requests_in_progress") == 0
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_counted(self, registry):
+        """Test that connection failures are counted with status 'error'."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        client = mock_client(handler)
+        with pytest.raises(httpx.ConnectError):
+            await client._request("profile", {"symbol": "AAPL"})
+
+        assert (
+            registry.get_sample_value(
+                "fmp_upstream_responses_total",
+                {"endpoint": "profile", "status": "error"},
+            )
+            == 1 + client.retry_policy.max_retries
+        )
+
+    @pytest.mark.asyncio
+    async def test_server_records_tool_calls(self, registry, fake_client_class):
+        """Test that tool calls through the MCP server are timed."""
+        from fmp_mcp_server import server  # noqa: PLC0415
+
+        client = fake_client_class.return_value
+        client.get_quote = AsyncMock(return_value=[{"symbol": "AAPL"}])
+
+        await server.mcp.call_tool("get_stock_quote", {"symbol": "AAPL"})
+        with pytest.raises(Exception, match="Unknown tool"):
+            await server.mcp.call_tool("no_such_tool", {})
+
+        assert (
+            registry.get_sample_value(
+                "fmp_tool_duration_seconds_count",
+                {"tool": "get_stock_quote", "outcome": "ok"},
+            )
+            == 1
+        )
+        assert (
+            registry.get_sample_value(
+                "fmp_tool_duration_seconds_count",
+                {"tool": "unknown", "outcome": "error"},
+            )
+            == 1
+        )
@@ -0,0 +1,78 @@
+"""Tests for typed FMP records."""
+
+import json
+import sys
+
+import pytest
+
+from fmp_mcp_server import models
+from fmp_mcp_server.models import (
+    FinancialRatios,
+    IncomeStatement,
+    KeyMetrics,
+    Quote,
+    aliases,
+)
+
+ROW = {
+    "date": "2024-06-29",
+    "symbol": "AAPL",
+    "period": "Q3",
+    "revenue": 85777000000,
+    "netIncome": 21448000000,
+    "epsDiluted": 1.4,
+}
+
+
+class TestRecords:
+    """Test record decoding and the dict view."""
+
+    def test_from_dict_maps_camel_case(self):
+        """Test that FMP field names map to snake_case attributes."""
+        record = IncomeStatement.from_dict(ROW)
+        assert record.revenue == ROW["revenue"]
+        assert record.net_income == ROW["netIncome"]
+        assert record.eps_diluted == ROW["epsDiluted"]
+        assert record.gross_profit is None
+
+    def test_to_dict_round_trip(self):
+        """Test that the dict view uses FMP field names."""
+        view = IncomeStatement.from_dict(ROW).to_dict()
+        assert {k: view[k] for k in ROW} == ROW
+        assert "grossProfit" in view
+
+    def test_irregular_field_names(self):
+        """Test fields whose FMP names are not plain camelCase."""
+        assert aliases(KeyMetrics)["ev_to_ebitda"] == "evToEBITDA"
+        assert aliases(FinancialRatios)["net_income_per_ebt"] == "netIncomePerEBT"
+
+    def test_decode_from_bytes(self):
+        """Test decoding records straight from a response body."""
+        payload = json.dumps([{"symbol": "AAPL", "price": 227.5}]).encode()
+        assert Quote.decode(payload) == [Quote(symbol="AAPL", price=227.5)]
+
+    def test_decode_without_dicts_matches_dict_path(self):
+        """Test that decoding with msgspec gives the records built from dicts."""
+        pytest.importorskip("msgspec")
+        rows = [ROW, {**ROW, "date": "2024-03-30", "unknownField": [1]}]
+        payload = json.dumps(rows).encode()
+
+        assert models.row_decoder(IncomeStatement) is not None
+        assert IncomeStatement.decode(payload) == IncomeStatement.from_rows(rows)
+        assert KeyMetrics.decode(b'{"evToEBITDA": 21.5}') == [
+            KeyMetrics(ev_to_ebitda=21.5),
+        ]
+
+    def test_decode_falls_back_to_dicts(self, monkeypatch):
+        """Test decoding through dicts when msgspec is not installed."""
+        monkeypatch.setitem(models._ROW_DECODERS, Quote, None)
+        payload = json.dumps({"symbol": "AAPL", "price": 227.5}).encode()
+        assert Quote.decode(payload) == [Quote(symbol="AAPL", price=227.5)]
+
+    def test_records_are_slotted(self):
+        """Test that records carry no per-instance dict."""
+        record = IncomeStatement.from_dict(ROW)
+        assert not hasattr(record, "__dict__")
+        assert sys.getsizeof(record) < sys.getsizeof(ROW | record.to_dict())
+        with pytest.raises(AttributeError):
+            record.unknown = 1
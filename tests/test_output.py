@@ -0,0 +1,52 @@
+"""Tests for shaping tool results."""
+
+from fmp_mcp_server.output import mark_stale, project, shape, to_columnar
+
+ROWS = [
+    {"symbol": "AAPL", "date": "2024-12-31", "revenue": 1.0, "netIncome": 0.2},
+    {"symbol": "AAPL", "date": "2023-12-31", "revenue": 0.9},
+]
+
+
+def test_project_keeps_requested_and_id_fields():
+    """Test that projection keeps symbol and date and skips missing keys."""
+    assert project(ROWS, ["netIncome", "bogus"]) == [
+        {"symbol": "AAPL", "date": "2024-12-31", "netIncome": 0.2},
+        {"symbol": "AAPL", "date": "2023-12-31"},
+    ]
+    assert "netIncome" in ROWS[0]
+
+
+def test_project_without_fields_returns_rows():
+    """Test that no projection returns the rows unchanged."""
+    assert project(ROWS, None) is ROWS
+    assert project(ROWS, []) is ROWS
+
+
+def test_stale_marker_survives_projection():
+    """Test that stale rows are marked on copies and keep the marker."""
+    rows = [{"symbol": "AAPL", "price": 1.0, "volume": 10}]
+    stale = mark_stale(rows, 42.04)
+
+    assert project(stale, ["price"]) == [
+        {"symbol": "AAPL", "price": 1.0, "stale": True, "ageSeconds": 42.0},
+    ]
+    assert rows == [{"symbol": "AAPL", "price": 1.0, "volume": 10}]
+
+
+def test_to_columnar_names_each_key_once():
+    """Test the columnar layout with dates as the index."""
+    assert to_columnar(ROWS) == {
+        "columns": ["symbol", "revenue", "netIncome"],
+        "index": ["2024-12-31", "2023-12-31"],
+        "data": [["AAPL", 1.0, 0.2], ["AAPL", 0.9, None]],
+    }
+    assert to_columnar([]) == {"columns": [], "index": [], "data": []}
+
+
+def test_shape_projects_before_converting():
+    """Test that fields apply to the columnar layout."""
+    table = shape(ROWS, ["revenue"], "columnar")
+
+    assert table["columns"] == ["symbol", "revenue"]
+    assert shape(ROWS) is ROWS
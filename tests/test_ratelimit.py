@@ -0,0 +1,73 @@
+"""Tests for the rate limiter."""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from fmp_mcp_server.ratelimit import RateLimiter, RateLimitExceededError
+
+
+class FakeTime:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(0)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Test rate limiter behavior."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_smooth(self):
+        """Test that requests beyond the burst wait for refilled tokens."""
+        fake = FakeTime()
+        limiter = RateLimiter(60, burst=2, clock=fake, sleep=fake.sleep)
+
+        waits = [await limiter.acquire() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 1.0, 1.0]
+        stats = limiter.stats()
+        assert stats.acquired == len(waits)
+        assert stats.max_wait == 1.0
+        assert stats.average_wait == pytest.approx(sum(waits) / len(waits))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_queued(self):
+        """Test that parallel callers are spread out rather than rejected."""
+        fake = FakeTime()
+        limiter = RateLimiter(120, burst=1, clock=fake, sleep=fake.sleep)
+
+        waits = await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+        assert sorted(waits) == [0.0, 0.5, 1.0]
+        assert limiter.stats().queued == 0
+
+    @pytest.mark.asyncio
+    async def test_daily_limit(self):
+        """Test that the daily cap rejects requests until the next day."""
+        fake = FakeTime()
+        day = [date(2024, 1, 1)]
+        limiter = RateLimiter(
+            600,
+            burst=10,
+            daily_limit=2,
+            clock=fake,
+            sleep=fake.sleep,
+            today=lambda: day[0],
+        )
+        await limiter.acquire()
+        await limiter.acquire()
+        with pytest.raises(RateLimitExceededError, match="limit of 2"):
+            await limiter.acquire()
+
+        day[0] = date(2024, 1, 2)
+        await limiter.acquire()
+        assert limiter.stats().daily_used == 1
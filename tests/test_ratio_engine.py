@@ -0,0 +1,126 @@
+"""Tests for the local ratio engine."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_mcp_server.frame import StatementFrame  # noqa: E402
+from fmp_mcp_server.ratio_engine import (  # noqa: E402
+    compute_ratios,
+    fetch_local_ratios,
+    local_ratios,
+    stack_frames,
+)
+
+
+def make_frame(symbol, rows):
+    return StatementFrame.from_rows(
+        [{"symbol": symbol, **row} for row in rows],
+        period="annual",
+    )
+
+
+AAPL = make_frame(
+    "AAPL",
+    [
+        {
+            "date": "2023-12-31",
+            "revenue": 200.0,
+            "grossProfit": 80.0,
+            "netIncome": 40.0,
+            "totalStockholdersEquity": 0.0,
+            "freeCashFlow": 30.0,
+        },
+        {
+            "date": "2024-12-31",
+            "revenue": 250.0,
+            "grossProfit": 110.0,
+            "netIncome": 50.0,
+            "totalStockholdersEquity": 100.0,
+            "freeCashFlow": 45.0,
+        },
+    ],
+)
+MSFT = make_frame(
+    "MSFT",
+    [{"date": "2024-06-30", "revenue": 100.0, "grossProfit": 70.0, "netIncome": 30.0}],
+)
+
+
+class TestComputeRatios:
+    """Test vectorized ratio formulas."""
+
+    def test_margins(self):
+        """Test margins computed over a whole history at once."""
+        ratios = compute_ratios(stack_frames([AAPL]))
+
+        np.testing.assert_allclose(ratios["grossProfitMargin"][0], [0.4, 0.44])
+        np.testing.assert_allclose(ratios["netProfitMargin"][0], [0.2, 0.2])
+
+    def test_zero_division_and_missing_inputs_are_nan(self):
+        """Test that undefined ratios are NaN rather than inf or errors."""
+        ratios = compute_ratios(stack_frames([AAPL]), "key-metrics")
+
+        assert np.isnan(ratios["returnOnEquity"][0, 0])
+        assert ratios["returnOnEquity"][0, 1] == pytest.approx(0.5)
+        assert np.isnan(ratios["returnOnAssets"]).all()
+        assert "earningsYield" not in ratios
+
+
+class TestLocalRatios:
+    """Test multi-symbol ratio rows."""
+
+    def test_aligns_symbols_on_latest_period(self):
+        """Test that histories of different lengths are right-aligned."""
+        items = stack_frames([AAPL, MSFT])
+        assert items["revenue"].shape == (2, 2)
+        assert np.isnan(items["revenue"][1, 0])
+
+        results = local_ratios([AAPL, MSFT])
+
+        assert [row["date"] for row in results["AAPL"]] == [
+            "2024-12-31",
+            "2023-12-31",
+        ]
+        assert len(results["MSFT"]) == 1
+        assert results["MSFT"][0]["grossProfitMargin"] == pytest.approx(0.7)
+        assert results["MSFT"][0]["currentRatio"] is None
+
+    def test_market_metrics_only_for_latest_period(self):
+        """Test that yields use the current market cap on the newest row."""
+        market_cap = 1000.0
+        results = local_ratios([AAPL], "key-metrics", {"AAPL": market_cap})
+        latest, previous = results["AAPL"]
+
+        assert latest["marketCap"] == market_cap
+        assert latest["earningsYield"] == pytest.approx(0.05)
+        assert latest["freeCashFlowYield"] == pytest.approx(0.045)
+        assert previous["earningsYield"] is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_local_ratios_uses_statements_and_quotes(self):
+        """Test fetching inputs through the client for several symbols."""
+        client = AsyncMock()
+        client.get_income_statement.side_effect = lambda s, _period, _limit: [
+            {"date": "2024-12-31", "symbol": s, "revenue": 100.0, "netIncome": 10.0},
+        ]
+        client.get_balance_sheet.return_value = [{"date": "2024-12-31"}]
+        client.get_cash_flow.return_value = [{"date": "2024-12-31"}]
+        client.get_quotes.return_value = [
+            {"symbol": "AAPL", "marketCap": 200.0},
+            {"symbol": "MSFT", "marketCap": None},
+        ]
+
+        results = await fetch_local_ratios(
+            client,
+            ["aapl", "msft"],
+            "key-metrics",
+            "annual",
+            1,
+        )
+
+        client.get_quotes.assert_awaited_once_with(["aapl", "msft"])
+        assert results["AAPL"][0]["earningsYield"] == pytest.approx(0.05)
+        assert results["MSFT"][0]["earningsYield"] is None
@@ -0,0 +1,61 @@
+"""Tests for the retry policy."""
+
+import random
+
+import httpx
+import pytest
+
+from fmp_mcp_server.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def status_error(status: int, headers: dict[str, str] | None = None):
+    """Build an HTTPStatusError for the given status."""
+    request = httpx.Request("GET", "https://example.com/quote")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetryPolicy:
+    """Test retry decisions."""
+
+    def test_parse_retry_after(self):
+        """Test parsing Retry-After headers."""
+        assert parse_retry_after("7") == pytest.approx(7.0)
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_backoff_is_capped_with_full_jitter(self):
+        """Test that backoff delays stay within the capped ceiling."""
+        max_delay = 4.0
+        policy = RetryPolicy(base_delay=1.0, max_delay=max_delay, rng=random.Random(0))
+        delays = [policy.backoff(attempt) for attempt in range(10) for _ in range(20)]
+        assert all(0 <= d <= max_delay for d in delays)
+        assert max(delays[:20]) <= 1.0
+
+    def test_retryable_errors(self):
+        """Test which failures are retried."""
+        policy = RetryPolicy(max_retries=2)
+        assert policy.retry_delay(status_error(503), 0) is not None
+        assert policy.retry_delay(httpx.ConnectError("reset"), 0) is not None
+        assert policy.retry_delay(status_error(404), 0) is None
+        assert policy.retry_delay(status_error(503), 2) is None
+        assert policy.retry_delay(ValueError("bad"), 0) is None
+
+    def test_honors_retry_after(self):
+        """Test that Retry-After overrides backoff unless it is too long."""
+        policy = RetryPolicy(max_retry_after=30.0)
+        retry_after = status_error(429, {"Retry-After": "3"})
+        assert policy.retry_delay(retry_after, 0) == pytest.approx(3.0)
+        assert policy.retry_delay(status_error(429, {"Retry-After": "120"}), 0) is None
+
+    def test_budget_limits_retries(self):
+        """Test that an exhausted budget stops retries."""
+        budget = RetryBudget(ratio=0.5, reserve=1.0)
+        policy = RetryPolicy(budget=budget)
+        assert policy.retry_delay(status_error(503), 0) is not None
+        assert policy.retry_delay(status_error(503), 0) is None
+
+        budget.record_request()
+        budget.record_request()
+        assert budget.balance == 1.0
@@ -0,0 +1,145 @@
+"""Tests for FMP MCP server."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fmp_mcp_server import server
+
+
+class TestClientLifecycle:
+    """Test creation and shutdown of the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_client_creates_one_client(self, fake_client_class):
+        """Test that a burst of first calls shares a single client."""
+        clients = await asyncio.gather(*(server.get_client() for _ in range(10)))
+        await asyncio.sleep(0)
+
+        fake_client_class.assert_called_once()
+        fake_client_class.return_value.warmup.assert_awaited_once()
+        assert all(c is clients[0] for c in clients)
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_after_last_session(self, fake_client_class):
+        """Test that the client is closed only when the last session ends."""
+        client = fake_client_class.return_value
+        async with server.client_lifespan(server.mcp):
+            async with server.client_lifespan(server.mcp):
+                pass
+            client.close.assert_not_awaited()
+            assert server.fmp_client is client
+
+        client.close.assert_awaited_once()
+        assert server.fmp_client is None
+
+
+class TestLocalRatios:
+    """Test tools that compute ratios locally."""
+
+    @pytest.mark.asyncio
+    async def test_financial_ratios_local_source(self, fake_client_class):
+        """Test that source='local' derives ratios from the statements."""
+        pytest.importorskip("numpy")
+        client = fake_client_class.return_value
+        client.get_income_statement = AsyncMock(
+            return_value=[
+                {"date": "2024-12-31", "symbol": "AAPL", "revenue": 10.0},
+            ],
+        )
+        client.get_balance_sheet = AsyncMock(return_value=[{"date": "2024-12-31"}])
+        client.get_cash_flow = AsyncMock(return_value=[{"date": "2024-12-31"}])
+        client.get_financial_ratios = AsyncMock()
+
+        rows = await server.get_financial_ratios("AAPL", source="local")
+
+        client.get_financial_ratios.assert_not_awaited()
+        assert rows[0]["symbol"] == "AAPL"
+        assert rows[0]["date"] == "2024-12-31"
+
+
+@pytest.mark.asyncio
+async def test_fundamentals_bulk_reports_progress(fake_client_class):
+    """Test that the bulk tool sends a progress notification per symbol."""
+    client = fake_client_class.return_value
+    client.get_company_profile = AsyncMock(return_value=[{"symbol": "AAPL"}])
+    client.get_key_metrics = AsyncMock(return_value=[])
+    client.get_income_statement = AsyncMock(return_value=[])
+    ctx = AsyncMock()
+
+    results = await server.get_fundamentals_bulk(["AAPL", "MSFT"], ctx)
+
+    assert set(results) == {"AAPL", "MSFT"}
+    assert results["AAPL"] == {"profile": {}, "key_metrics": [], "income": []}
+    ctx.report_progress.assert_awaited_with(2, 2, "Fetched MSFT")
+
+
+class TestFieldProjection:
+    """Test the fields argument of tools."""
+
+    @pytest.mark.asyncio
+    async def test_projects_tool_rows(self, fake_client_class):
+        """Test that tools return only the requested fields."""
+        client = fake_client_class.return_value
+        client.get_financial_ratios = AsyncMock(
+            return_value=[
+                {"symbol": "AAPL", "date": "2024-12-31", "currentRatio": 1.0, "x": 2},
+            ],
+        )
+
+        rows = await server.get_financial_ratios("AAPL", fields=["currentRatio"])
+
+        assert rows == [{"symbol": "AAPL", "date": "2024-12-31", "currentRatio": 1.0}]
+
+    @pytest.mark.asyncio
+    async def test_every_tool_accepts_fields(self):
+        """Test that the fields argument is in every tool's schema."""
+        tools = await server.mcp.list_tools()
+
+        assert tools
+        for tool in tools:
+            assert "fields" in tool.inputSchema["properties"], tool.name
+
+    @pytest.mark.asyncio
+    async def test_simulate_dcf_schema_bounds(self):
+        """Test that the DCF tool schema bounds the work and rejects negative stds."""
+        dcf = pytest.importorskip("fmp_mcp_server.dcf")
+        tools = {tool.name: tool for tool in await server.mcp.list_tools()}
+        properties = tools["simulate_dcf"].inputSchema["properties"]
+
+        assert properties["symbols"]["minItems"] == 1
+        assert properties["symbols"]["maxItems"] == dcf.MAX_SYMBOLS
+        assert properties["simulations"]["maximum"] == dcf.MAX_SIMULATIONS
+        assert properties["years"]["minimum"] == 1
+        assert properties["years"]["maximum"] == dcf.MAX_YEARS
+        assert properties["wacc_std"]["minimum"] == 0
+        assert {"minimum": 0, "type": "number"} in properties["growth_std"]["anyOf"]
+
+
+@pytest.mark.asyncio
+async def test_columnar_format(fake_client_class):
+    """Test that time-series tools can return a columnar table."""
+    client = fake_client_class.return_value
+    client.get_income_statement = AsyncMock(
+        return_value=[
+            {"symbol": "AAPL", "date": "2024-12-31", "revenue": 2.0},
+            {"symbol": "AAPL", "date": "2023-12-31", "revenue": 1.0},
+        ],
+    )
+
+    _, structured = await server.mcp.call_tool(
+        "get_financial_statements",
+        {
+            "symbol": "AAPL",
+            "statement_type": "income",
+            "fields": ["revenue"],
+            "format": "columnar",
+        },
+    )
+
+    assert structured["result"] == {
+        "columns": ["symbol", "revenue"],
+        "index": ["2024-12-31", "2023-12-31"],
+        "data": [["AAPL", 2.0], ["AAPL", 1.0]],
+    }
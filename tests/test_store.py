@@ -0,0 +1,80 @@
+"""Tests for the persistent statement store."""
+
+from datetime import datetime, timezone
+
+from fmp_mcp_server.cache import DAY
+from fmp_mcp_server.store import StatementStore, freshness_deadline, merge_periods
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp()
+
+
+class TestFreshness:
+    """Test the period-aware freshness policy."""
+
+    def test_fresh_until_next_report_is_due(self):
+        """Test that recent quarters stay fresh until the next filing."""
+        data = [{"date": "2024-01-31"}, {"date": "2023-10-31"}]
+        deadline = freshness_deadline("quarter", data, NOW)
+        expected = datetime(2024, 1, 31, tzinfo=timezone.utc).timestamp()
+        assert deadline == expected + (91 + 45) * DAY
+
+    def test_overdue_report_is_rechecked_daily(self):
+        """Test that an overdue filing shortens freshness to one day."""
+        data = [{"date": "2022-12-31"}]
+        assert freshness_deadline("annual", data, NOW) == NOW + DAY
+        assert freshness_deadline("annual", [], NOW) == NOW + DAY
+
+    def test_freshness_is_capped(self):
+        """Test that freshness never exceeds thirty days."""
+        data = [{"date": "2024-05-31"}]
+        assert freshness_deadline("annual", data, NOW) == NOW + 30 * DAY
+
+
+class TestStatementStore:
+    """Test statement store persistence."""
+
+    def test_round_trip_survives_reopen(self, tmp_path):
+        """Test that stored histories are loaded after reopening."""
+        path = tmp_path / "cache.db"
+        rows = [{"date": "2024-05-31", "revenue": 1.5}]
+
+        store = StatementStore(path, clock=lambda: NOW)
+        store.save("income-statement", "aapl", "annual", rows, 1, complete=True)
+        store.close()
+
+        reopened = StatementStore(path, clock=lambda: NOW)
+        history = reopened.load("income-statement", "AAPL", "annual")
+        assert history is not None
+        assert history.rows == rows
+        assert history.complete
+        assert history.expires_at == NOW + 30 * DAY
+        assert reopened.load("income-statement", "AAPL", "quarter") is None
+        reopened.close()
+
+    def test_covers(self, tmp_path):
+        """Test whether a history can answer a request of a given depth."""
+        store = StatementStore(tmp_path / "cache.db", clock=lambda: NOW)
+        rows = [{"date": f"202{i}-12-31"} for i in range(3)]
+        partial = store.save("ratios", "AAPL", "annual", rows, 3, complete=False)
+        complete = store.save("ratios", "MSFT", "annual", rows, 3, complete=True)
+
+        assert partial.covers(3)
+        assert not partial.covers(5)
+        assert complete.covers(40)
+        store.close()
+
+    def test_merge_periods_prefers_newer_rows(self):
+        """Test that merged rows are sorted and restatements win."""
+        older = [{"date": "2023-12-31", "v": 1}, {"date": "2022-12-31", "v": 1}]
+        newer = [{"date": "2024-12-31", "v": 2}, {"date": "2023-12-31", "v": 2}]
+        merged = merge_periods(older, newer)
+        assert [(r["date"], r["v"]) for r in merged] == [
+            ("2024-12-31", 2),
+            ("2023-12-31", 2),
+            ("2022-12-31", 1),
+        ]
+
+    def test_handles_statement_endpoints_only(self):
+        """Test which endpoints are persisted."""
+        assert StatementStore.handles("income-statement")
+        assert not StatementStore.handles("quote")
@@ -0,0 +1,128 @@
+"""Tests for OpenTelemetry tracing."""
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from fmp_mcp_server import tracing
+from fmp_mcp_server.client import FMPClient
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    """Record spans in memory."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "_tracer", provider.get_tracer(__name__))
+    return exporter
+
+
+def by_name(exporter: InMemorySpanExporter) -> dict:
+    """Finished spans keyed by name, the last one winning."""
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+class TestTracing:
+    """Test tracing of tools and upstream requests."""
+
+    @pytest.mark.asyncio
+    async def test_helpers_are_noops_while_disabled(self, monkeypatch):
+        """Test that spans and hooks cost nothing without a tracer."""
+        monkeypatch.setattr(tracing, "_tracer", None)
+        request = httpx.Request("GET", "https://example.com")
+
+        with tracing.span("fmp quote", {"fmp.symbol": "AAPL"}) as current:
+            current.set_attribute("fmp.cache", "hit")
+        await tracing.trace_connection(request)
+
+        assert not tracing.enabled()
+        assert "trace" not in request.extensions
+
+    def test_unknown_exporter_rejected(self, monkeypatch):
+        """Test that only the OTLP and file exporters are accepted."""
+        monkeypatch.setattr(tracing, "_tracer", None)
+        with pytest.raises(ValueError, match="Unknown trace exporter"):
+            tracing.enable("zipkin")
+
+    @pytest.mark.asyncio
+    async def test_request_spans(self, spans):
+        """Test spans from the request down to the HTTP attempt and decode."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                httpx.codes.OK,
+                json=[{"symbol": "AAPL", "price": 1.0}],
+            )
+
+        client = FMPClient(api_key="test_key")
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client._request("quote", {"symbol": "AAPL"})
+        found = by_name(spans)
+        request, attempt, decode = found["fmp quote"], found["GET"], found["decode"]
+
+        assert request.attributes["fmp.symbol"] == "AAPL"
+        assert request.attributes["fmp.cache"] == "miss"
+        assert attempt.parent.span_id == request.context.span_id
+        assert attempt.attributes["http.response.status_code"] == httpx.codes.OK
+        assert attempt.attributes["http.response.body.size"] > 0
+        assert decode.attributes["fmp.json_backend"] == client.json_backend
+        assert "apikey" not in json.dumps(dict(attempt.attributes))
+
+        spans.clear()
+        await client._request("quote", {"symbol": "AAPL"})
+        assert [s.name for s in spans.get_finished_spans()] == ["fmp quote"]
+        assert spans.get_finished_spans()[0].attributes["fmp.cache"] == "hit"
+
+    @pytest.mark.asyncio
+    async def test_connection_events_added_to_current_span(self, spans):
+        """Test that httpx trace events are recorded on the current span."""
+        request = httpx.Request("GET", "https://example.com")
+
+        with tracing.span("GET"):
+            await tracing.trace_connection(request)
+            await request.extensions["trace"]("connection.connect_tcp.started", {})
+
+        (span,) = spans.get_finished_spans()
+        assert [event.name for event in span.events] == [
+            "connection.connect_tcp.started",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tool_span(self, spans, fake_client_class):
+        """Test that tool calls get a root span with the symbol."""
+        from fmp_mcp_server import server  # noqa: PLC0415
+
+        client = fake_client_class.return_value
+        client.get_quote = AsyncMock(return_value=[{"symbol": "AAPL"}])
+
+        await server.mcp.call_tool("get_stock_quote", {"symbol": "AAPL"})
+
+        span = by_name(spans)["tools/call get_stock_quote"]
+        assert span.attributes["mcp.tool.name"] == "get_stock_quote"
+        assert span.attributes["fmp.symbol"] == "AAPL"
+
+    def test_file_exporter_writes_json_lines(self, monkeypatch, tmp_path):
+        """Test that the file exporter appends one JSON span per line."""
+        monkeypatch.setattr(tracing, "_tracer", None)
+        path = tmp_path / "traces.jsonl"
+
+        assert tracing.enable("file", str(path))
+        with tracing.span("fmp quote", {"fmp.symbol": "AAPL"}):
+            pass
+        trace.get_tracer_provider().force_flush()
+
+        (line,) = path.read_text().splitlines()
+        assert json.loads(line)["name"] == "fmp quote"
@@ -0,0 +1,144 @@
+"""Tests for trailing-twelve-month aggregation."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_mcp_server.frame import StatementFrame  # noqa: E402
+from fmp_mcp_server.ttm import (  # noqa: E402
+    TTM_FIELDS,
+    WINDOW,
+    TTMEngine,
+    fetch_ttm,
+    trailing_twelve_months,
+)
+
+QUARTER_ENDS = [
+    "2023-03-31",
+    "2023-06-30",
+    "2023-09-30",
+    "2023-12-31",
+    "2024-03-31",
+    "2024-06-30",
+    "2024-09-30",
+    "2024-12-31",
+]
+
+
+def quarter_rows(dates, start=1.0):
+    return [
+        {
+            "date": date,
+            "symbol": "AAPL",
+            "revenue": start + i,
+            "weightedAverageShsOut": 10.0 * (start + i),
+            "totalAssets": 100.0 * (start + i),
+            "cashAtBeginningOfPeriod": 1000.0 + start + i,
+            "cashAtEndOfPeriod": 1001.0 + start + i,
+        }
+        for i, date in enumerate(dates)
+    ]
+
+
+def quarters(dates, start=1.0):
+    return StatementFrame.from_rows(quarter_rows(dates, start), TTM_FIELDS, "quarter")
+
+
+def window_count(dates):
+    return len(dates) - WINDOW + 1
+
+
+class TestTrailingTwelveMonths:
+    """Test vectorized TTM windows."""
+
+    def test_flow_sums_and_point_in_time_values(self):
+        """Test each kind of line item over rolling four-quarter windows."""
+        ttm = trailing_twelve_months(quarters(QUARTER_ENDS[:6]))
+
+        assert [str(d) for d in ttm.dates] == QUARTER_ENDS[3:6]
+        np.testing.assert_array_equal(ttm["revenue"], [10.0, 14.0, 18.0])
+        np.testing.assert_array_equal(ttm["weightedAverageShsOut"], [25.0, 35.0, 45.0])
+        np.testing.assert_array_equal(ttm["totalAssets"], [400.0, 500.0, 600.0])
+        np.testing.assert_array_equal(
+            ttm["cashAtBeginningOfPeriod"],
+            [1001, 1002, 1003],
+        )
+        np.testing.assert_array_equal(ttm["cashAtEndOfPeriod"], [1005, 1006, 1007])
+        assert np.isnan(ttm["netIncome"]).all()
+        assert ttm.period == "TTM"
+
+    def test_missing_quarter_blanks_window(self):
+        """Test that windows spanning a gap in the history are NaN."""
+        dates = QUARTER_ENDS[:1] + QUARTER_ENDS[2:7]
+        ttm = trailing_twelve_months(quarters(dates))
+
+        assert np.isnan(ttm["revenue"][0])
+        assert not np.isnan(ttm["revenue"][1])
+
+    def test_short_history_has_no_windows(self):
+        """Test that fewer than four quarters give an empty frame."""
+        assert len(trailing_twelve_months(quarters(QUARTER_ENDS[:3]))) == 0
+
+    def test_requires_ttm_layout(self):
+        """Test that frames with other line items are rejected."""
+        with pytest.raises(ValueError, match="TTM_FIELDS"):
+            trailing_twelve_months(StatementFrame.from_rows(quarter_rows(QUARTER_ENDS)))
+
+
+class TestTTMEngine:
+    """Test incremental TTM updates."""
+
+    def test_new_quarter_computes_one_window(self):
+        """Test that a newly reported quarter only adds its own window."""
+        engine = TTMEngine()
+        engine.update(quarters(QUARTER_ENDS[:7]))
+        assert engine.windows_computed == window_count(QUARTER_ENDS[:7])
+
+        # Same depth, so the oldest quarter drops out as the new one arrives
+        updated = engine.update(quarters(QUARTER_ENDS[1:8], start=2.0))
+
+        assert engine.windows_computed == window_count(QUARTER_ENDS[:7]) + 1
+        expected = trailing_twelve_months(quarters(QUARTER_ENDS[1:8], start=2.0))
+        np.testing.assert_array_equal(updated.dates, expected.dates)
+        np.testing.assert_array_equal(updated.values, expected.values)
+
+    def test_restated_quarter_recomputes(self):
+        """Test that changed figures invalidate the previous windows."""
+        engine = TTMEngine()
+        engine.update(quarters(QUARTER_ENDS))
+        restated = quarters(QUARTER_ENDS, start=5.0)
+
+        updated = engine.update(restated)
+
+        assert engine.windows_computed == 2 * window_count(QUARTER_ENDS)
+        np.testing.assert_array_equal(updated["revenue"][-1], 9 + 10 + 11 + 12)
+
+    def test_evicts_least_recently_used_symbol(self):
+        """Test that the engine keeps at most max_symbols histories."""
+        engine = TTMEngine(max_symbols=1)
+        engine.update(quarters(QUARTER_ENDS))
+        other = quarters(QUARTER_ENDS)
+        other.symbol = "MSFT"
+        engine.update(other)
+        engine.update(quarters(QUARTER_ENDS))
+
+        assert engine.windows_computed == 3 * window_count(QUARTER_ENDS)
+
+
+@pytest.mark.asyncio
+async def test_fetch_ttm_returns_latest_periods():
+    """Test TTM rows built from the client's quarterly statements."""
+    client = AsyncMock()
+    client.get_income_statement.return_value = quarter_rows(QUARTER_ENDS)
+    client.get_balance_sheet.return_value = quarter_rows(QUARTER_ENDS)
+    client.get_cash_flow.return_value = quarter_rows(QUARTER_ENDS)
+
+    rows = await fetch_ttm(client, TTMEngine(), "aapl", limit=2)
+
+    client.get_income_statement.assert_awaited_once_with("aapl", "quarter", 5)
+    assert [row["date"] for row in rows] == ["2024-12-31", "2024-09-30"]
+    assert rows[0]["revenue"] == 5.0 + 6 + 7 + 8
+    assert rows[0]["period"] == "TTM"
+    assert rows[0]["symbol"] == "AAPL"